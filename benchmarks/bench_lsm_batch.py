@@ -0,0 +1,50 @@
+import time
+
+import numpy as np
+
+from mcop.simulate_paths import simulate_gbm_paths
+from mcop.american_lsm import american_option_lsm, american_option_lsm_batch
+
+try:
+    from mcop.american_lsm_cpp import american_option_lsm_cpp, american_option_lsm_cpp_batch
+except ImportError:
+    american_option_lsm_cpp = None
+
+
+def main():
+    S0, r, q, sigma, T = 100.0, 0.05, 0.0, 0.2, 1.0
+    n_steps = 100
+    n_paths = 100_000
+    strikes = np.linspace(80.0, 120.0, 50)
+    calls = strikes > S0
+
+    paths = simulate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, q=q, seed=123,
+                               antithetic=True, layout="time_major")
+
+    t0 = time.perf_counter()
+    single = american_option_lsm(paths, S0, r, T, is_call=False, q=q)
+    t1 = time.perf_counter()
+    loop = [american_option_lsm(paths, K, r, T, is_call=c, q=q) for K, c in zip(strikes, calls)]
+    t2 = time.perf_counter()
+    batch = american_option_lsm_batch(paths, strikes, r, T, calls, q=q)
+    t3 = time.perf_counter()
+
+    print(f"Python single ATM strike: {t1 - t0:.3f}s")
+    print(f"Python loop, {strikes.size} strikes: {t2 - t1:.3f}s")
+    print(f"Python batch, {strikes.size} strikes: {t3 - t2:.3f}s "
+          f"({(t3 - t2) / (t1 - t0):.1f}x single, max |diff| vs loop {np.max(np.abs(batch - loop)):.2e})")
+
+    if american_option_lsm_cpp is not None:
+        t0 = time.perf_counter()
+        american_option_lsm_cpp(paths, S0, r, T, is_call=False)
+        t1 = time.perf_counter()
+        cpp_batch, _ = american_option_lsm_cpp_batch(paths, strikes, r, T, calls)
+        t2 = time.perf_counter()
+        print(f"C++ single ATM strike: {t1 - t0:.3f}s")
+        print(f"C++ batch, {strikes.size} strikes: {t2 - t1:.3f}s "
+              f"({(t2 - t1) / (t1 - t0):.1f}x single, max |diff| vs Python batch "
+              f"{np.max(np.abs(cpp_batch - batch)):.2e})")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,21 +8,27 @@ def main():
     n_steps = 100
     n_paths = 200_000
 
-    paths = simulate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, q=q, seed=123, antithetic=True)
+    results = {}
+    for layout in ("path_major", "time_major"):
+        paths = simulate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, q=q, seed=123,
+                                   antithetic=True, layout=layout)
 
-    t0 = time.perf_counter()
-    py = american_option_lsm(paths, K, r, T, is_call=False, degree=3, q=q)
-    t1 = time.perf_counter()
+        t0 = time.perf_counter()
+        py = american_option_lsm(paths, K, r, T, is_call=False, degree=3, q=q)
+        t1 = time.perf_counter()
 
-    t2 = time.perf_counter()
-    cpp = american_option_lsm_cpp(paths, K, r, T, is_call=False, degree=3)
-    t3 = time.perf_counter()
+        t2 = time.perf_counter()
+        cpp = american_option_lsm_cpp(paths, K, r, T, is_call=False, degree=3)
+        t3 = time.perf_counter()
 
-    py_s = t1 - t0
-    cpp_s = t3 - t2
-    print(f"Python LSM: {py:.6f} in {py_s:.3f}s")
-    print(f"C++    LSM: {cpp:.6f} in {cpp_s:.3f}s")
-    print(f"Speedup: {py_s / cpp_s:.2f}x")
+        results[layout] = (t1 - t0, t3 - t2)
+        print(f"[{layout}]")
+        print(f"Python LSM: {py:.6f} in {t1 - t0:.3f}s")
+        print(f"C++    LSM: {cpp:.6f} in {t3 - t2:.3f}s")
+        print(f"Speedup: {(t1 - t0) / (t3 - t2):.2f}x")
+
+    (py_pm, cpp_pm), (py_tm, cpp_tm) = results["path_major"], results["time_major"]
+    print(f"\nTime-major vs path-major: Python {py_pm / py_tm:.2f}x, C++ {cpp_pm / cpp_tm:.2f}x")
 
 if __name__ == "__main__":
     main()
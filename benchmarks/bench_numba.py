@@ -0,0 +1,78 @@
+import csv
+import time
+from pathlib import Path
+
+import numpy as np
+
+from mcop.american_lsm import american_option_lsm
+from mcop.binomial_tree import american_option_crr_batch
+from mcop.simulate_paths import simulate_gbm_paths
+
+from mcop.american_lsm_numba import american_option_lsm_numba
+from mcop.binomial_tree_numba import american_option_crr_numba_batch
+
+try:
+    from mcop.american_lsm_cpp import american_option_lsm_cpp
+    from mcop.binomial_tree_cpp import american_option_crr_cpp_batch
+except ImportError:
+    american_option_lsm_cpp = None
+
+OUT = Path("artifacts/bench_numba.csv")
+
+
+def _best(fn, repeats=3):
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        value = fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), value
+
+
+def main():
+    S0, K, r, sigma, T = 100.0, 100.0, 0.05, 0.2, 1.0
+    rows = []
+
+    # the first call per dtype / layout compiles, or loads numba's on-disk cache
+    small = simulate_gbm_paths(S0, r, sigma, T, 10, 1_000, seed=1, layout="time_major")
+    t0 = time.perf_counter()
+    american_option_lsm_numba(small, K, r, T, is_call=False)
+    american_option_crr_numba_batch(S0, [K], r, sigma, T, 10, False)
+    print(f"numba first calls (compile / cache load): {time.perf_counter() - t0:.2f}s")
+
+    for n_paths in (50_000, 200_000):
+        paths = simulate_gbm_paths(S0, r, sigma, T, 100, n_paths, seed=123, antithetic=True,
+                                   layout="time_major")
+        engines = {"python": lambda: american_option_lsm(paths, K, r, T, is_call=False),
+                   "numba": lambda: american_option_lsm_numba(paths, K, r, T, is_call=False)}
+        if american_option_lsm_cpp is not None:
+            engines["cpp"] = lambda: american_option_lsm_cpp(paths, K, r, T, is_call=False)
+        for name, fn in engines.items():
+            sec, price = _best(fn)
+            rows.append({"case": "lsm", "engine": name, "size": n_paths, "seconds": sec,
+                         "price": price})
+            print(f"LSM  {name:<6} paths={n_paths:<7} {sec:.3f}s  price {price:.6f}")
+
+    strikes = np.linspace(80.0, 120.0, 9)
+    for n_steps in (2_000, 5_000):
+        args = (S0, strikes, r, sigma, T, n_steps, False)
+        engines = {"python": lambda: american_option_crr_batch(*args),
+                   "numba": lambda: american_option_crr_numba_batch(*args)}
+        if american_option_lsm_cpp is not None:
+            engines["cpp"] = lambda: american_option_crr_cpp_batch(*args)
+        for name, fn in engines.items():
+            sec, prices = _best(fn)
+            rows.append({"case": "crr", "engine": name, "size": n_steps, "seconds": sec,
+                         "price": float(prices[4])})
+            print(f"CRR  {name:<6} steps={n_steps:<7} {sec:.3f}s  ATM price {prices[4]:.6f}")
+
+    OUT.parent.mkdir(parents=True, exist_ok=True)
+    with OUT.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"\nSaved: {OUT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import csv
+from pathlib import Path
+
+from mcop.simulate_paths import simulate_gbm_paths
+from mcop.payoffs import european_call
+from mcop.pricing import mc_price
+
+OUT = Path("artifacts/bench_qmc.csv")
+
+S0, K, r, sigma, T = 100.0, 100.0, 0.05, 0.2, 1.0
+N_STEPS = 16
+N_REP = 16
+TARGET_SE = 0.02
+
+
+def se_plain(n, seed):
+    paths = simulate_gbm_paths(S0, r, sigma, T, N_STEPS, n, seed=seed)
+    return mc_price(european_call(paths, K), r, T)[:2]
+
+
+def se_antithetic(n, seed):
+    # rows [0, n/2) and [n/2, n) are mirror pairs: average them for a valid SE
+    paths = simulate_gbm_paths(S0, r, sigma, T, N_STEPS, n, seed=seed, antithetic=True)
+    x = european_call(paths, K)
+    half = n // 2
+    return mc_price(0.5 * (x[:half] + x[half:]), r, T)[:2]
+
+
+def se_sobol(n, seed):
+    paths = simulate_gbm_paths(S0, r, sigma, T, N_STEPS, n, seed=seed,
+                               sampler="sobol", replications=N_REP)
+    return mc_price(european_call(paths, K), r, T, replications=N_REP)[:2]
+
+
+def main():
+    methods = {"plain": se_plain, "antithetic": se_antithetic, "sobol+bridge": se_sobol}
+    sizes = [2**k for k in range(10, 21)]
+
+    rows = []
+    needed = {}
+    for name, fn in methods.items():
+        for n in sizes:
+            price, se = fn(n, seed=42)
+            rows.append({"method": name, "n_paths": n, "price": price, "se": se})
+            if se <= TARGET_SE and name not in needed:
+                needed[name] = n
+
+    print(f"European call, {N_STEPS} steps, SE by path count:")
+    print(f"{'n_paths':>9} " + " ".join(f"{m:>13}" for m in methods))
+    for n in sizes:
+        ses = [row["se"] for row in rows if row["n_paths"] == n]
+        print(f"{n:>9} " + " ".join(f"{se:>13.2e}" for se in ses))
+
+    print(f"\nPaths needed for SE <= {TARGET_SE}:")
+    for name in methods:
+        n = needed.get(name)
+        if n is None:
+            # extrapolate from the largest run with SE ~ N^-1/2
+            se_last = rows[[row["method"] for row in rows].index(name) + len(sizes) - 1]["se"]
+            n = f"~{int(sizes[-1] * (se_last / TARGET_SE) ** 2)} (extrapolated)"
+        print(f"  {name:<13} {n}")
+
+    OUT.parent.mkdir(parents=True, exist_ok=True)
+    with OUT.open("w", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        w.writeheader()
+        w.writerows(rows)
+    print(f"\nSaved: {OUT}")
+
+
+if __name__ == "__main__":
+    main()
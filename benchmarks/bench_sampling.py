@@ -0,0 +1,77 @@
+import csv
+import time
+from pathlib import Path
+
+import numpy as np
+
+from mcop.simulate_paths import simulate_gbm_paths
+from mcop.payoffs import european_call
+from mcop.american_lsm import american_option_lsm
+from mcop.variance_reduction import mc_mean_se
+
+OUT = Path("artifacts/bench_sampling.csv")
+
+S0, K, r, sigma, T = 100.0, 100.0, 0.05, 0.2, 1.0
+N_STEPS = 50
+N_PATHS = 2**16
+N_GROUPS = 64  # strata for "stratified", replications for "lhs" / "sobol"
+TARGET_SE = 0.01
+
+SAMPLERS = {
+    "antithetic": dict(antithetic=True),
+    "stratified": dict(sampler="stratified", strata=N_GROUPS),
+    "lhs": dict(sampler="lhs", replications=N_GROUPS),
+    "sobol": dict(sampler="sobol", replications=N_GROUPS),
+}
+
+
+def mean_se(x, name):
+    if name == "antithetic":
+        # rows [0, n/2) and [n/2, n) are mirror pairs
+        half = x.size // 2
+        return mc_mean_se(0.5 * (x[:half] + x[half:]))
+    if name == "stratified":
+        return mc_mean_se(x, strata=N_GROUPS)
+    return mc_mean_se(x, replications=N_GROUPS)
+
+
+def main():
+    rows = []
+    for name, kwargs in SAMPLERS.items():
+        t0 = time.perf_counter()
+        paths = simulate_gbm_paths(S0, r, sigma, T, N_STEPS, N_PATHS, seed=7,
+                                   layout="time_major", **kwargs)
+        sim_s = time.perf_counter() - t0
+
+        euro = np.exp(-r * T) * european_call(paths, K)
+        _, amer = american_option_lsm(paths, K, r, T, is_call=False, return_cashflows=True)
+
+        for option, x in (("european call", euro), ("american put", amer)):
+            price, se = mean_se(x, name)
+            rows.append({
+                "option": option,
+                "sampler": name,
+                "price": price,
+                "se": se,
+                "paths_for_target_se": int(np.ceil(N_PATHS * (se / TARGET_SE) ** 2)),
+                "sim_s": sim_s,
+            })
+
+    print(f"{N_PATHS} paths, {N_STEPS} steps; paths needed for SE <= {TARGET_SE} "
+          f"extrapolated with SE ~ N^-1/2")
+    for row in rows:
+        print(f"  {row['option']:<14} {row['sampler']:<11} price {row['price']:.4f} "
+              f"se {row['se']:.5f}  paths for target {row['paths_for_target_se']:>9}  "
+              f"(sim {row['sim_s']:.2f}s)")
+
+    OUT.parent.mkdir(parents=True, exist_ok=True)
+    with OUT.open("w", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        w.writeheader()
+        w.writerows(rows)
+
+    print(f"\nSaved: {OUT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import argparse
+import csv
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from mcop.server import PricingClient, serve
+
+OUT = Path("artifacts/bench_server.csv")
+
+# An intraday reprice loop: a few markets, spots that move between requests
+SIGMAS = (0.15, 0.2, 0.25, 0.3)
+STRIKES = (90.0, 95.0, 100.0, 105.0, 110.0)
+
+
+def _client_loop(address, n_requests, seed, policy):
+    rng = np.random.default_rng(seed)
+    latencies = []
+    with PricingClient(address) as client:
+        for _ in range(n_requests):
+            request = dict(S0=round(100.0 + rng.normal(0.0, 1.0), 2), K=float(rng.choice(STRIKES)),
+                           r=0.05, sigma=float(rng.choice(SIGMAS)), T=1.0, type="put",
+                           policy=policy)
+            t0 = time.perf_counter()
+            client.price(**request)
+            latencies.append(time.perf_counter() - t0)
+    return latencies
+
+
+def load_test(address, clients, n_requests, policy=False):
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        runs = pool.map(_client_loop, [address] * clients, [n_requests] * clients,
+                        range(clients), [policy] * clients)
+        latencies = np.concatenate([np.array(run) for run in runs])
+    elapsed = time.perf_counter() - t0
+    return {
+        "clients": clients,
+        "policy": policy,
+        "requests": latencies.size,
+        "req_per_s": latencies.size / elapsed,
+        "p50_ms": 1e3 * np.percentile(latencies, 50),
+        "p99_ms": 1e3 * np.percentile(latencies, 99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test mcop serve")
+    parser.add_argument("--socket", default=None,
+                        help="Existing server's Unix socket (default: start one in-process)")
+    parser.add_argument("--port", type=int, default=None, help="Existing server's TCP port")
+    parser.add_argument("--clients", default="1,4,16", help="Concurrent clients to test")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per client")
+    parser.add_argument("--n-paths", type=int, default=20_000)
+    parser.add_argument("--n-steps", type=int, default=50)
+    parser.add_argument("--engine", default="python")
+    args = parser.parse_args()
+
+    tmp = None
+    if args.socket is not None:
+        address = args.socket
+    elif args.port is not None:
+        address = ("127.0.0.1", args.port)
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        address = str(Path(tmp.name) / "mcop.sock")
+        ready = threading.Event()
+        threading.Thread(target=serve, daemon=True, kwargs=dict(
+            path=address, ready=lambda _: ready.set(), engine=args.engine,
+            n_steps=args.n_steps, n_paths=args.n_paths)).start()
+        ready.wait()
+
+    # Reference: one fresh `mcop price` process per quote
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "mcop.cli", "price", "--engine", args.engine,
+                    "--n-paths", str(args.n_paths), "--n-steps", str(args.n_steps)],
+                   check=True, capture_output=True)
+    cold = time.perf_counter() - t0
+    print(f"Cold `mcop price` process: {cold * 1e3:.0f} ms per quote")
+
+    rows = []
+    for policy in (False, True):
+        for clients in (int(c) for c in args.clients.split(",")):
+            row = load_test(address, clients, args.requests, policy=policy)
+            rows.append(row)
+            print(f"clients={row['clients']:<3} policy={str(policy):<5} "
+                  f"{row['req_per_s']:>8.1f} req/s  p50 {row['p50_ms']:>7.1f} ms  "
+                  f"p99 {row['p99_ms']:>7.1f} ms")
+
+    with PricingClient(address) as client:
+        stats = client.stats()
+        print(f"path cache: {stats['paths']['entries']} sets, {stats['paths']['hits']} hits; "
+              f"coalesced {stats['coalesced']}, result hits {stats['result_hits']}")
+        if tmp is not None:
+            client.shutdown()
+
+    OUT.parent.mkdir(parents=True, exist_ok=True)
+    with OUT.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"\nSaved: {OUT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,168 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/numpy.h>
+#include <pybind11/stl.h>
 
+#include <cstdint>
+
+#include "binomial.hpp"
 #include "lsm.hpp"
 
 namespace py = pybind11;
 
+// Wrap a 2-D array of any positive element strides (C order, Fortran order,
+// memmaps, column slices) without copying.
+template <typename Scalar>
+static BasicPathView<Scalar> path_view(const py::array_t<Scalar>& paths) {
+    if (paths.ndim() != 2) throw std::runtime_error("paths must be a 2D array");
+    if (paths.shape(1) < 2) throw std::runtime_error("paths must have at least 2 columns");
+    const auto item = static_cast<py::ssize_t>(sizeof(Scalar));
+    const py::ssize_t ps = paths.strides(0), ts = paths.strides(1);
+    if (ps <= 0 || ts <= 0 || ps % item || ts % item)
+        throw std::runtime_error("paths must have positive, element-aligned strides");
+    return BasicPathView<Scalar>{paths.data(), static_cast<std::size_t>(ps / item),
+                                 static_cast<std::size_t>(ts / item)};
+}
+
+// Call f(view) with a float view for float32 arrays and a double view
+// otherwise (other dtypes are converted to float64 once). The array object
+// stays referenced for the duration of the call.
+template <typename F>
+static auto with_path_view(const py::array& paths, F&& f) {
+    if (py::isinstance<py::array_t<float>>(paths)) {
+        const auto arr = py::reinterpret_borrow<py::array_t<float>>(paths);
+        return f(path_view(arr));
+    }
+    const auto arr = py::array_t<double, py::array::forcecast>::ensure(paths);
+    if (!arr) throw std::runtime_error("paths must be convertible to a float64 array");
+    return f(path_view<double>(arr));
+}
+
 PYBIND11_MODULE(_mcop_cpp, m) {
     m.doc() = "C++ core for Monte Carlo American option pricing (LSM)";
 
+    m.def("crr_price_batch",
+          [](double S0, std::vector<double> strikes, std::vector<bool> is_call, double r,
+             double sigma, double T, int n_steps, double q, int n_threads) {
+              std::vector<double> prices;
+              {
+                  py::gil_scoped_release release;
+                  prices = crr_price_batch(S0, strikes, is_call, r, sigma, T, n_steps, q, n_threads);
+              }
+              return py::array_t<double>(prices.size(), prices.data());
+          },
+          "CRR binomial American prices for several strikes / option types. Returns an array.",
+          py::arg("S0"), py::arg("strikes"), py::arg("is_call"), py::arg("r"), py::arg("sigma"),
+          py::arg("T"), py::arg("n_steps"), py::arg("q") = 0.0, py::arg("n_threads") = 0);
+
     m.def("lsm_price_from_paths",
-          [](py::array_t<double, py::array::c_style | py::array::forcecast> paths,
-             double K, double r, double T, bool is_call, int degree) {
-              auto buf = paths.request();
-              if (buf.ndim != 2) throw std::runtime_error("paths must be a 2D array");
-              const int n_paths = static_cast<int>(buf.shape[0]);
-              const int n_cols  = static_cast<int>(buf.shape[1]);
-              if (n_cols < 2) throw std::runtime_error("paths must have at least 2 columns");
-
-              const int n_steps = n_cols - 1;
-              const double* ptr = static_cast<const double*>(buf.ptr);
-
-              return lsm_price_from_paths(ptr, n_paths, n_steps, K, r, T, is_call, degree);
+          [](py::array paths, double K, double r, double T, bool is_call, int degree, int n_threads) {
+              const int n_paths = static_cast<int>(paths.shape(0));
+              const int n_steps = static_cast<int>(paths.shape(1)) - 1;
+              return with_path_view(paths, [&](const auto& view) {
+                  // `paths` keeps the buffer alive; the kernel touches no Python objects
+                  py::gil_scoped_release release;
+                  return lsm_price_from_paths(view, n_paths, n_steps, K, r, T, is_call, degree, n_threads);
+              });
+          },
+          "LSM price from a (n_paths, n_steps+1) float64 or float32 array in C or Fortran "
+          "(time-major) order, without copying.",
+          py::arg("paths"), py::arg("K"), py::arg("r"), py::arg("T"),
+          py::arg("is_call"), py::arg("degree") = 2, py::arg("n_threads") = 0);
+
+    m.def("lsm_price_from_paths_profiled",
+          [](py::array paths, double K, double r, double T, bool is_call, int degree, int n_threads) {
+              const int n_paths = static_cast<int>(paths.shape(0));
+              const int n_steps = static_cast<int>(paths.shape(1)) - 1;
+              LSMStats stats;
+              const double price = with_path_view(paths, [&](const auto& view) {
+                  py::gil_scoped_release release;
+                  return lsm_price_from_paths(view, n_paths, n_steps, K, r, T, is_call, degree,
+                                              n_threads, &stats);
+              });
+              py::dict out;
+              out["accumulate"] = stats.accumulate_seconds;
+              out["regression"] = stats.regression_seconds;
+              out["exercise"] = stats.exercise_seconds;
+              out["bytes_allocated"] = stats.bytes_allocated;
+              out["step"] = stats.step;
+              out["n_itm"] = stats.n_itm;
+              out["cond"] = stats.cond;
+              return py::make_tuple(price, out);
           },
+          "lsm_price_from_paths with per-phase timings and per-step ITM counts / condition "
+          "numbers. Returns (price, stats dict).",
           py::arg("paths"), py::arg("K"), py::arg("r"), py::arg("T"),
-          py::arg("is_call"), py::arg("degree") = 2);
+          py::arg("is_call"), py::arg("degree") = 2, py::arg("n_threads") = 0);
+
+    m.def("lsm_price_batch_from_paths",
+          [](py::array paths, std::vector<double> strikes,
+             std::vector<bool> is_call, double r, double T, int degree,
+             std::vector<int> maturity_steps, bool antithetic, int n_threads) {
+              const int n_paths = static_cast<int>(paths.shape(0));
+              const int n_steps = static_cast<int>(paths.shape(1)) - 1;
+
+              const std::vector<PriceSE> res = with_path_view(paths, [&](const auto& view) {
+                  py::gil_scoped_release release;
+                  return lsm_price_batch_from_paths(view, n_paths, n_steps, strikes, is_call, r, T,
+                                                    degree, maturity_steps, antithetic, n_threads);
+              });
+              py::array_t<double> prices(res.size()), ses(res.size());
+              for (std::size_t c = 0; c < res.size(); ++c) {
+                  prices.mutable_at(c) = res[c].price;
+                  ses.mutable_at(c) = res[c].se;
+              }
+              return py::make_tuple(prices, ses);
+          },
+          "Price several strikes / types / sub-grid maturities in one LSM sweep. Returns (prices, ses); "
+          "with antithetic the SEs are taken over mirrored (i, i + n/2) pair means.",
+          py::arg("paths"), py::arg("strikes"), py::arg("is_call"), py::arg("r"), py::arg("T"),
+          py::arg("degree") = 2, py::arg("maturity_steps") = std::vector<int>{},
+          py::arg("antithetic") = false, py::arg("n_threads") = 0);
+
+    m.def("lsm_price_with_policy",
+          [](py::array paths, double K, double r, double T,
+             bool is_call,
+             py::array_t<double, py::array::c_style | py::array::forcecast> coef,
+             py::array_t<double, py::array::c_style | py::array::forcecast> shift,
+             py::array_t<double, py::array::c_style | py::array::forcecast> scale,
+             bool antithetic, int n_threads) {
+              const int n_paths = static_cast<int>(paths.shape(0));
+              const int n_steps = static_cast<int>(paths.shape(1)) - 1;
+              if (coef.ndim() != 2 || coef.shape(0) != n_steps + 1)
+                  throw std::runtime_error("coef must have shape (n_steps+1, degree+1)");
+              if (shift.size() != n_steps + 1 || scale.size() != n_steps + 1)
+                  throw std::runtime_error("shift and scale must have n_steps+1 entries");
+              const int degree = static_cast<int>(coef.shape(1)) - 1;
+
+              const PriceSE res = with_path_view(paths, [&](const auto& view) {
+                  py::gil_scoped_release release;
+                  return lsm_price_with_policy(view, n_paths, n_steps, K, r, T, is_call, degree,
+                                               coef.data(), shift.data(), scale.data(), antithetic,
+                                               n_threads);
+              });
+              return py::make_tuple(res.price, res.se);
+          },
+          "Price paths with a fitted LSM exercise policy (no regression). Returns (price, se); "
+          "with antithetic the SE is taken over adjacent pair means.",
+          py::arg("paths"), py::arg("K"), py::arg("r"), py::arg("T"), py::arg("is_call"),
+          py::arg("coef"), py::arg("shift"), py::arg("scale"), py::arg("antithetic") = false,
+          py::arg("n_threads") = 0);
+
+    m.def("lsm_simulate_and_price",
+          [](double S0, double K, double r, double sigma, double T, int n_steps, int n_paths,
+             bool is_call, int degree, double q, std::uint64_t seed, bool antithetic, int n_threads,
+             bool single_precision) {
+              PriceSE res;
+              {
+                  py::gil_scoped_release release;
+                  res = lsm_simulate_and_price(S0, K, r, q, sigma, T, n_steps, n_paths, is_call,
+                                               degree, seed, antithetic, n_threads, single_precision);
+              }
+              return py::make_tuple(res.price, res.se);
+          },
+          "Simulate GBM paths in C++ (Philox RNG, time-major) and price with LSM. Returns (price, se).",
+          py::arg("S0"), py::arg("K"), py::arg("r"), py::arg("sigma"), py::arg("T"),
+          py::arg("n_steps"), py::arg("n_paths"), py::arg("is_call"), py::arg("degree") = 2,
+          py::arg("q") = 0.0, py::arg("seed") = 0, py::arg("antithetic") = true,
+          py::arg("n_threads") = 0, py::arg("single_precision") = false);
 }
@@ -0,0 +1,80 @@
+#include "binomial.hpp"
+
+#include <cmath>
+#include <algorithm>
+#include <stdexcept>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+std::vector<double> crr_price_batch(
+    double S0,
+    const std::vector<double>& strikes,
+    const std::vector<bool>& is_call,
+    double r,
+    double sigma,
+    double T,
+    int n_steps,
+    double q,
+    int n_threads
+) {
+    if (n_steps <= 0) throw std::invalid_argument("n_steps must be positive");
+    if (T <= 0.0) throw std::invalid_argument("T must be positive");
+    if (sigma < 0.0) throw std::invalid_argument("sigma must be non-negative");
+    if (strikes.size() != is_call.size()) throw std::invalid_argument("is_call must have one entry per strike");
+
+    const double dt = T / n_steps;
+    const double u = std::exp(sigma * std::sqrt(dt));
+    const double d = 1.0 / u;
+    const double disc = std::exp(-r * dt);
+
+    // risk-neutral probability with dividend yield q
+    const double p = (std::exp((r - q) * dt) - d) / (u - d);
+    if (!(p >= 0.0 && p <= 1.0))
+        throw std::invalid_argument("Invalid parameters: risk-neutral probability out of [0,1]");
+
+    // spot lattice power tables, shared by all strikes
+    std::vector<double> u_pow(n_steps + 1), d_pow(n_steps + 1);
+    for (int j = 0; j <= n_steps; ++j) {
+        u_pow[j] = std::pow(u, j);
+        d_pow[j] = std::pow(d, j);
+    }
+
+    const int k = static_cast<int>(strikes.size());
+    std::vector<double> prices(k);
+#ifdef _OPENMP
+    const int nt = n_threads > 0 ? n_threads : omp_get_max_threads();
+#else
+    const int nt = 1;
+    (void)n_threads;
+#endif
+    (void)nt;
+
+    #pragma omp parallel for num_threads(nt) schedule(dynamic)
+    for (int c = 0; c < k; ++c) {
+        const double K = strikes[c];
+        const bool call = is_call[c];
+        auto payoff = [&](double S) { return call ? std::max(S - K, 0.0) : std::max(K - S, 0.0); };
+
+        // terminal option values
+        std::vector<double> values(n_steps + 1);
+        for (int j = 0; j <= n_steps; ++j) {
+            const double ST = S0 * u_pow[j] * d_pow[n_steps - j];
+            values[j] = payoff(ST);
+        }
+
+        // backward induction with early exercise
+        for (int i = n_steps - 1; i >= 0; --i) {
+            for (int j = 0; j <= i; ++j) {
+                const double Sij = S0 * u_pow[j] * d_pow[i - j];
+                const double up = p * values[j + 1];
+                const double down = (1.0 - p) * values[j];
+                const double cont = disc * (up + down);
+                values[j] = std::max(payoff(Sij), cont);
+            }
+        }
+        prices[c] = values[0];
+    }
+    return prices;
+}
@@ -0,0 +1,18 @@
+#pragma once
+
+#include <vector>
+
+// Cox-Ross-Rubinstein American option prices for several strikes / types on
+// one tree. Arithmetic follows mcop.binomial_tree node for node.
+// n_threads <= 0 uses the OpenMP default.
+std::vector<double> crr_price_batch(
+    double S0,
+    const std::vector<double>& strikes,
+    const std::vector<bool>& is_call,
+    double r,
+    double sigma,
+    double T,
+    int n_steps,
+    double q,
+    int n_threads = 0
+);
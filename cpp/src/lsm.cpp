@@ -1,110 +1,528 @@
 #include "lsm.hpp"
+#include "rng.hpp"
 
 #include <cmath>
+#include <cstddef>
 #include <algorithm>
+#include <chrono>
 #include <stdexcept>
 
 #include <Eigen/Dense>
 
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+// Paths per reduction block. Partial sums are formed per block and reduced in
+// block order, so the result is independent of the number of threads.
+static constexpr int kBlock = 8192;
+static constexpr int kMaxDegree = 15;
+
 static inline double payoff(double S, double K, bool is_call) {
     return is_call ? std::max(S - K, 0.0) : std::max(K - S, 0.0);
 }
 
-double lsm_price_from_paths(
-    const double* paths,
-    int n_paths,
-    int n_steps,
-    double K,
-    double r,
-    double T,
-    bool is_call,
-    int degree
-) {
-    if (!paths) throw std::invalid_argument("paths pointer is null");
+static int resolve_threads(int n_threads) {
+#ifdef _OPENMP
+    return n_threads > 0 ? n_threads : omp_get_max_threads();
+#else
+    (void)n_threads;
+    return 1;
+#endif
+}
+
+using Clock = std::chrono::steady_clock;
+
+// Seconds since lap, which is reset to now.
+static double lap_seconds(Clock::time_point& lap) {
+    const Clock::time_point now = Clock::now();
+    const double s = std::chrono::duration<double>(now - lap).count();
+    lap = now;
+    return s;
+}
+
+static void check_lsm_args(int n_paths, int n_steps, double T, int degree) {
     if (n_paths <= 0) throw std::invalid_argument("n_paths must be positive");
     if (n_steps <= 0) throw std::invalid_argument("n_steps must be positive");
     if (T <= 0.0) throw std::invalid_argument("T must be positive");
     if (degree < 0) throw std::invalid_argument("degree must be non-negative");
+    if (degree > kMaxDegree) throw std::invalid_argument("degree must be at most 15");
+}
 
-    const int n_cols = n_steps + 1;
+// Sum of v[0..n) in fixed blocks, reduced in block order (deterministic for any thread count).
+// Always accumulated in double.
+template <typename Scalar>
+static double block_sum(const Scalar* v, int n, int nt) {
+    const int n_blocks = (n + kBlock - 1) / kBlock;
+    std::vector<double> partial(n_blocks, 0.0);
+    (void)nt;
+    #pragma omp parallel for num_threads(nt) schedule(static)
+    for (int blk = 0; blk < n_blocks; ++blk) {
+        const int lo = blk * kBlock;
+        const int hi = std::min(lo + kBlock, n);
+        double s = 0.0;
+        for (int i = lo; i < hi; ++i) s += v[i];
+        partial[blk] = s;
+    }
+    double sum = 0.0;
+    for (int blk = 0; blk < n_blocks; ++blk) sum += partial[blk];
+    return sum;
+}
+
+// How antithetic (Z, -Z) paths are paired: adjacent (2j, 2j+1), as simulated
+// here and by iter_gbm_path_blocks, or mirrored halves (i, i + ceil(n/2)), as
+// from simulate_gbm_paths.
+enum class Pairs { none, adjacent, mirrored };
+
+// Mean and standard error of v[0..n); antithetic pairs are averaged first so
+// the SE is taken over independent samples (an unpaired path stays as is).
+template <typename Scalar>
+static PriceSE mean_se(const Scalar* v, int n, Pairs pairs, int nt) {
+    const double mean = block_sum(v, n, nt) / static_cast<double>(n);
+
+    std::vector<double> samples;
+    if (pairs == Pairs::adjacent) {
+        samples.reserve((n + 1) / 2);
+        for (int i = 0; i + 1 < n; i += 2)
+            samples.push_back(0.5 * (static_cast<double>(v[i]) + static_cast<double>(v[i + 1])));
+        if (n % 2) samples.push_back(v[n - 1]);
+    } else if (pairs == Pairs::mirrored) {
+        const int m = (n + 1) / 2;
+        samples.assign(v, v + m);
+        for (int i = 0; i < n - m; ++i) samples[i] = 0.5 * (samples[i] + static_cast<double>(v[i + m]));
+    } else {
+        samples.assign(v, v + n);
+    }
+    const int n_samples = static_cast<int>(samples.size());
+    if (n_samples < 2) return {mean, 0.0};
+
+    const double sample_mean = block_sum(samples.data(), n_samples, nt) / n_samples;
+    for (double& x : samples) x = (x - sample_mean) * (x - sample_mean);
+    const double var = block_sum(samples.data(), n_samples, nt) / (n_samples - 1);
+    return {mean, std::sqrt(var / n_samples)};
+}
+
+// Batched backward induction over a shared path set. Each contract starts at
+// its own maturity step; powers of the scaled spot are built once per path and
+// step and shared by every contract. On return cashflow[i * n_contracts + c]
+// holds contract c's cashflow on path i discounted to time 0 (path-major, so
+// the inner loop over contracts stays in one cache line).
+// If stats is non-null, phase times and the ITM count / condition number of
+// contract 0 are recorded.
+// The Gram matrix of a monomial basis is Hankel (G(a, e) = sum x^(a+e)), so
+// only the 2p-1 power sums are accumulated per contract (always in double).
+template <typename Scalar>
+static void lsm_backward(
+    const BasicPathView<Scalar>& S,
+    int n_paths,
+    int n_steps,
+    const std::vector<Contract>& contracts,
+    double r,
+    double T,
+    int degree,
+    int nt,
+    std::vector<Scalar>& cashflow,
+    LSMStats* stats = nullptr
+) {
     const double dt = T / static_cast<double>(n_steps);
     const double disc = std::exp(-r * dt);
+    const int p = degree + 1;
+    const int n_con = static_cast<int>(contracts.size());
+    const std::size_t n = static_cast<std::size_t>(n_paths);
+    (void)nt;
 
-    // cashflow at maturity (undiscounted at maturity time)
-    std::vector<double> cashflow(n_paths);
-    for (int i = 0; i < n_paths; ++i) {
-        const double ST = paths[i * n_cols + n_steps];
-        cashflow[i] = payoff(ST, K, is_call);
+    // Regress on x = S / mean(K) rather than S: same span, far better
+    // conditioned normal equations.
+    double K_mean = 0.0;
+    for (const Contract& c : contracts) K_mean += c.K;
+    const double inv_scale = static_cast<double>(n_con) / K_mean;
+
+    const int n_blocks = (n_paths + kBlock - 1) / kBlock;
+    // per block and contract: 2p-1 power sums (the first is the ITM count), p rhs entries
+    const int n_mom = 2 * p - 1;
+    const int stride = n_mom + p;
+    std::vector<double> partial(static_cast<std::size_t>(n_blocks) * n_con * stride);
+    std::vector<double> beta(static_cast<std::size_t>(n_con) * p);
+    std::vector<char> regress(n_con);
+
+    cashflow.assign(n * n_con, Scalar(0));
+
+    Eigen::MatrixXd G(p, p);
+    Eigen::VectorXd b(p);
+
+    Clock::time_point lap;
+    if (stats) {
+        stats->bytes_allocated = cashflow.size() * sizeof(Scalar) + partial.size() * sizeof(double)
+                                 + beta.size() * sizeof(double) + regress.size();
+        lap = Clock::now();
     }
 
-    // backward induction: t = n_steps-1 ... 1 (skip 0)
-    for (int t = n_steps - 1; t >= 1; --t) {
-        // discount cashflows one step back to time t for everyone
-        for (int i = 0; i < n_paths; ++i) {
-            cashflow[i] *= disc;
-        }
+    // backward induction: t = n_steps ... 1 (skip 0). At a contract's maturity
+    // step its cashflow is set to the payoff; before it, the usual LSM step.
+    for (int t = n_steps; t >= 1; --t) {
+        // discount to time t and accumulate the normal equations over ITM paths
+        #pragma omp parallel for num_threads(nt) schedule(static)
+        for (int blk = 0; blk < n_blocks; ++blk) {
+            double* acc_blk = &partial[static_cast<std::size_t>(blk) * n_con * stride];
+            std::fill(acc_blk, acc_blk + static_cast<std::size_t>(n_con) * stride, 0.0);
+            double pw[2 * kMaxDegree + 1];
 
-        // collect ITM indices
-        std::vector<int> itm_idx;
-        itm_idx.reserve(n_paths);
+            const int lo = blk * kBlock;
+            const int hi = std::min(lo + kBlock, n_paths);
+            for (int i = lo; i < hi; ++i) {
+                const double St = S(i, t);
+                pw[0] = 1.0;
+                const double x = St * inv_scale;
+                for (int k = 1; k < 2 * p - 1; ++k) pw[k] = pw[k - 1] * x;
 
-        for (int i = 0; i < n_paths; ++i) {
-            const double St = paths[i * n_cols + t];
-            const double imm = payoff(St, K, is_call);
-            if (imm > 0.0) itm_idx.push_back(i);
-        }
+                for (int c = 0; c < n_con; ++c) {
+                    const Contract& con = contracts[c];
+                    Scalar& cf = cashflow[static_cast<std::size_t>(i) * n_con + c];
+                    if (con.maturity_step == t) {
+                        cf = static_cast<Scalar>(payoff(St, con.K, con.is_call));
+                        continue;
+                    }
+                    if (con.maturity_step < t) continue;
 
-        const int m = static_cast<int>(itm_idx.size());
-        const int p = degree + 1;
-        if (m < p || m == 0) {
-            // not enough points to regress continuation
-            continue;
+                    cf = static_cast<Scalar>(cf * disc);
+                    if (payoff(St, con.K, con.is_call) <= 0.0) continue;
+
+                    double* acc = acc_blk + c * stride;
+                    for (int k = 0; k < n_mom; ++k) acc[k] += pw[k];
+                    double* rhs = acc + n_mom;
+                    const double y = cf;
+                    for (int a = 0; a < p; ++a) rhs[a] += pw[a] * y;
+                }
+            }
         }
+        if (stats) stats->accumulate_seconds += lap_seconds(lap);
 
-        // Build regression X (m x p) and Y (m)
-        Eigen::MatrixXd X(m, p);
-        Eigen::VectorXd Y(m);
+        // reduce block partials in a fixed order and solve each contract's
+        // (small) normal equations: G beta = X^T Y
+        bool any = false;
+        for (int c = 0; c < n_con; ++c) {
+            regress[c] = 0;
+            if (contracts[c].maturity_step <= t) continue;
 
-        for (int row = 0; row < m; ++row) {
-            const int i = itm_idx[row];
-            const double St = paths[i * n_cols + t];
+            double mom[2 * kMaxDegree + 1] = {0.0};
+            b.setZero();
+            for (int blk = 0; blk < n_blocks; ++blk) {
+                const double* acc = &partial[(static_cast<std::size_t>(blk) * n_con + c) * stride];
+                for (int k = 0; k < n_mom; ++k) mom[k] += acc[k];
+                for (int a = 0; a < p; ++a) b(a) += acc[n_mom + a];
+            }
+            if (mom[0] < p || mom[0] == 0.0) {
+                // not enough points to regress continuation
+                continue;
+            }
+            for (int a = 0; a < p; ++a)
+                for (int e = 0; e < p; ++e) G(a, e) = mom[a + e];
 
-            // polynomial basis [1, S, S^2, ...]
-            double powS = 1.0;
-            for (int col = 0; col < p; ++col) {
-                X(row, col) = powS;
-                powS *= St;
+            const Eigen::VectorXd sol = G.colPivHouseholderQr().solve(b);
+            for (int a = 0; a < p; ++a) beta[c * p + a] = sol(a);
+            regress[c] = 1;
+            any = true;
+
+            if (stats && c == 0) {
+                const Eigen::VectorXd sv = Eigen::JacobiSVD<Eigen::MatrixXd>(G).singularValues();
+                stats->step.push_back(t);
+                stats->n_itm.push_back(static_cast<int>(mom[0]));
+                stats->cond.push_back(std::sqrt(sv(0) / sv(p - 1)));
             }
-            Y(row) = cashflow[i];
         }
-
-        // Least squares: beta = argmin ||X beta - Y||
-        Eigen::VectorXd beta = X.colPivHouseholderQr().solve(Y);
+        if (stats) stats->regression_seconds += lap_seconds(lap);
+        if (!any) continue;
 
         // Exercise decision on ITM paths
-        for (int row = 0; row < m; ++row) {
-            const int i = itm_idx[row];
-            const double St = paths[i * n_cols + t];
-            const double imm = payoff(St, K, is_call);
-
-            // continuation = basis(St) dot beta
-            double cont = 0.0;
-            double powS = 1.0;
-            for (int col = 0; col < p; ++col) {
-                cont += beta(col) * powS;
-                powS *= St;
-            }
+        #pragma omp parallel for num_threads(nt) schedule(static)
+        for (int i = 0; i < n_paths; ++i) {
+            const double St = S(i, t);
+            const double x = St * inv_scale;
+            for (int c = 0; c < n_con; ++c) {
+                if (!regress[c]) continue;
+                const double imm = payoff(St, contracts[c].K, contracts[c].is_call);
+                if (imm <= 0.0) continue;
 
-            if (imm > cont) {
-                cashflow[i] = imm;  // at time t (already discounted to time t by earlier step)
+                // continuation = basis(x) dot beta (Horner)
+                const double* bc = &beta[c * p];
+                double cont = bc[p - 1];
+                for (int col = p - 2; col >= 0; --col) cont = cont * x + bc[col];
+
+                if (imm > cont) {
+                    // at time t (already discounted to time t)
+                    cashflow[static_cast<std::size_t>(i) * n_con + c] = static_cast<Scalar>(imm);
+                }
             }
         }
+        if (stats) stats->exercise_seconds += lap_seconds(lap);
     }
 
     // discount one more step to time 0 (from time 1)
-    for (int i = 0; i < n_paths; ++i) cashflow[i] *= disc;
+    const std::size_t total = n * n_con;
+    #pragma omp parallel for num_threads(nt) schedule(static)
+    for (std::size_t j = 0; j < total; ++j) cashflow[j] = static_cast<Scalar>(cashflow[j] * disc);
+    if (stats) stats->exercise_seconds += lap_seconds(lap);
+}
 
-    double sum = 0.0;
-    for (int i = 0; i < n_paths; ++i) sum += cashflow[i];
-    return sum / static_cast<double>(n_paths);
+static std::vector<Contract> make_contracts(
+    const std::vector<double>& strikes,
+    const std::vector<bool>& is_call,
+    const std::vector<int>& maturity_steps,
+    int n_steps
+) {
+    const std::size_t k = strikes.size();
+    if (k == 0) throw std::invalid_argument("at least one strike is required");
+    if (is_call.size() != k) throw std::invalid_argument("is_call must have one entry per strike");
+    if (!maturity_steps.empty() && maturity_steps.size() != k)
+        throw std::invalid_argument("maturity_steps must have one entry per strike");
+
+    std::vector<Contract> contracts(k);
+    for (std::size_t c = 0; c < k; ++c) {
+        if (!(strikes[c] > 0.0)) throw std::invalid_argument("strikes must be positive");
+        const int mat = maturity_steps.empty() ? n_steps : maturity_steps[c];
+        if (mat < 1 || mat > n_steps) throw std::invalid_argument("maturity_steps must be in [1, n_steps]");
+        contracts[c] = {strikes[c], static_cast<bool>(is_call[c]), mat};
+    }
+    return contracts;
 }
+
+template <typename Scalar>
+double lsm_price_from_paths(
+    const BasicPathView<Scalar>& paths,
+    int n_paths,
+    int n_steps,
+    double K,
+    double r,
+    double T,
+    bool is_call,
+    int degree,
+    int n_threads,
+    LSMStats* stats
+) {
+    if (!paths.data) throw std::invalid_argument("paths pointer is null");
+    check_lsm_args(n_paths, n_steps, T, degree);
+
+    const int nt = resolve_threads(n_threads);
+    const std::vector<Contract> contracts{{K, is_call, n_steps}};
+    std::vector<Scalar> cashflow;
+    lsm_backward(paths, n_paths, n_steps, contracts, r, T, degree, nt, cashflow, stats);
+    return block_sum(cashflow.data(), n_paths, nt) / static_cast<double>(n_paths);
+}
+
+template <typename Scalar>
+std::vector<PriceSE> lsm_price_batch_from_paths(
+    const BasicPathView<Scalar>& paths,
+    int n_paths,
+    int n_steps,
+    const std::vector<double>& strikes,
+    const std::vector<bool>& is_call,
+    double r,
+    double T,
+    int degree,
+    const std::vector<int>& maturity_steps,
+    bool antithetic,
+    int n_threads
+) {
+    if (!paths.data) throw std::invalid_argument("paths pointer is null");
+    check_lsm_args(n_paths, n_steps, T, degree);
+    const std::vector<Contract> contracts = make_contracts(strikes, is_call, maturity_steps, n_steps);
+
+    const int nt = resolve_threads(n_threads);
+    std::vector<Scalar> cashflow;
+    lsm_backward(paths, n_paths, n_steps, contracts, r, T, degree, nt, cashflow);
+
+    const std::size_t n_con = contracts.size();
+    std::vector<PriceSE> out(n_con);
+    std::vector<Scalar> column(n_paths);
+    for (std::size_t c = 0; c < n_con; ++c) {
+        for (int i = 0; i < n_paths; ++i) column[i] = cashflow[i * n_con + c];
+        out[c] = mean_se(column.data(), n_paths, antithetic ? Pairs::mirrored : Pairs::none, nt);
+    }
+    return out;
+}
+
+double lsm_price_from_paths(
+    const double* paths,
+    int n_paths,
+    int n_steps,
+    double K,
+    double r,
+    double T,
+    bool is_call,
+    int degree,
+    int n_threads
+) {
+    const PathView view{paths, static_cast<std::size_t>(n_steps) + 1, 1};
+    return lsm_price_from_paths(view, n_paths, n_steps, K, r, T, is_call, degree, n_threads);
+}
+
+// Fill a time-major (n_steps+1) x n_paths GBM matrix. Normals for path i, steps
+// (2k, 2k+1) come from Philox(counter = (k, i), key = seed), so every entry is
+// reproducible regardless of threading. With antithetic, path 2j+1 mirrors 2j.
+// The log-price is accumulated in double whatever the storage type.
+template <typename Scalar>
+static void simulate_gbm_time_major(
+    Scalar* out,
+    double S0,
+    double drift,
+    double vol,
+    int n_steps,
+    int n_paths,
+    std::uint64_t seed,
+    bool antithetic,
+    int nt
+) {
+    const std::size_t n = static_cast<std::size_t>(n_paths);
+    const int n_blocks = (n_paths + kBlock - 1) / kBlock;
+    (void)nt;
+
+    #pragma omp parallel for num_threads(nt) schedule(static)
+    for (int blk = 0; blk < n_blocks; ++blk) {
+        const int lo = blk * kBlock;
+        const int hi = std::min(lo + kBlock, n_paths);
+        std::vector<double> logS(hi - lo, 0.0);
+        for (int i = lo; i < hi; ++i) out[i] = static_cast<Scalar>(S0);
+
+        for (int t = 0; t < n_steps; t += 2) {
+            const bool second = t + 1 < n_steps;
+            Scalar* row1 = out + static_cast<std::size_t>(t + 1) * n;
+            Scalar* row2 = out + static_cast<std::size_t>(t + 2) * n;
+            double z0 = 0.0, z1 = 0.0;
+            for (int i = lo; i < hi; ++i) {
+                // kBlock is even, so antithetic pairs never straddle blocks
+                if (!antithetic || i % 2 == 0) {
+                    const std::uint64_t stream = antithetic ? static_cast<std::uint64_t>(i / 2)
+                                                            : static_cast<std::uint64_t>(i);
+                    philox_normal_pair(seed, stream, static_cast<std::uint32_t>(t / 2), z0, z1);
+                } else {
+                    z0 = -z0;
+                    z1 = -z1;
+                }
+                double& x = logS[i - lo];
+                x += drift + vol * z0;
+                row1[i] = static_cast<Scalar>(S0 * std::exp(x));
+                if (second) {
+                    x += drift + vol * z1;
+                    row2[i] = static_cast<Scalar>(S0 * std::exp(x));
+                }
+            }
+        }
+    }
+}
+
+template <typename Scalar>
+static PriceSE simulate_and_price(
+    double S0, double K, double r, double drift, double vol, double T, int n_steps, int n_paths,
+    bool is_call, int degree, std::uint64_t seed, bool antithetic, int nt
+) {
+    std::vector<Scalar> paths(static_cast<std::size_t>(n_steps + 1) * n_paths);
+    simulate_gbm_time_major(paths.data(), S0, drift, vol, n_steps, n_paths, seed, antithetic, nt);
+
+    const BasicPathView<Scalar> view{paths.data(), 1, static_cast<std::size_t>(n_paths)};
+    const std::vector<Contract> contracts{{K, is_call, n_steps}};
+    std::vector<Scalar> cashflow;
+    lsm_backward(view, n_paths, n_steps, contracts, r, T, degree, nt, cashflow);
+    std::vector<Scalar>().swap(paths);
+
+    return mean_se(cashflow.data(), n_paths, antithetic ? Pairs::adjacent : Pairs::none, nt);
+}
+
+PriceSE lsm_simulate_and_price(
+    double S0,
+    double K,
+    double r,
+    double q,
+    double sigma,
+    double T,
+    int n_steps,
+    int n_paths,
+    bool is_call,
+    int degree,
+    std::uint64_t seed,
+    bool antithetic,
+    int n_threads,
+    bool single_precision
+) {
+    check_lsm_args(n_paths, n_steps, T, degree);
+    if (sigma < 0.0) throw std::invalid_argument("sigma must be non-negative");
+
+    const int nt = resolve_threads(n_threads);
+    const double dt = T / static_cast<double>(n_steps);
+    const double drift = (r - q - 0.5 * sigma * sigma) * dt;
+    const double vol = sigma * std::sqrt(dt);
+
+    if (single_precision)
+        return simulate_and_price<float>(S0, K, r, drift, vol, T, n_steps, n_paths, is_call,
+                                         degree, seed, antithetic, nt);
+    return simulate_and_price<double>(S0, K, r, drift, vol, T, n_steps, n_paths, is_call,
+                                      degree, seed, antithetic, nt);
+}
+
+template <typename Scalar>
+PriceSE lsm_price_with_policy(
+    const BasicPathView<Scalar>& S,
+    int n_paths,
+    int n_steps,
+    double K,
+    double r,
+    double T,
+    bool is_call,
+    int degree,
+    const double* coef,
+    const double* shift,
+    const double* scale,
+    bool antithetic,
+    int n_threads
+) {
+    if (!S.data || !coef || !shift || !scale) throw std::invalid_argument("null pointer");
+    check_lsm_args(n_paths, n_steps, T, degree);
+
+    const int nt = resolve_threads(n_threads);
+    const int p = degree + 1;
+    const double dt = T / static_cast<double>(n_steps);
+    (void)nt;
+
+    std::vector<double> disc_pow(n_steps + 1);
+    for (int t = 0; t <= n_steps; ++t) disc_pow[t] = std::exp(-r * dt * t);
+
+    // earliest step at which the fitted rule says exercise; NaN rows never exercise
+    std::vector<double> cashflow(n_paths);
+    #pragma omp parallel for num_threads(nt) schedule(static)
+    for (int i = 0; i < n_paths; ++i) {
+        double cf = payoff(S(i, n_steps), K, is_call) * disc_pow[n_steps];
+        for (int t = 1; t < n_steps; ++t) {
+            const double* c = coef + static_cast<std::size_t>(t) * p;
+            if (std::isnan(c[0])) continue;
+            const double imm = payoff(S(i, t), K, is_call);
+            if (imm <= 0.0) continue;
+
+            const double z = (S(i, t) - shift[t]) * scale[t];
+            double cont = c[p - 1];
+            for (int col = p - 2; col >= 0; --col) cont = cont * z + c[col];
+            if (imm > cont) {
+                cf = imm * disc_pow[t];
+                break;
+            }
+        }
+        cashflow[i] = cf;
+    }
+    return mean_se(cashflow.data(), n_paths, antithetic ? Pairs::adjacent : Pairs::none, nt);
+}
+
+// Explicit instantiations for double and float paths
+template double lsm_price_from_paths<double>(const PathView&, int, int, double, double, double, bool, int, int,
+                                            LSMStats*);
+template double lsm_price_from_paths<float>(const PathViewF&, int, int, double, double, double, bool, int, int,
+                                           LSMStats*);
+template std::vector<PriceSE> lsm_price_batch_from_paths<double>(
+    const PathView&, int, int, const std::vector<double>&, const std::vector<bool>&, double, double, int,
+    const std::vector<int>&, bool, int);
+template std::vector<PriceSE> lsm_price_batch_from_paths<float>(
+    const PathViewF&, int, int, const std::vector<double>&, const std::vector<bool>&, double, double, int,
+    const std::vector<int>&, bool, int);
+template PriceSE lsm_price_with_policy<double>(
+    const PathView&, int, int, double, double, double, bool, int, const double*, const double*,
+    const double*, bool, int);
+template PriceSE lsm_price_with_policy<float>(
+    const PathViewF&, int, int, double, double, double, bool, int, const double*, const double*,
+    const double*, bool, int);
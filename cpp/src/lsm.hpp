@@ -1,14 +1,144 @@
 #pragma once
 
+#include <cstddef>
+#include <cstdint>
 #include <vector>
 
+// Read-only strided view of a path matrix: S(i, t) = data[i * path_stride + t * time_stride].
+// Path-major (C order) storage has time_stride == 1; time-major has path_stride == 1.
+// Scalar is double or float; values are widened to double when read.
+template <typename Scalar>
+struct BasicPathView {
+    const Scalar* data;
+    std::size_t path_stride;
+    std::size_t time_stride;
+
+    double operator()(int i, int t) const {
+        return static_cast<double>(
+            data[static_cast<std::size_t>(i) * path_stride + static_cast<std::size_t>(t) * time_stride]);
+    }
+};
+
+using PathView = BasicPathView<double>;
+using PathViewF = BasicPathView<float>;
+
+// The kernels below are instantiated for double and float paths. Float paths
+// keep per-path cashflows in float (half the memory traffic); regressions and
+// all reductions are carried out in double.
+
+// Opt-in instrumentation of the LSM backward pass. Phase times are wall
+// seconds summed over all steps; step / n_itm / cond have one entry per
+// regression step, where cond is the 2-norm condition number of the basis
+// design (the square root of that of the Gram matrix).
+struct LSMStats {
+    double accumulate_seconds = 0.0;  // discounting, payoff / ITM test, basis powers, normal equations
+    double regression_seconds = 0.0;  // block reduction and solves
+    double exercise_seconds = 0.0;    // exercise decisions and the final discount
+    std::size_t bytes_allocated = 0;  // work buffers: cashflows, block partials, coefficients
+    std::vector<int> step;
+    std::vector<int> n_itm;
+    std::vector<double> cond;
+};
+
+// Longstaff-Schwartz backward pass over pre-simulated paths.
+// n_threads <= 0 uses the OpenMP default; results do not depend on n_threads.
+// If stats is non-null it is filled in; otherwise no timing is done.
+template <typename Scalar>
 double lsm_price_from_paths(
-    const double* paths,   // contiguous array (n_paths x (n_steps+1))
+    const BasicPathView<Scalar>& paths,  // n_paths x (n_steps+1), any layout
+    int n_paths,
+    int n_steps,
+    double K,
+    double r,
+    double T,
+    bool is_call,
+    int degree,
+    int n_threads = 0,
+    LSMStats* stats = nullptr
+);
+
+// Convenience overload for a contiguous path-major array (n_paths x (n_steps+1)).
+double lsm_price_from_paths(
+    const double* paths,
+    int n_paths,
+    int n_steps,
+    double K,
+    double r,
+    double T,
+    bool is_call,
+    int degree,
+    int n_threads = 0
+);
+
+struct PriceSE {
+    double price;
+    double se;
+};
+
+// One contract of a batch priced on a shared path set; maturity_step in [1, n_steps].
+struct Contract {
+    double K;
+    bool is_call;
+    int maturity_step;
+};
+
+// Price several strikes / types / (sub-grid) maturities in one backward sweep
+// over the same paths. maturity_steps may be empty (all mature at n_steps).
+// With antithetic, path i + ceil(n_paths/2) mirrors path i (simulate_gbm_paths
+// layout) and the SEs are taken over the pair means.
+template <typename Scalar>
+std::vector<PriceSE> lsm_price_batch_from_paths(
+    const BasicPathView<Scalar>& paths,
+    int n_paths,
+    int n_steps,
+    const std::vector<double>& strikes,
+    const std::vector<bool>& is_call,
+    double r,
+    double T,
+    int degree,
+    const std::vector<int>& maturity_steps,
+    bool antithetic = false,
+    int n_threads = 0
+);
+
+// Simulate GBM paths internally (Philox counter-based RNG, time-major storage)
+// and price with LSM, without ever exposing the path matrix. With
+// single_precision the internal path matrix and cashflows are float.
+PriceSE lsm_simulate_and_price(
+    double S0,
+    double K,
+    double r,
+    double q,
+    double sigma,
+    double T,
+    int n_steps,
+    int n_paths,
+    bool is_call,
+    int degree,
+    std::uint64_t seed,
+    bool antithetic,
+    int n_threads = 0,
+    bool single_precision = false
+);
+
+// Out-of-sample pricing with a fitted exercise policy: no regression. Row t
+// of coef (n_steps+1 rows, degree+1 columns) holds power-basis coefficients
+// of the continuation in z = (S - shift[t]) * scale[t]; NaN rows never exercise.
+// With antithetic, paths (2j, 2j+1) are mirrored pairs and the SE is taken
+// over their means.
+template <typename Scalar>
+PriceSE lsm_price_with_policy(
+    const BasicPathView<Scalar>& paths,
     int n_paths,
     int n_steps,
     double K,
     double r,
     double T,
     bool is_call,
-    int degree
+    int degree,
+    const double* coef,
+    const double* shift,
+    const double* scale,
+    bool antithetic = false,
+    int n_threads = 0
 );
@@ -0,0 +1,47 @@
+#pragma once
+
+#include <cmath>
+#include <cstdint>
+
+// Philox4x32-10 counter-based generator (Salmon et al., SC'11).
+// Stateless: every (counter, key) maps to four independent 32-bit words, so
+// any path/step can be generated independently of thread count and order.
+struct Philox4x32 {
+    std::uint32_t v[4];
+};
+
+inline Philox4x32 philox4x32_10(Philox4x32 ctr, std::uint32_t k0, std::uint32_t k1) {
+    constexpr std::uint32_t M0 = 0xD2511F53u, M1 = 0xCD9E8D57u;
+    constexpr std::uint32_t W0 = 0x9E3779B9u, W1 = 0xBB67AE85u;
+    for (int round = 0; round < 10; ++round) {
+        const std::uint64_t p0 = static_cast<std::uint64_t>(M0) * ctr.v[0];
+        const std::uint64_t p1 = static_cast<std::uint64_t>(M1) * ctr.v[2];
+        const std::uint32_t hi0 = static_cast<std::uint32_t>(p0 >> 32), lo0 = static_cast<std::uint32_t>(p0);
+        const std::uint32_t hi1 = static_cast<std::uint32_t>(p1 >> 32), lo1 = static_cast<std::uint32_t>(p1);
+        ctr = {{hi1 ^ ctr.v[1] ^ k0, lo1, hi0 ^ ctr.v[3] ^ k1, lo0}};
+        k0 += W0;
+        k1 += W1;
+    }
+    return ctr;
+}
+
+// Uniform in (0, 1) with 53 random bits.
+inline double uniform_open(std::uint32_t hi, std::uint32_t lo) {
+    const std::uint64_t bits = ((static_cast<std::uint64_t>(hi) << 32) | lo) >> 11;
+    return (static_cast<double>(bits) + 0.5) * (1.0 / 9007199254740992.0);
+}
+
+// Two N(0,1) draws for (stream, index) under a 64-bit seed (Box-Muller).
+inline void philox_normal_pair(std::uint64_t seed, std::uint64_t stream, std::uint32_t index,
+                               double& z0, double& z1) {
+    const Philox4x32 ctr = {{index, static_cast<std::uint32_t>(stream),
+                             static_cast<std::uint32_t>(stream >> 32), 0u}};
+    const Philox4x32 out = philox4x32_10(ctr, static_cast<std::uint32_t>(seed),
+                                         static_cast<std::uint32_t>(seed >> 32));
+    const double u0 = uniform_open(out.v[0], out.v[1]);
+    const double u1 = uniform_open(out.v[2], out.v[3]);
+    const double rad = std::sqrt(-2.0 * std::log(u0));
+    const double ang = 6.283185307179586 * u1;
+    z0 = rad * std::cos(ang);
+    z1 = rad * std::sin(ang);
+}
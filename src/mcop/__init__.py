@@ -1,20 +1,59 @@
-from .simulate_paths import simulate_gbm_paths
-from .payoffs import european_call, european_put
-from .pricing import mc_price
-from .american_lsm import american_option_lsm
-from .binomial_tree import american_option_crr
-from .variance_reduction import control_variate_adjustment, mc_mean_se
-from .analysis import convergence_study, plot_convergence
+# Public names are imported from their submodules on first access (PEP 562),
+# so `import mcop` and the CLI do not pay for scipy / matplotlib up front.
 
-__all__ = [
-    "simulate_gbm_paths",
-    "european_call",
-    "european_put",
-    "mc_price",
-    "american_option_lsm",
-    "american_option_crr",
-    "control_variate_adjustment",
-    "mc_mean_se",
-    "convergence_study",
-    "plot_convergence",
-]
+_EXPORTS = {
+    "simulate_gbm_paths": "simulate_paths",
+    "iter_gbm_path_blocks": "simulate_paths",
+    "european_call": "payoffs",
+    "european_put": "payoffs",
+    "mc_price": "pricing",
+    "mc_price_stream": "pricing",
+    "RunningMoments": "pricing",
+    "american_option_lsm": "american_lsm",
+    "american_option_lsm_batch": "american_lsm",
+    "american_option_crr": "binomial_tree",
+    "american_option_crr_batch": "binomial_tree",
+    "LSMPolicy": "lsm_policy",
+    "PolicyCache": "lsm_policy",
+    "fit_lsm_policy": "lsm_policy",
+    "price_with_policy": "lsm_policy",
+    "Greeks": "greeks",
+    "european_greeks": "greeks",
+    "american_greeks": "greeks",
+    "AdaptiveResult": "adaptive",
+    "price_adaptive": "adaptive",
+    "MLMCResult": "mlmc",
+    "mlmc_price": "mlmc",
+    "AsianAccumulator": "path_dependent",
+    "BarrierAccumulator": "path_dependent",
+    "LookbackAccumulator": "path_dependent",
+    "simulate_path_payoffs": "path_dependent",
+    "geometric_asian_price": "path_dependent",
+    "arithmetic_asian_price": "path_dependent",
+    "control_variate_adjustment": "variance_reduction",
+    "mc_mean_se": "variance_reduction",
+    "LSMProfile": "profiling",
+    "load_engine": "engines",
+    "list_engines": "engines",
+    "PricingServer": "server",
+    "PricingClient": "server",
+    "convergence_study": "analysis",
+    "plot_convergence": "analysis",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,136 @@
+import sys
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .lsm_policy import fit_lsm_policy, policy_cashflows
+from .payoffs import european_call, european_put
+from .pricing import RunningMoments, moments_price, _Z_975
+from .simulate_paths import iter_gbm_path_blocks, simulate_gbm_paths
+
+
+@dataclass(frozen=True)
+class AdaptiveResult:
+    price: float
+    se: float
+    ci_low: float
+    ci_high: float
+    n_paths: int
+    wall_time: float
+    stop_reason: str  # "target", "max_seconds" or "max_paths"
+
+    @property
+    def converged(self) -> bool:
+        return self.stop_reason == "target"
+
+
+def price_adaptive(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    is_call: bool,
+    american: bool = True,
+    q: float = 0.0,
+    seed: int | None = None,
+    target_se: float | None = None,
+    rel_tol: float | None = None,
+    max_seconds: float | None = None,
+    max_paths: int | None = 10_000_000,
+    batch_size: int = 50_000,
+    n_train: int = 50_000,
+    degree: int = 2,
+    antithetic: bool = True,
+) -> AdaptiveResult:
+    """
+    Simulate in batches until the estimate is precise enough.
+
+    After every batch the running mean / standard error are updated and the
+    run stops as soon as
+
+    - se <= target_se, or
+    - the 95% half-width <= rel_tol * |price|,
+
+    or when max_seconds or max_paths is exhausted (whichever comes first).
+    At least one of the two budgets must be set, so every run terminates.
+
+    European options are priced directly. American options first fit an LSM
+    exercise policy on n_train separate paths and then price independent
+    out-of-sample batches with it, so every batch is an unbiased (low-biased
+    for the true price) sample and the SE is valid.
+
+    Returns an AdaptiveResult with price, se, CI, paths used and wall time.
+    """
+    if max_seconds is None and max_paths is None:
+        # a target alone may never be reached (e.g. rel_tol on a price of ~0)
+        raise ValueError("give a finite budget (max_seconds and / or max_paths)")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    if antithetic and batch_size % 2:
+        batch_size += 1
+    if max_paths is not None and max_paths < (4 if antithetic else 2):
+        raise ValueError("max_paths is too small to estimate a standard error")
+
+    t0 = time.perf_counter()
+    train_seed, price_seed = np.random.SeedSequence(seed).spawn(2)
+
+    if american:
+        train = simulate_gbm_paths(S0, r, sigma, T, n_steps, n_train, q=q,
+                                   seed=train_seed, antithetic=antithetic, layout="time_major")
+        policy = fit_lsm_policy(train, K, r, T, is_call, degree=degree, q=q, sigma=sigma)
+        del train
+
+        def sample(block):
+            return policy_cashflows(policy, block)
+    else:
+        disc = np.exp(-r * T)
+        payoff = european_call if is_call else european_put
+
+        def sample(block):
+            return disc * payoff(block, K)
+
+    limit = sys.maxsize if max_paths is None else max_paths
+    if antithetic:
+        limit -= limit % 2  # keep every antithetic pair whole
+    blocks = iter_gbm_path_blocks(S0, r, sigma, T, n_steps, limit, block_size=batch_size,
+                                  q=q, seed=price_seed, antithetic=antithetic)
+
+    acc = RunningMoments()
+    n_paths = 0
+    stop_reason = "max_paths"
+    for block in blocks:
+        x = sample(block)
+        n_paths += x.size
+        if antithetic:
+            # pairs are interleaved (Z, -Z); average them so the SE accounts
+            # for their negative correlation
+            x = 0.5 * (x[0::2] + x[1::2])
+        acc.update(x)
+        if acc.count < 2:
+            continue
+
+        price = acc.mean
+        se = float(np.sqrt(acc.variance / acc.count))
+        if target_se is not None and se <= target_se:
+            stop_reason = "target"
+            break
+        if rel_tol is not None and _Z_975 * se <= rel_tol * abs(price):
+            stop_reason = "target"
+            break
+        if max_seconds is not None and time.perf_counter() - t0 >= max_seconds:
+            stop_reason = "max_seconds"
+            break
+
+    price, se, ci_low, ci_high = moments_price(acc)
+    return AdaptiveResult(
+        price=price,
+        se=se,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        n_paths=n_paths,
+        wall_time=time.perf_counter() - t0,
+        stop_reason=stop_reason,
+    )
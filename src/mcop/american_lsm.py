@@ -1,4 +1,12 @@
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
+
+from .pricing import _mirrored_pair_means
+from .profiling import LSMProfile
+
+BASES = ("monomial", "scaled", "laguerre", "chebyshev")
+SOLVERS = ("lstsq", "qr", "cholesky")
+
 
 def _basis_poly(S: np.ndarray, degree: int) -> np.ndarray:
     """
@@ -10,6 +18,106 @@ def _basis_poly(S: np.ndarray, degree: int) -> np.ndarray:
         cols.append(S ** k)
     return np.column_stack(cols)
 
+
+def _fill_basis(
+    out: np.ndarray,
+    S: np.ndarray,
+    basis: str,
+    K: float,
+    work: np.ndarray,
+    bounds: tuple[float, float] | None = None,
+) -> tuple[float, float] | None:
+    """
+    Write basis functions of S into the rows of out, shape (degree+1, len(S)).
+
+    Rows are built incrementally from the previous ones without temporaries;
+    work is scratch space of shape (2, len(S)). Bases:
+
+    - "monomial": 1, S, S^2, ...
+    - "scaled": monomials of x = S / K
+    - "laguerre": Laguerre polynomials L_0..L_d of x = S / K
+    - "chebyshev": Chebyshev polynomials T_0..T_d of S mapped from
+      bounds = (lo, hi) onto [-1, 1]; bounds default to min/max of S.
+
+    Returns the bounds used (chebyshev) or None.
+    """
+    degree = out.shape[0] - 1
+    if basis not in BASES:
+        raise ValueError(f"basis must be one of {BASES}")
+    if basis == "chebyshev" and bounds is None:
+        bounds = (float(S.min()), float(S.max())) if S.size else (0.0, 0.0)
+
+    out[0] = 1.0
+    if degree == 0:
+        return bounds
+
+    if basis == "monomial":
+        out[1] = S
+    elif basis == "scaled":
+        np.multiply(S, 1.0 / K, out=out[1])
+    elif basis == "laguerre":
+        # x in work[0]; L_1 = 1 - x
+        np.multiply(S, 1.0 / K, out=work[0])
+        np.subtract(1.0, work[0], out=out[1])
+    else:
+        lo, hi = bounds
+        half = 0.5 * (hi - lo)
+        if half > 0.0:
+            np.subtract(S, 0.5 * (hi + lo), out=out[1])
+            out[1] *= 1.0 / half
+        else:
+            out[1] = 0.0
+
+    for k in range(2, degree + 1):
+        cur, prev, prev2 = out[k], out[k - 1], out[k - 2]
+        if basis in ("monomial", "scaled"):
+            np.multiply(prev, out[1], out=cur)
+        elif basis == "chebyshev":
+            # T_k = 2 z T_{k-1} - T_{k-2}
+            np.multiply(prev, out[1], out=cur)
+            cur *= 2.0
+            cur -= prev2
+        else:
+            # L_k = ((2k - 1 - x) L_{k-1} - (k - 1) L_{k-2}) / k
+            np.subtract(2 * k - 1, work[0], out=cur)
+            cur *= prev
+            np.multiply(prev2, k - 1, out=work[1])
+            cur -= work[1]
+            cur *= 1.0 / k
+    return bounds
+
+
+def _solve_least_squares(X: np.ndarray, y: np.ndarray, solver: str) -> np.ndarray:
+    """
+    beta = argmin ||X beta - y|| for a tall (m, p) design X.
+
+    "lstsq" (SVD) is the most robust; "qr" is cheaper and still avoids
+    squaring the condition number; "cholesky" solves the p x p normal
+    equations (fastest, fine for well-scaled bases). qr and cholesky fall
+    back to lstsq when X has fewer rows than columns, R is singular or the
+    Gram matrix is not numerically positive definite.
+    """
+    if solver == "lstsq":
+        beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+        return beta
+    if solver == "qr":
+        # fewer ITM points than basis columns (or a rank-deficient design)
+        # leaves R non-square or singular; fall back to lstsq as cholesky does
+        if X.shape[0] >= X.shape[1]:
+            Q, R = np.linalg.qr(X)
+            if np.all(np.diag(R) != 0.0):
+                return solve_triangular(R, Q.T @ y)
+        beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+        return beta
+    if solver == "cholesky":
+        try:
+            return cho_solve(cho_factor(X.T @ X), X.T @ y)
+        except np.linalg.LinAlgError:
+            beta, *_ = np.linalg.lstsq(X, y, rcond=None)
+            return beta
+    raise ValueError(f"solver must be one of {SOLVERS}")
+
+
 def american_option_lsm(
     paths: np.ndarray,
     K: float,
@@ -19,65 +127,341 @@ def american_option_lsm(
     degree: int = 2,
     q: float = 0.0,
     return_cashflows: bool = False,
+    basis: str = "monomial",
+    solver: str = "lstsq",
+    profile: LSMProfile | None = None,
 ) -> float | tuple[float, np.ndarray]:
     """
     Longstaff–Schwartz Monte Carlo pricer for American options.
 
+    basis : "monomial" (default), "scaled", "laguerre" or "chebyshev";
+        see _fill_basis. The scaled / orthogonal families keep the
+        regression well conditioned at higher degree.
+    solver : "lstsq" (SVD, default), "qr" or "cholesky" (normal equations).
+    profile : optional mcop.profiling.LSMProfile that receives per-phase
+        timings, per-step ITM counts / condition numbers and buffer sizes.
+
     If return_cashflows=True, returns (price, discounted_cashflows_per_path),
     where discounted_cashflows_per_path are discounted to time 0.
     """
+    cashflow, _ = _lsm_backward(paths, K, r, T, is_call, degree, basis, solver, profile=profile)
+    price = float(np.mean(cashflow, dtype=np.float64))
+    if return_cashflows:
+        return price, cashflow
+    return price
+
+
+def _lsm_backward(
+    paths: np.ndarray,
+    K: float,
+    r: float,
+    T: float,
+    is_call: bool,
+    degree: int,
+    basis: str,
+    solver: str,
+    coefficients: np.ndarray | None = None,
+    bounds: np.ndarray | None = None,
+    profile: LSMProfile | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    LSM backward pass on preallocated work buffers.
+
+    Every step reuses the same buffers for the payoff, ITM mask, compacted
+    ITM spots / cashflows, basis rows and continuation values; discounting
+    is done in place.
+
+    If given, coefficients (n_steps+1, degree+1) and bounds (n_steps+1, 2)
+    receive the fitted regression coefficients and chebyshev bounds of each
+    step (rows for steps without a regression are left untouched).
+
+    float32 paths keep the per-path buffers (cashflows, payoffs, ITM spots)
+    in float32; the basis, regression and continuation values are float64.
+
+    profile (LSMProfile) is charged per phase with lap(); when it is None the
+    only cost is the `if lap` checks.
+
+    Returns (cashflow discounted to time 0, exercise_time index per path).
+    """
+    if basis not in BASES:
+        raise ValueError(f"basis must be one of {BASES}")
+    if solver not in SOLVERS:
+        raise ValueError(f"solver must be one of {SOLVERS}")
+
     n_paths, n_cols = paths.shape
     n_steps = n_cols - 1
     dt = T / n_steps
     disc = np.exp(-r * dt)
+    p = degree + 1
 
-    # payoff at a given spot
-    def payoff(S):
+    def payoff(S, out):
         if is_call:
-            return np.maximum(S - K, 0.0)
-        return np.maximum(K - S, 0.0)
+            np.subtract(S, K, out=out)
+        else:
+            np.subtract(K, S, out=out)
+        return np.maximum(out, 0.0, out=out)
+
+    # per-path storage follows the paths (float32 or float64)
+    dtype = np.float32 if paths.dtype == np.float32 else np.float64
 
     # cashflows: start with maturity payoff
-    cashflow = payoff(paths[:, -1])
+    cashflow = payoff(paths[:, -1], np.empty(n_paths, dtype=dtype))
     exercise_time = np.full(n_paths, n_steps, dtype=int)  # time index when exercised
 
+    # work buffers, reused every step
+    immediate = np.empty(n_paths, dtype=dtype)
+    itm = np.empty(n_paths, dtype=bool)
+    path_index = np.arange(n_paths)
+    idx_buf = np.empty(n_paths, dtype=path_index.dtype)
+    S_buf = np.empty(n_paths, dtype=dtype)
+    Y_buf = np.empty(n_paths, dtype=dtype)
+    imm_buf = np.empty(n_paths, dtype=dtype)
+    cont_buf = np.empty(n_paths)
+    work = np.empty((2, n_paths))
+    ex_buf = np.empty(n_paths, dtype=bool)
+    Xt_buf = np.empty((p, n_paths))
+
+    lap = None
+    if profile is not None:
+        profile.engine = "python"
+        profile.bytes_allocated = sum(a.nbytes for a in (
+            cashflow, exercise_time, immediate, itm, path_index, idx_buf, S_buf, Y_buf,
+            imm_buf, cont_buf, work, ex_buf, Xt_buf))
+        profile.start()
+        lap = profile.lap
+
     # work backwards: t = n_steps-1 ... 1 (skip t=0)
     for t in range(n_steps - 1, 0, -1):
         St = paths[:, t]
-        immediate = payoff(St)
+        payoff(St, immediate)
+
+        # discount existing cashflow one step to time t
+        cashflow *= disc
+        if lap:
+            lap("payoff")
 
         # only consider paths where option is in the money at time t
-        itm = immediate > 0
-        if not np.any(itm):
-            cashflow = cashflow * disc
+        np.greater(immediate, 0.0, out=itm)
+        m = int(np.count_nonzero(itm))
+        if m == 0:
+            if lap:
+                lap("itm_mask")
             continue
 
-        # discount existing cashflow one step to time t
-        cashflow = cashflow * disc
+        idx = np.compress(itm, path_index, out=idx_buf[:m])
+        S_itm = np.compress(itm, St, out=S_buf[:m])
+        Y = np.compress(itm, cashflow, out=Y_buf[:m])
+        imm = np.compress(itm, immediate, out=imm_buf[:m])
+        if lap:
+            lap("itm_mask")
 
         # regression: continuation value ~ basis(St) using ITM paths
-        X = _basis_poly(St[itm], degree)
-        Y = cashflow[itm]
-
-        # least squares fit
-        beta, *_ = np.linalg.lstsq(X, Y, rcond=None)
-        continuation = X @ beta
-
-        # decide exercise vs continue
-        exercise_now = immediate[itm] > continuation
+        Xt = Xt_buf[:, :m]
+        step_bounds = _fill_basis(Xt, S_itm, basis, K, work[:, :m])
+        if lap:
+            lap("basis")
+        beta = _solve_least_squares(Xt.T, Y, solver)
+        if coefficients is not None:
+            coefficients[t] = beta
+        if bounds is not None and step_bounds is not None:
+            bounds[t] = step_bounds
+        continuation = np.dot(beta, Xt, out=cont_buf[:m])
+        if lap:
+            lap("regression")
+            profile.record_step(t, m, np.sqrt(np.linalg.cond(Xt @ Xt.T)))
+            lap("diagnostics")
 
-        # update those paths that exercise now
-        idx_itm = np.where(itm)[0]
-        ex_idx = idx_itm[exercise_now]
-
-        cashflow[ex_idx] = immediate[ex_idx]
+        # decide exercise vs continue, update those paths that exercise now
+        exercise_now = np.greater(imm, continuation, out=ex_buf[:m])
+        ex_idx = idx[exercise_now]
+        cashflow[ex_idx] = imm[exercise_now]
         exercise_time[ex_idx] = t
+        if lap:
+            lap("exercise")
 
         # paths that did not exercise keep discounted continuation in cashflow already
 
     # discount cashflows from time 1 to time 0 (one more step)
-    cashflow = cashflow * disc
-    price = float(np.mean(cashflow))
-    if return_cashflows:
-        return price, cashflow
-    return price
\ No newline at end of file
+    cashflow *= disc
+    if lap:
+        lap("exercise")
+    return cashflow, exercise_time
+
+
+def _maturity_steps(maturities, T: float, n_steps: int, n_contracts: int) -> np.ndarray:
+    """
+    Map maturities (years) onto the simulation grid; each must be a grid point in (0, T].
+    """
+    if maturities is None:
+        return np.full(n_contracts, n_steps, dtype=int)
+
+    mats = np.broadcast_to(np.asarray(maturities, dtype=float), (n_contracts,))
+    steps_f = mats / (T / n_steps)
+    steps = np.rint(steps_f).astype(int)
+    if np.any(np.abs(steps_f - steps) > 1e-8 * np.maximum(steps_f, 1.0)):
+        raise ValueError("maturities must lie on the simulation time grid")
+    if np.any((steps < 1) | (steps > n_steps)):
+        raise ValueError("maturities must be in (0, T]")
+    return steps
+
+
+def american_option_lsm_batch(
+    paths: np.ndarray,
+    strikes,
+    r: float,
+    T: float,
+    is_call,
+    degree: int = 2,
+    q: float = 0.0,
+    maturities=None,
+    return_se: bool = False,
+    block_size: int = 2048,
+    antithetic: bool = False,
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    """
+    Longstaff–Schwartz for a ladder of contracts on one shared path set.
+
+    All contracts are priced in a single backward sweep: powers of the spot
+    are built once per step and shared, the per-contract normal equations are
+    accumulated with matrix products over cache-sized blocks of paths, and
+    the small systems are solved as one batch.
+
+    Parameters
+    ----------
+    strikes : array-like, shape (k,)
+    is_call : bool or array-like of bool, shape (k,)
+    maturities : optional array-like, shape (k,), in years. Each must lie on
+        the time grid of `paths` (a sub-grid of the simulated horizon T).
+    block_size : paths per block; k * block_size doubles should fit in cache.
+    antithetic : paths come from simulate_gbm_paths(..., antithetic=True),
+        whose second half mirrors the first; SEs are then taken over the
+        (Z, -Z) pair means instead of treating paths as independent.
+
+    Returns
+    -------
+    prices : ndarray, shape (k,)
+    ses : ndarray, shape (k,), only if return_se=True
+    """
+    strikes = np.atleast_1d(np.asarray(strikes, dtype=float))
+    k = strikes.size
+    calls = np.broadcast_to(np.asarray(is_call, dtype=bool), (k,))
+
+    n_paths, n_cols = paths.shape
+    n_steps = n_cols - 1
+    dt = T / n_steps
+    disc = np.exp(-r * dt)
+    p = degree + 1
+    mat_steps = _maturity_steps(maturities, T, n_steps, k)
+
+    # Sort by maturity (latest first) so the contracts alive at any step are a
+    # prefix of the rows and can be handled with views instead of masks.
+    order = np.argsort(-mat_steps, kind="stable")
+    mat_sorted = mat_steps[order]
+    sign = np.where(calls[order], 1.0, -1.0)[:, None]
+    signed_K = sign * strikes[order][:, None]
+
+    # regress on x = S / mean(K): shared across contracts, well conditioned
+    inv_scale = 1.0 / strikes.mean()
+    # index pairs (a, c), a <= c, of the symmetric (Hankel) Gram matrix
+    ia, ic = np.triu_indices(p)
+
+    cashflow = np.zeros((k, n_paths))
+    powers = np.empty((2 * p - 1, n_paths))
+    powers[0] = 1.0
+
+    B = min(block_size, n_paths)
+    imm = np.empty((k, B))
+    itm_f = np.empty((k, B))
+    work = np.empty((k, B))
+    ex = np.empty((k, B), dtype=bool)
+
+    def payoff_block(St_b, n_live, out):
+        # max(sign * S - sign * K, 0)
+        np.multiply(sign[:n_live], St_b, out=out)
+        out -= signed_K[:n_live]
+        np.maximum(out, 0.0, out=out)
+        return out
+
+    for t in range(n_steps, 0, -1):
+        St = paths[:, t]
+
+        starting = np.flatnonzero(mat_sorted == t)
+        if starting.size:
+            for c in starting:
+                cf = cashflow[c]
+                np.multiply(St, sign[c, 0], out=cf)
+                cf -= signed_K[c, 0]
+                np.maximum(cf, 0.0, out=cf)
+
+        n_live = int(np.count_nonzero(mat_sorted > t))
+        if n_live == 0:
+            continue
+        live_cf = cashflow[:n_live]
+        live_cf *= disc
+
+        np.multiply(St, inv_scale, out=powers[1])
+        for j in range(2, 2 * p - 1):
+            np.multiply(powers[j - 1], powers[1], out=powers[j])
+
+        # pass 1: accumulate moments sum_itm x^j and rhs sum_itm x^a * Y
+        moments = np.zeros((n_live, 2 * p - 1))
+        rhs = np.zeros((n_live, p))
+        for lo in range(0, n_paths, B):
+            hi = min(lo + B, n_paths)
+            nb = hi - lo
+            imm_b = payoff_block(St[lo:hi], n_live, imm[:n_live, :nb])
+            itm_b = itm_f[:n_live, :nb]
+            np.greater(imm_b, 0.0, out=itm_b)
+            pw_b = powers[:, lo:hi]
+            moments += itm_b @ pw_b.T
+            w = work[:n_live, :nb]
+            np.multiply(itm_b, live_cf[:, lo:hi], out=w)
+            rhs += w @ pw_b[:p].T
+
+        counts = moments[:, 0]
+        gram = np.empty((n_live, p, p))
+        gram[:, ia, ic] = moments[:, ia + ic]
+        gram[:, ic, ia] = moments[:, ia + ic]
+        regress = counts >= p
+        if not np.any(regress):
+            continue
+        # contracts without enough ITM paths never exercise at this step
+        gram[~regress] = np.eye(p)
+        rhs[~regress] = 0.0
+        beta = _solve_normal_equations(gram, rhs)
+        beta[~regress, 0] = np.inf
+
+        # pass 2: exercise where immediate payoff beats the fitted continuation
+        for lo in range(0, n_paths, B):
+            hi = min(lo + B, n_paths)
+            nb = hi - lo
+            imm_b = payoff_block(St[lo:hi], n_live, imm[:n_live, :nb])
+            cont = work[:n_live, :nb]
+            np.matmul(beta, powers[:p, lo:hi], out=cont)
+            # imm > max(cont, 0) <=> in the money and beats continuation
+            np.maximum(cont, 0.0, out=cont)
+            ex_b = ex[:n_live, :nb]
+            np.greater(imm_b, cont, out=ex_b)
+            np.copyto(live_cf[:, lo:hi], imm_b, where=ex_b)
+
+    cashflow *= disc
+    prices = np.empty(k)
+    prices[order] = cashflow.mean(axis=1)
+    if return_se:
+        ses = np.empty(k)
+        samples = _mirrored_pair_means(cashflow) if antithetic else cashflow
+        ses[order] = samples.std(axis=1, ddof=1) / np.sqrt(samples.shape[1])
+        return prices, ses
+    return prices
+
+
+def _solve_normal_equations(gram: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """
+    Solve a stack of small normal equations gram[c] @ beta[c] = rhs[c].
+
+    Falls back to a pseudo-inverse for stacks containing singular systems.
+    """
+    try:
+        return np.linalg.solve(gram, rhs[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        return (np.linalg.pinv(gram) @ rhs[..., None])[..., 0]
@@ -1,5 +1,19 @@
 import numpy as np
 from . import _mcop_cpp
+from .profiling import LSMProfile
+
+
+def _as_path_buffer(paths: np.ndarray) -> np.ndarray:
+    # the binding reads any positive, element-aligned strides in place (C or
+    # Fortran order, column slices, memmaps); anything else is copied once
+    paths = np.asarray(paths)
+    if paths.dtype in (np.float64, np.float32) and all(
+        s > 0 and s % paths.itemsize == 0 for s in paths.strides
+    ):
+        return paths
+    dtype = np.float32 if paths.dtype == np.float32 else np.float64
+    return np.ascontiguousarray(paths, dtype=dtype)
+
 
 def american_option_lsm_cpp(
     paths: np.ndarray,
@@ -8,9 +22,131 @@ def american_option_lsm_cpp(
     T: float,
     is_call: bool,
     degree: int = 2,
+    n_threads: int = 0,
+    profile: LSMProfile | None = None,
 ) -> float:
     """
     C++ LSM pricer using pre-simulated paths.
+
+    The GIL is released for the whole backward pass. n_threads <= 0 uses all
+    OpenMP threads (serial if the extension was built without OpenMP); the
+    result does not depend on the thread count.
+
+    Path-major (C order) and time-major (Fortran order, see
+    simulate_gbm_paths(layout="time_major")) float64 or float32 arrays are
+    used in place; anything else is copied once. float32 paths run the
+    single-precision kernel (float cashflows, float64 regression and sums).
+
+    profile (mcop.profiling.LSMProfile) receives the kernel's phase timings,
+    per-step ITM counts / condition numbers and work buffer size.
+    """
+    paths = _as_path_buffer(paths)
+    if profile is None:
+        return float(_mcop_cpp.lsm_price_from_paths(paths, K, r, T, is_call, degree, n_threads))
+
+    price, stats = _mcop_cpp.lsm_price_from_paths_profiled(paths, K, r, T, is_call, degree,
+                                                           n_threads)
+    profile.engine = "cpp"
+    for phase in ("accumulate", "regression", "exercise"):
+        profile.add(phase, stats[phase])
+    profile.bytes_allocated = stats["bytes_allocated"]
+    for step, n_itm, cond in zip(stats["step"], stats["n_itm"], stats["cond"]):
+        profile.record_step(step, n_itm, cond)
+    return float(price)
+
+
+def american_option_lsm_cpp_fused(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    n_paths: int,
+    is_call: bool,
+    degree: int = 2,
+    q: float = 0.0,
+    seed: int | None = None,
+    antithetic: bool = True,
+    n_threads: int = 0,
+    dtype=np.float64,
+) -> tuple[float, float]:
+    """
+    Fused C++ simulate-and-price: GBM paths are generated and consumed inside
+    the extension (time-major, Philox counter-based RNG), so no path matrix is
+    ever created in Python.
+
+    The C++ stream differs from simulate_gbm_paths, but is reproducible for a
+    given seed independently of n_threads. dtype=float32 stores the internal
+    path matrix and cashflows in single precision (same normals).
+
+    Returns (price, se); with antithetic the SE is computed from pair averages.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float64, np.float32):
+        raise ValueError("dtype must be float64 or float32")
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1, dtype=np.uint64)[0])
+    price, se = _mcop_cpp.lsm_simulate_and_price(
+        S0, K, r, sigma, T, n_steps, n_paths, is_call, degree, q, seed, antithetic, n_threads,
+        dtype == np.float32,
+    )
+    return float(price), float(se)
+
+
+def american_option_lsm_cpp_batch(
+    paths: np.ndarray,
+    strikes,
+    r: float,
+    T: float,
+    is_call,
+    degree: int = 2,
+    maturities=None,
+    n_threads: int = 0,
+    antithetic: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    C++ counterpart of american_option_lsm_batch: prices a ladder of strikes,
+    call/put flags and (sub-grid) maturities in one backward sweep.
+
+    With antithetic, paths come from simulate_gbm_paths(..., antithetic=True)
+    and the SEs are taken over the (i, i + n/2) pair means, as in
+    american_option_lsm_batch.
+
+    Returns (prices, ses), each of shape (k,).
+    """
+    from .american_lsm import _maturity_steps
+
+    paths = _as_path_buffer(paths)
+    strikes = np.atleast_1d(np.asarray(strikes, dtype=float))
+    calls = np.broadcast_to(np.asarray(is_call, dtype=bool), strikes.shape)
+    n_steps = paths.shape[1] - 1
+    steps = _maturity_steps(maturities, T, n_steps, strikes.size)
+
+    prices, ses = _mcop_cpp.lsm_price_batch_from_paths(
+        paths, strikes.tolist(), calls.tolist(), r, T, degree, steps.tolist(), antithetic,
+        n_threads,
+    )
+    return np.asarray(prices), np.asarray(ses)
+
+
+def american_option_lsm_cpp_with_policy(
+    paths: np.ndarray,
+    policy,
+    n_threads: int = 0,
+    antithetic: bool = False,
+) -> tuple[float, float]:
+    """
+    Price paths in C++ with a fitted mcop.lsm_policy.LSMPolicy (no regression).
+
+    Returns (price, se). With antithetic, paths (2j, 2j+1) are mirrored pairs
+    (as from iter_gbm_path_blocks) and the SE is taken over their means, as
+    in price_with_policy.
     """
-    paths = np.ascontiguousarray(paths, dtype=float)
-    return float(_mcop_cpp.lsm_price_from_paths(paths, K, r, T, is_call, degree))
+    paths = _as_path_buffer(paths)
+    coef, shift, scale = policy.power_coefficients()
+    price, se = _mcop_cpp.lsm_price_with_policy(
+        paths, policy.K, policy.r, policy.T, policy.is_call, coef, shift, scale, antithetic,
+        n_threads,
+    )
+    return float(price), float(se)
@@ -0,0 +1,135 @@
+from contextlib import contextmanager
+
+import numba
+import numpy as np
+from numba import njit, prange
+
+# Paths per reduction block. Partial sums are formed per block and reduced in
+# block order, so the result does not depend on the number of threads.
+_BLOCK = 8192
+
+
+@contextmanager
+def _num_threads(n_threads: int):
+    # n_threads <= 0 keeps numba's default (NUMBA_NUM_THREADS, all cores)
+    if n_threads <= 0:
+        yield
+        return
+    previous = numba.get_num_threads()
+    numba.set_num_threads(min(n_threads, numba.config.NUMBA_NUM_THREADS))
+    try:
+        yield
+    finally:
+        numba.set_num_threads(previous)
+
+
+@njit(parallel=True, cache=True)
+def _lsm_kernel(paths, K, r, T, is_call, degree, cashflow):
+    n_paths, n_cols = paths.shape
+    n_steps = n_cols - 1
+    disc = np.exp(-r * T / n_steps)
+    p = degree + 1
+    n_mom = 2 * p - 1
+    # regress on x = S / K: same span as S, far better conditioned normal equations
+    inv_K = 1.0 / K
+    sign = 1.0 if is_call else -1.0
+    n_blocks = (n_paths + _BLOCK - 1) // _BLOCK
+    partial = np.empty((n_blocks, n_mom + p))
+    G = np.empty((p, p))
+    b = np.empty(p)
+    mom = np.empty(n_mom + p)
+
+    for i in prange(n_paths):
+        cashflow[i] = max(sign * (paths[i, n_steps] - K), 0.0)
+
+    for t in range(n_steps - 1, 0, -1):
+        # discount to time t and accumulate power sums / X^T Y over ITM paths
+        for blk in prange(n_blocks):
+            acc = partial[blk]
+            acc[:] = 0.0
+            for i in range(blk * _BLOCK, min((blk + 1) * _BLOCK, n_paths)):
+                y = cashflow[i] * disc
+                cashflow[i] = y
+                S = paths[i, t]
+                if sign * (S - K) <= 0.0:
+                    continue
+                x = S * inv_K
+                pw = 1.0
+                for k in range(n_mom):
+                    acc[k] += pw
+                    if k < p:
+                        acc[n_mom + k] += pw * y
+                    pw *= x
+
+        mom[:] = 0.0
+        for blk in range(n_blocks):
+            mom += partial[blk]
+        if mom[0] < p:
+            continue  # too few ITM paths to regress
+
+        # Gram matrix of a monomial basis is Hankel: G[a, e] = sum x^(a+e)
+        for a in range(p):
+            b[a] = mom[n_mom + a]
+            for e in range(p):
+                G[a, e] = mom[a + e]
+        beta = np.linalg.lstsq(G, b)[0]
+
+        for i in prange(n_paths):
+            S = paths[i, t]
+            imm = sign * (S - K)
+            if imm <= 0.0:
+                continue
+            x = S * inv_K
+            cont = beta[p - 1]
+            for k in range(p - 2, -1, -1):
+                cont = cont * x + beta[k]
+            if imm > cont:
+                cashflow[i] = imm
+
+    for i in prange(n_paths):
+        cashflow[i] *= disc
+
+
+def american_option_lsm_numba(
+    paths: np.ndarray,
+    K: float,
+    r: float,
+    T: float,
+    is_call: bool,
+    degree: int = 2,
+    n_threads: int = 0,
+    return_se: bool = False,
+) -> float | tuple[float, float]:
+    """
+    Numba-compiled LSM pricer using pre-simulated paths.
+
+    Same algorithm as the C++ engine: one parallel pass per step discounts
+    the cashflows and accumulates the (degree+1)-sized normal equations of
+    the ITM paths in x = S / K (no compacted copies or basis matrix), then
+    a second pass takes the exercise decision with a Horner evaluation of
+    the continuation value. Sums are reduced over fixed blocks in order, so
+    the price does not depend on n_threads (<= 0 uses all numba threads).
+
+    Path-major or time-major float64 / float32 arrays are read in place
+    (one compiled specialization per dtype and layout); the first call per
+    specialization compiles, later calls and processes use the on-disk cache.
+
+    With return_se, returns (price, se); the SE treats paths as independent.
+    """
+    paths = np.asarray(paths)
+    if paths.dtype not in (np.float64, np.float32):
+        paths = paths.astype(np.float64)
+    if paths.ndim != 2 or paths.shape[1] < 2:
+        raise ValueError("paths must have shape (n_paths, n_steps + 1) with n_steps >= 1")
+    if T <= 0:
+        raise ValueError("T must be positive")
+    if not 0 <= degree <= 15:
+        raise ValueError("degree must be between 0 and 15")
+
+    cashflow = np.empty(paths.shape[0])
+    with _num_threads(n_threads):
+        _lsm_kernel(paths, float(K), float(r), float(T), bool(is_call), int(degree), cashflow)
+    price = float(cashflow.mean())
+    if return_se:
+        return price, float(cashflow.std(ddof=1) / np.sqrt(cashflow.size))
+    return price
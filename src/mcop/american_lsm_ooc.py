@@ -0,0 +1,161 @@
+from pathlib import Path
+
+import numpy as np
+
+from .american_lsm import _fill_basis, _solve_normal_equations
+from .simulate_paths import iter_gbm_path_blocks
+
+
+def simulate_gbm_paths_memmap(
+    filename: str | Path,
+    S0: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    n_paths: int,
+    q: float = 0.0,
+    seed: int | None = None,
+    antithetic: bool = False,
+    chunk_size: int = 65_536,
+    dtype=np.float64,
+) -> np.memmap:
+    """
+    Simulate GBM paths straight into a time-major .npy memmap at filename.
+
+    Paths are generated chunk_size at a time (iter_gbm_path_blocks), so only
+    one chunk is ever in memory; the file holds the full (n_paths,
+    n_steps + 1) Fortran-ordered array, with each time slice paths[:, t]
+    contiguous on disk. The values are the concatenated blocks of
+    iter_gbm_path_blocks with the same arguments. dtype=float32 halves the
+    file size.
+
+    Returns the array opened read-only (np.load(filename, mmap_mode="r")).
+    """
+    out = np.lib.format.open_memmap(
+        filename, mode="w+", dtype=dtype, shape=(n_paths, n_steps + 1), fortran_order=True
+    )
+    blocks = iter_gbm_path_blocks(S0, r, sigma, T, n_steps, n_paths, block_size=chunk_size,
+                                  q=q, seed=seed, antithetic=antithetic, dtype=dtype)
+    start = 0
+    for block in blocks:
+        out[start:start + block.shape[0]] = block
+        start += block.shape[0]
+    out.flush()
+    del out
+    return np.load(filename, mmap_mode="r")
+
+
+def american_option_lsm_ooc(
+    paths: np.ndarray,
+    K: float,
+    r: float,
+    T: float,
+    is_call: bool,
+    degree: int = 2,
+    basis: str = "scaled",
+    chunk_size: int = 262_144,
+    return_cashflows: bool = False,
+) -> float | tuple[float, np.ndarray]:
+    """
+    Out-of-core Longstaff–Schwartz for path sets larger than RAM.
+
+    paths is typically a time-major memmap from simulate_gbm_paths_memmap.
+    The backward pass reads one time slice at a time into a reused buffer,
+    accumulates the regression normal equations chunk by chunk, then makes a
+    second sweep over the slice to apply the exercise decisions to the
+    cashflows. Peak memory is O(n_paths) (one slice plus the cashflows)
+    rather than O(n_paths * n_steps); chunk_size bounds the basis temporaries.
+
+    Time-major storage makes every slice a single sequential read; a
+    path-major memmap works but reads each slice with a large stride.
+
+    basis is "monomial", "scaled" (default) or "laguerre". The normal
+    equations square the condition number, so the scaled bases are
+    preferred; "chebyshev" needs per-step bounds of the whole slice and is
+    not supported here. Results agree with american_option_lsm up to the
+    rounding of the solver.
+    """
+    if basis == "chebyshev":
+        raise ValueError("basis='chebyshev' is not supported out of core")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    n_paths, n_cols = paths.shape
+    n_steps = n_cols - 1
+    dt = T / n_steps
+    disc = np.exp(-r * dt)
+    p = degree + 1
+    chunk = min(chunk_size, n_paths)
+
+    def payoff(S, out):
+        if is_call:
+            np.subtract(S, K, out=out)
+        else:
+            np.subtract(K, S, out=out)
+        return np.maximum(out, 0.0, out=out)
+
+    col = np.empty(n_paths)
+    np.copyto(col, paths[:, -1])
+    cashflow = payoff(col, np.empty(n_paths))
+
+    # per-chunk work buffers
+    immediate = np.empty(chunk)
+    itm = np.empty(chunk, dtype=bool)
+    S_buf = np.empty(chunk)
+    Y_buf = np.empty(chunk)
+    X_buf = np.empty((p, chunk))
+    work = np.empty((2, chunk))
+
+    def chunk_basis(lo, hi):
+        """ITM mask and basis rows for col[lo:hi]; returns (mask, X) or None."""
+        n = hi - lo
+        imm = payoff(col[lo:hi], immediate[:n])
+        mask = np.greater(imm, 0.0, out=itm[:n])
+        m = int(np.count_nonzero(mask))
+        if m == 0:
+            return None
+        S_itm = np.compress(mask, col[lo:hi], out=S_buf[:m])
+        X = X_buf[:, :m]
+        _fill_basis(X, S_itm, basis, K, work[:, :m])
+        return mask, X
+
+    for t in range(n_steps - 1, 0, -1):
+        cashflow *= disc
+        np.copyto(col, paths[:, t])
+
+        # pass 1: normal equations over the ITM paths of every chunk
+        gram = np.zeros((p, p))
+        rhs = np.zeros(p)
+        n_itm = 0
+        for lo in range(0, n_paths, chunk):
+            hi = min(lo + chunk, n_paths)
+            found = chunk_basis(lo, hi)
+            if found is None:
+                continue
+            mask, X = found
+            Y = np.compress(mask, cashflow[lo:hi], out=Y_buf[:X.shape[1]])
+            gram += X @ X.T
+            rhs += X @ Y
+            n_itm += X.shape[1]
+        if n_itm == 0:
+            continue
+        beta = _solve_normal_equations(gram, rhs)
+
+        # pass 2: exercise where immediate payoff beats the fitted continuation
+        for lo in range(0, n_paths, chunk):
+            hi = min(lo + chunk, n_paths)
+            found = chunk_basis(lo, hi)
+            if found is None:
+                continue
+            mask, X = found
+            idx = np.flatnonzero(mask)
+            imm = immediate[idx]
+            ex = imm > beta @ X
+            cashflow[lo + idx[ex]] = imm[ex]
+
+    cashflow *= disc
+    price = float(np.mean(cashflow))
+    if return_cashflows:
+        return price, cashflow
+    return price
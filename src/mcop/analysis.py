@@ -1,8 +1,26 @@
+import csv
+import json
 import time
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .lsm_policy import fit_lsm_policy, policy_cashflows
+from .pricing import RunningMoments, moments_price
+from .simulate_paths import iter_gbm_path_blocks, simulate_gbm_paths
+
+CONVERGENCE_FIELDS = ("rep", "n_paths", "price", "se", "ci_low", "ci_high", "seconds")
+
 
 def convergence_study(run_once, path_counts):
+    """
+    Call run_once(n) -> (price, se, lo, hi) independently for every n.
+
+    Every run starts from scratch; incremental_convergence gets the same
+    table from a single simulation of max(path_counts) paths.
+    """
     prices, ses, times = [], [], []
     for n in path_counts:
         t0 = time.perf_counter()
@@ -13,19 +31,217 @@ def convergence_study(run_once, path_counts):
         times.append(t1 - t0)
     return np.array(prices), np.array(ses), np.array(times)
 
-def plot_convergence(path_counts, prices, ses, ref=None):
-    plt.figure()
-    plt.plot(path_counts, prices)
-    plt.xscale("log")
+
+def prefix_estimates(
+    sample_blocks: Iterable[np.ndarray],
+    counts: Sequence[int],
+    t0: float | None = None,
+) -> list[dict]:
+    """
+    Estimates from the first n samples of one stream, for every n in counts.
+
+    sample_blocks yields already discounted, independent samples. They are
+    folded into one RunningMoments and a (price, se, ci_low, ci_high)
+    snapshot is taken whenever the count reaches the next n, so each prefix
+    is nested in the next and nothing is recomputed. seconds is the time
+    from t0 (default: the call) to the snapshot. Iteration stops at
+    max(counts).
+    """
+    counts = sorted(set(int(n) for n in counts))
+    if not counts or counts[0] < 2:
+        raise ValueError("counts must be at least 2")
+    t0 = time.perf_counter() if t0 is None else t0
+    acc = RunningMoments()
+    rows = []
+    i = 0
+    for block in sample_blocks:
+        block = np.asarray(block).ravel()
+        while block.size and i < len(counts):
+            take = min(block.size, counts[i] - acc.count)
+            acc.update(block[:take])
+            block = block[take:]
+            if acc.count == counts[i]:
+                price, se, lo, hi = moments_price(acc)
+                rows.append({"n": counts[i], "price": price, "se": se, "ci_low": lo,
+                             "ci_high": hi, "seconds": time.perf_counter() - t0})
+                i += 1
+        if i == len(counts):
+            break
+    if i < len(counts):
+        raise ValueError(f"stream ended after {acc.count} samples, before {counts[i]}")
+    return rows
+
+
+def _study(task: tuple) -> list[dict]:
+    # module level so a process pool can pickle it
+    (rep, seed, S0, K, r, sigma, T, q, is_call, american, n_steps, degree, n_train,
+     path_counts, block_size, antithetic) = task
+    t0 = time.perf_counter()
+    train_seed, price_seed = seed.spawn(2)
+    n_paths = max(path_counts)
+
+    if american:
+        train = simulate_gbm_paths(S0, r, sigma, T, n_steps, n_train, q=q, seed=train_seed,
+                                   antithetic=True)
+        policy = fit_lsm_policy(train, K, r, T, is_call, degree=degree, q=q, sigma=sigma)
+        del train
+
+        def samples(block):
+            return policy_cashflows(policy, block)
+    else:
+        # European: only S_T is needed, so one step covers the exact GBM law
+        n_steps = 1
+        disc = np.exp(-r * T)
+
+        def samples(block):
+            S_T = block[:, -1]
+            return disc * (np.maximum(S_T - K, 0.0) if is_call else np.maximum(K - S_T, 0.0))
+
+    blocks = (samples(b) for b in iter_gbm_path_blocks(
+        S0, r, sigma, T, n_steps, n_paths, block_size=block_size, q=q, seed=price_seed,
+        antithetic=antithetic))
+    if antithetic:
+        # pairs (Z, -Z) are adjacent; their means are the independent samples
+        blocks = (b.reshape(-1, 2).mean(axis=1) for b in blocks)
+        counts = [n // 2 for n in path_counts]
+    else:
+        counts = list(path_counts)
+
+    rows = prefix_estimates(blocks, counts, t0=t0)
+    scale = 2 if antithetic else 1
+    return [{"rep": rep, "n_paths": row.pop("n") * scale, **row} for row in rows]
+
+
+def incremental_convergence(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    path_counts: Sequence[int],
+    is_call: bool = False,
+    american: bool = False,
+    q: float = 0.0,
+    n_steps: int = 50,
+    degree: int = 2,
+    n_train: int = 50_000,
+    seed: int | None = 123,
+    repetitions: int = 1,
+    workers: int | None = None,
+    block_size: int = 65_536,
+    antithetic: bool = True,
+) -> list[dict]:
+    """
+    Convergence table of a European or American option price against path count.
+
+    Each repetition simulates max(path_counts) paths once, streamed in
+    blocks of block_size, and reports the estimate on every nested prefix
+    (prefix_estimates). A study up to N paths therefore costs one N-path
+    run, instead of sum(path_counts) paths for convergence_study, and
+    memory is bounded by the block size.
+
+    American prices apply an LSM exercise policy fitted on n_train
+    separate paths (fit_lsm_policy), so the estimate is out of sample
+    and every prefix uses the same rule. With antithetic, path counts must
+    be even and SEs come from the pair means.
+
+    Repetitions use independent streams spawned from seed and run in a
+    process pool when workers > 1; results do not depend on workers.
+
+    Returns one dict per (repetition, n) with the keys CONVERGENCE_FIELDS.
+    seconds is the time from the start of the repetition (including the
+    policy fit) until that prefix was reached, to block granularity.
+    """
+    path_counts = sorted(set(int(n) for n in path_counts))
+    if repetitions < 1:
+        raise ValueError("repetitions must be at least 1")
+    if antithetic and (any(n % 2 for n in path_counts) or block_size % 2):
+        raise ValueError("path counts and block_size must be even when antithetic=True")
+
+    seeds = np.random.SeedSequence(seed).spawn(repetitions)
+    tasks = [(rep, seeds[rep], S0, K, r, sigma, T, q, is_call, american, n_steps, degree,
+              n_train, path_counts, block_size, antithetic) for rep in range(repetitions)]
+    if workers is None or workers <= 1 or repetitions == 1:
+        studies = list(map(_study, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, repetitions)) as pool:
+            studies = list(pool.map(_study, tasks))
+    return [row for study in studies for row in study]
+
+
+def convergence_summary(rows: list[dict]) -> list[dict]:
+    """
+    Per path count: mean price and SE over repetitions, and the spread
+    (sample std) of the repetition prices, which the SE should match.
+    """
+    by_n: dict[int, list[dict]] = {}
+    for row in rows:
+        by_n.setdefault(row["n_paths"], []).append(row)
+    out = []
+    for n, group in sorted(by_n.items()):
+        prices = np.array([row["price"] for row in group])
+        out.append({
+            "n_paths": n,
+            "repetitions": len(group),
+            "price": float(prices.mean()),
+            "se": float(np.mean([row["se"] for row in group])),
+            "rep_std": float(prices.std(ddof=1)) if len(group) > 1 else float("nan"),
+            "seconds": float(np.mean([row["seconds"] for row in group])),
+        })
+    return out
+
+
+def write_convergence(rows: list[dict], path: str | Path) -> None:
+    """Write convergence rows as .csv or .json (a list of objects)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == ".json":
+        path.write_text(json.dumps(rows, indent=2) + "\n")
+        return
+    if path.suffix.lower() != ".csv":
+        raise ValueError("output must be .csv or .json")
+    with path.open("w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _pyplot():
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError as e:
+        raise ImportError("plotting needs matplotlib: pip install 'mcop[plot]'") from e
+    return plt
+
+
+def plot_convergence(path_counts, prices, ses, ref=None, path=None):
+    """
+    Price and 95% CI half-width against path count.
+
+    Shows two figures, or with path saves both panels to one image file.
+    """
+    plt = _pyplot()
+    if path is not None:
+        fig, (ax_price, ax_hw) = plt.subplots(1, 2, figsize=(10, 4))
+    else:
+        ax_price = plt.figure().gca()
+    ax_price.plot(path_counts, prices)
+    ax_price.set_xscale("log")
     if ref is not None:
-        plt.axhline(ref)
-    plt.xlabel("# paths")
-    plt.ylabel("price")
-    plt.show()
-
-    plt.figure()
-    plt.plot(path_counts, 1.96 * ses)
-    plt.xscale("log")
-    plt.xlabel("# paths")
-    plt.ylabel("half-width (95% CI)")
-    plt.show()
+        ax_price.axhline(ref)
+    ax_price.set_xlabel("# paths")
+    ax_price.set_ylabel("price")
+    if path is None:
+        plt.show()
+        ax_hw = plt.figure().gca()
+
+    ax_hw.plot(path_counts, 1.96 * np.asarray(ses))
+    ax_hw.set_xscale("log")
+    ax_hw.set_xlabel("# paths")
+    ax_hw.set_ylabel("half-width (95% CI)")
+    if path is None:
+        plt.show()
+        return
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
@@ -0,0 +1,202 @@
+import csv
+import json
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .american_lsm import american_option_lsm_batch
+from .simulate_paths import simulate_gbm_paths
+
+RESULT_FIELDS = ("id", "S0", "K", "r", "q", "sigma", "T", "type", "price", "se", "group")
+_REQUIRED = ("S0", "K", "r", "sigma", "T")
+
+
+@dataclass(frozen=True)
+class GroupResult:
+    """Prices of one group of contracts that shared a simulated path set."""
+
+    group: int
+    S0: float
+    r: float
+    q: float
+    sigma: float
+    T: float  # maturity shared by the group's contracts
+    rows: list[dict]
+    seconds: float  # simulation + pricing, inside the worker
+
+
+def _parse_type(spec: dict, where: str) -> bool:
+    if "type" in spec:
+        kind = str(spec["type"]).strip().lower()
+        if kind not in ("call", "put"):
+            raise ValueError(f"{where}: type must be 'call' or 'put', got {spec['type']!r}")
+        return kind == "call"
+    if "is_call" in spec:
+        value = spec["is_call"]
+        if isinstance(value, str):
+            return value.strip().lower() in ("1", "true", "yes")
+        return bool(value)
+    raise ValueError(f"{where}: missing 'type' (call/put)")
+
+
+def _normalize(spec: dict, index: int) -> dict:
+    where = f"contract {index}"
+    missing = [name for name in _REQUIRED if spec.get(name) in (None, "")]
+    if missing:
+        raise ValueError(f"{where}: missing {', '.join(missing)}")
+    out = {name: float(spec[name]) for name in _REQUIRED}
+    out["q"] = float(spec.get("q") or 0.0)
+    out["type"] = "call" if _parse_type(spec, where) else "put"
+    out["id"] = spec.get("id") if spec.get("id") not in (None, "") else index
+    if out["T"] <= 0 or out["sigma"] < 0 or out["S0"] <= 0:
+        raise ValueError(f"{where}: need S0 > 0, sigma >= 0 and T > 0")
+    return out
+
+
+def read_specs(path: str | Path) -> list[dict]:
+    """
+    Read option specs from .csv (with a header), .json (a list of objects) or .jsonl.
+
+    Fields: S0, K, r, sigma, T, type ("call" / "put", or a boolean is_call),
+    optional q (default 0) and id (default: row number). Extra fields are
+    ignored.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    with path.open(newline="") as f:
+        if suffix == ".csv":
+            raw = list(csv.DictReader(f))
+        elif suffix == ".json":
+            raw = json.load(f)
+        elif suffix == ".jsonl":
+            raw = [json.loads(line) for line in f if line.strip()]
+        else:
+            raise ValueError("spec file must be .csv, .json or .jsonl")
+    if not isinstance(raw, list):
+        raise ValueError("a .json spec file must hold a list of contracts")
+    return [_normalize(spec, i) for i, spec in enumerate(raw)]
+
+
+def group_specs(specs: list[dict], n_steps: int) -> list[list[int]]:
+    """
+    Indices of specs grouped so that each group can share one path set.
+
+    Contracts share a group when S0, r, q and sigma agree and their
+    maturity gets all n_steps steps of the group's time grid (that of its
+    longest maturity), i.e. when the maturities agree. A shorter maturity
+    would get fewer exercise dates on that grid (a T=0.01 contract on the
+    grid of T=1 would be all but European), and a grid built from the
+    shortest maturity would change with the other contracts in the file;
+    either way a contract's price would depend on its neighbours. Groups
+    keep the order in which their markets first appear.
+    """
+    markets: dict[tuple, list[int]] = {}
+    for i, s in enumerate(specs):
+        markets.setdefault((s["S0"], s["r"], s["q"], s["sigma"]), []).append(i)
+
+    groups = []
+    for idx in markets.values():
+        remaining = sorted(idx, key=lambda i: -specs[i]["T"])
+        while remaining:
+            dt = specs[remaining[0]]["T"] / n_steps
+            steps_f = np.array([specs[i]["T"] / dt for i in remaining])
+            full = np.abs(steps_f - n_steps) <= 1e-8 * n_steps
+            groups.append(sorted(i for i, ok in zip(remaining, full) if ok))
+            remaining = [i for i, ok in zip(remaining, full) if not ok]
+    return groups
+
+
+def _price_group(task: tuple) -> tuple[np.ndarray, np.ndarray, float]:
+    # module level so a process pool can pickle it
+    S0, r, q, sigma, T, strikes, calls, maturities, n_steps, n_paths, degree, seed = task
+    t0 = time.perf_counter()
+    paths = simulate_gbm_paths(S0, r, sigma, T, n_steps, n_paths, q=q, seed=seed,
+                               antithetic=True, layout="time_major")
+    prices, ses = american_option_lsm_batch(paths, strikes, r, T, calls, degree=degree, q=q,
+                                            maturities=maturities, return_se=True,
+                                            antithetic=True)
+    return prices, ses, time.perf_counter() - t0
+
+
+def price_batch(
+    specs: list[dict],
+    n_steps: int = 100,
+    n_paths: int = 50_000,
+    degree: int = 2,
+    seed: int | None = 123,
+    workers: int | None = None,
+) -> Iterator[GroupResult]:
+    """
+    Price American options from read_specs, one shared path set per group.
+
+    Each group (group_specs) simulates antithetic paths once over its
+    maturity and prices all its strikes and types in one
+    american_option_lsm_batch sweep; SEs are taken over the antithetic
+    pair means. With workers > 1 groups run in a process pool. Every group
+    uses the same seed (common random numbers) and every contract gets
+    n_steps exercise steps over its own maturity, so a contract's price is
+    the one it would get priced on its own, whatever else is in the batch
+    and however many workers run. Results are yielded group by group, in
+    group order.
+    """
+    groups = group_specs(specs, n_steps)
+    tasks = []
+    for idx in groups:
+        first = specs[idx[0]]
+        T = max(specs[i]["T"] for i in idx)
+        tasks.append((
+            first["S0"], first["r"], first["q"], first["sigma"], T,
+            np.array([specs[i]["K"] for i in idx]),
+            np.array([specs[i]["type"] == "call" for i in idx]),
+            np.array([specs[i]["T"] for i in idx]),
+            n_steps, n_paths, degree, seed,
+        ))
+
+    def results(outputs):
+        for g, (idx, task, (prices, ses, seconds)) in enumerate(zip(groups, tasks, outputs)):
+            rows = [
+                {**{name: specs[i][name] for name in RESULT_FIELDS[:8]},
+                 "price": float(p), "se": float(e), "group": g}
+                for i, p, e in zip(idx, prices, ses)
+            ]
+            yield GroupResult(group=g, S0=task[0], r=task[1], q=task[2], sigma=task[3],
+                              T=task[4], rows=rows, seconds=seconds)
+
+    if workers is None or workers <= 1:
+        yield from results(map(_price_group, tasks))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from results(pool.map(_price_group, tasks))
+
+
+def write_results(groups: Iterable[GroupResult], f, fmt: str = "csv") -> Iterator[GroupResult]:
+    """
+    Stream result rows to the text file f as CSV, JSON Lines ("jsonl") or a
+    JSON list ("json"), group by group.
+
+    Passes each GroupResult through, so callers can report timings while writing.
+    """
+    if fmt not in ("csv", "jsonl", "json"):
+        raise ValueError("fmt must be 'csv', 'jsonl' or 'json'")
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+    sep = "[\n"
+    for group in groups:
+        for row in group.rows:
+            if writer is not None:
+                writer.writerow(row)
+            elif fmt == "jsonl":
+                f.write(json.dumps(row) + "\n")
+            else:
+                f.write(sep + json.dumps(row))
+                sep = ",\n"
+        f.flush()
+        yield group
+    if fmt == "json":
+        f.write("[]\n" if sep == "[\n" else "\n]\n")
@@ -0,0 +1,222 @@
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from .binomial_tree import american_option_crr
+from .engines import engine_status, load_engine
+from .payoffs import european_put
+from .simulate_paths import simulate_gbm_paths
+
+CASES = ("simulate", "european", "lsm_python", "lsm_cpp", "lsm_numba", "crr")
+_LSM_ENGINES = {"lsm_python": "python", "lsm_cpp": "cpp", "lsm_numba": "numba"}
+
+# American put on this contract; the grid only varies the numerical parameters
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+_REF_STEPS = 2000
+
+
+def _bs_put() -> float:
+    def ndtr(x):
+        return 0.5 * math.erfc(-x / math.sqrt(2.0))
+
+    sd = SIGMA * math.sqrt(T)
+    d1 = (math.log(S0 / K) + (R + 0.5 * SIGMA**2) * T) / sd
+    return K * math.exp(-R * T) * ndtr(-(d1 - sd)) - S0 * ndtr(-d1)
+
+
+def _paths(n_paths, n_steps, seed):
+    return simulate_gbm_paths(S0, R, SIGMA, T, n_steps, n_paths, seed=seed, antithetic=True,
+                              layout="time_major")
+
+
+def _run_case(case: str, n_paths: int, n_steps: int, seed: int) -> float | None:
+    """Run one case once; returns the price (None for the simulation-only case)."""
+    if case == "simulate":
+        _paths(n_paths, n_steps, seed)
+        return None
+    if case == "european":
+        paths = simulate_gbm_paths(S0, R, SIGMA, T, 1, n_paths, seed=seed, antithetic=True)
+        return float(np.exp(-R * T) * european_put(paths, K).mean())
+    if case in _LSM_ENGINES:
+        engine = load_engine(_LSM_ENGINES[case])
+        return engine(_paths(n_paths, n_steps, seed), K, R, T, is_call=False)
+    if case == "crr":
+        return american_option_crr(S0, K, R, SIGMA, T, n_steps=n_steps, is_call=False)
+    raise ValueError(f"unknown case {case!r}; choose from {CASES}")
+
+
+def _work(case: str, n_paths: int, n_steps: int) -> tuple[float, str]:
+    if case == "crr":
+        return n_steps * (n_steps + 1) / 2, "nodes/s"
+    if case == "european":
+        return float(n_paths), "paths/s"
+    return float(n_paths) * n_steps, "path-steps/s"
+
+
+def _max_rss_mb() -> float | None:
+    try:
+        import resource  # POSIX only
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1e6 if sys.platform == "darwin" else rss / 1e3
+
+
+def cpp_available() -> bool:
+    return engine_status("cpp")[0]
+
+
+def machine_metadata() -> dict:
+    """Host, interpreter and library versions recorded alongside the results."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True, cwd=Path(__file__).parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "cpp_extension": cpp_available(),
+        "numba_engine": engine_status("numba")[0],
+        "git_commit": commit,
+    }
+
+
+def run_suite(
+    cases=CASES,
+    path_counts=(10_000, 50_000),
+    step_counts=(50, 100),
+    repeats: int = 3,
+    seed: int = 123,
+    progress=None,
+) -> dict:
+    """
+    Time every case over the (n_paths, n_steps) grid.
+
+    Each grid point runs once under tracemalloc for the peak traced Python /
+    NumPy allocation (C++ buffers are not traced; the process peak RSS is
+    recorded as well), then `repeats` untraced runs with seeds seed, seed + 1,
+    ... for the median time, the time spread and the run-to-run price spread.
+    Price cases report the error of the mean price against Black–Scholes
+    (european) or a 2000-step CRR tree (American put). crr ignores n_paths;
+    lsm_cpp and lsm_numba are skipped when their engine is not available
+    (the untimed tracemalloc run also absorbs Numba's JIT compilation).
+
+    Returns {"metadata", "config", "results"}; progress, if given, is called
+    with each result row.
+    """
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        raise ValueError(f"unknown cases {sorted(unknown)}; choose from {CASES}")
+    if repeats < 1:
+        raise ValueError("repeats must be at least 1")
+    refs = {
+        "european": _bs_put(),
+        "lsm_python": american_option_crr(S0, K, R, SIGMA, T, n_steps=_REF_STEPS, is_call=False),
+    }
+    refs["lsm_cpp"] = refs["lsm_numba"] = refs["crr"] = refs["lsm_python"]
+    available = {case: engine_status(name)[0] for case, name in _LSM_ENGINES.items()
+                 if case in cases}
+
+    results = []
+    for case in cases:
+        for n_steps in step_counts:
+            for n_paths in ([None] if case == "crr" else path_counts):
+                row = {"case": case, "n_paths": n_paths, "n_steps": n_steps}
+                if not available.get(case, True):
+                    row["status"] = "skipped"
+                    results.append(row)
+                    if progress:
+                        progress(row)
+                    continue
+
+                tracemalloc.start()
+                _run_case(case, n_paths or 0, n_steps, seed)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+                times, prices = [], []
+                for i in range(repeats):
+                    t0 = time.perf_counter()
+                    prices.append(_run_case(case, n_paths or 0, n_steps, seed + i))
+                    times.append(time.perf_counter() - t0)
+
+                work, unit = _work(case, n_paths or 0, n_steps)
+                t_med = float(np.median(times))
+                row.update({
+                    "status": "ok",
+                    "time_s": t_med,
+                    "time_std": float(np.std(times)),
+                    "throughput": work / t_med,
+                    "unit": unit,
+                    "peak_mb": peak / 1e6,
+                    "max_rss_mb": _max_rss_mb(),
+                })
+                if prices[0] is not None:
+                    row.update({
+                        "price_mean": float(np.mean(prices)),
+                        "price_std": float(np.std(prices, ddof=1)) if repeats > 1 else 0.0,
+                        "ref": refs[case],
+                        "abs_err": abs(float(np.mean(prices)) - refs[case]),
+                    })
+                results.append(row)
+                if progress:
+                    progress(row)
+
+    return {
+        "metadata": machine_metadata(),
+        "config": {"cases": list(cases), "path_counts": list(path_counts),
+                   "step_counts": list(step_counts), "repeats": repeats, "seed": seed},
+        "results": results,
+    }
+
+
+def compare_to_baseline(report: dict, baseline: dict, threshold: float = 0.25) -> list[dict]:
+    """
+    Cases slower (median time) or heavier (peak traced memory) than the baseline.
+
+    A case regresses when a metric exceeds baseline * (1 + threshold).
+    Cases missing from either run, or skipped, are not compared. Returns
+    one dict per regression with the case, metric, both values and the ratio.
+    """
+    def key(row):
+        return row["case"], row["n_paths"], row["n_steps"]
+
+    base = {key(row): row for row in baseline["results"] if row.get("status") == "ok"}
+    regressions = []
+    for row in report["results"]:
+        old = base.get(key(row))
+        if row.get("status") != "ok" or old is None:
+            continue
+        for metric in ("time_s", "peak_mb"):
+            if old[metric] > 0 and row[metric] > old[metric] * (1.0 + threshold):
+                regressions.append({"case": row["case"], "n_paths": row["n_paths"],
+                                    "n_steps": row["n_steps"], "metric": metric,
+                                    "baseline": old[metric], "current": row[metric],
+                                    "ratio": row[metric] / old[metric]})
+    return regressions
+
+
+def save_report(report: dict, path: str | Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+
+def load_report(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text())
@@ -1,22 +1,15 @@
 import math
 
-def american_option_crr(
-    S0: float,
-    K: float,
+import numpy as np
+
+
+def _crr_params(
     r: float,
     sigma: float,
     T: float,
     n_steps: int,
-    is_call: bool,
-    q: float = 0.0,
-) -> float:
-    """
-    Cox-Ross-Rubinstein binomial tree for an American option (call/put).
-
-    Parameters
-    ----------
-    q : continuous dividend yield
-    """
+    q: float,
+) -> tuple[float, float, float, float]:
     if n_steps <= 0:
         raise ValueError("n_steps must be positive")
     if T <= 0:
@@ -36,24 +29,96 @@ def american_option_crr(
     p = (math.exp((r - q) * dt) - d) / (u - d)
     if not (0.0 <= p <= 1.0):
         raise ValueError("Invalid parameters: risk-neutral probability out of [0,1]")
+    return u, d, disc, p
+
 
-    def payoff(S: float) -> float:
-        if is_call:
-            return max(S - K, 0.0)
-        return max(K - S, 0.0)
+def american_option_crr(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    is_call: bool,
+    q: float = 0.0,
+) -> float:
+    """
+    Cox-Ross-Rubinstein binomial tree for an American option (call/put).
+
+    Parameters
+    ----------
+    q : continuous dividend yield
+    """
+    return float(american_option_crr_batch(S0, [K], r, sigma, T, n_steps, is_call, q=q)[0])
+
+
+def american_option_crr_batch(
+    S0: float,
+    strikes,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    is_call,
+    q: float = 0.0,
+) -> np.ndarray:
+    """
+    Vectorised CRR backward induction for several strikes / option types at once.
+
+    Each tree level is one array operation over all nodes and contracts. Node
+    spots S0 * u^j * d^(i-j) come from precomputed power tables and are shared
+    by every contract, and the arithmetic is done in the same order as a
+    node-by-node induction, so prices are bit-identical to pricing each
+    contract on its own.
+
+    Parameters
+    ----------
+    strikes : array-like, shape (k,)
+    is_call : bool or array-like of bool, shape (k,)
+    q : continuous dividend yield
+
+    Returns
+    -------
+    prices : ndarray, shape (k,)
+    """
+    u, d, disc, p = _crr_params(r, sigma, T, n_steps, q)
+
+    strikes = np.atleast_1d(np.asarray(strikes, dtype=float))
+    calls = np.broadcast_to(np.asarray(is_call, dtype=bool), strikes.shape)
+    K_col = strikes[:, None]
+    # payoff = max(sign * (S - K), 0); negation is exact, so puts get K - S bit for bit
+    sign = np.where(calls, 1.0, -1.0)[:, None]
+
+    # built with Python's pow (not np.power, which may differ in the last ulp)
+    u_pow = np.array([u ** j for j in range(n_steps + 1)])
+    d_pow = np.array([d ** j for j in range(n_steps + 1)])
 
     # terminal option values
-    values = [0.0] * (n_steps + 1)
-    for j in range(n_steps + 1):
-        ST = S0 * (u ** j) * (d ** (n_steps - j))
-        values[j] = payoff(ST)
+    S_lvl = S0 * u_pow * d_pow[::-1]
+    values = np.subtract(S_lvl, K_col)
+    values *= sign
+    np.maximum(values, 0.0, out=values)
+
+    cont = np.empty_like(values)
+    exer = np.empty_like(values)
 
     # backward induction with early exercise
     for i in range(n_steps - 1, -1, -1):
-        for j in range(i + 1):
-            Sij = S0 * (u ** j) * (d ** (i - j))
-            cont = disc * (p * values[j + 1] + (1.0 - p) * values[j])
-            exer = payoff(Sij)
-            values[j] = max(exer, cont)
+        n = i + 1
+        c = cont[:, :n]
+        e = exer[:, :n]
+
+        # cont = disc * (p * V[j+1] + (1 - p) * V[j])
+        np.multiply(values[:, 1:n + 1], p, out=c)
+        np.multiply(values[:, :n], 1.0 - p, out=e)
+        c += e
+        c *= disc
+
+        S_lvl = S0 * u_pow[:n] * d_pow[i::-1]
+        np.subtract(S_lvl, K_col, out=e)
+        e *= sign
+        np.maximum(e, 0.0, out=e)
+
+        np.maximum(e, c, out=values[:, :n])
 
-    return values[0]
+    return values[:, 0].copy()
@@ -0,0 +1,41 @@
+import numpy as np
+from . import _mcop_cpp
+
+
+def american_option_crr_cpp_batch(
+    S0: float,
+    strikes,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    is_call,
+    q: float = 0.0,
+    n_threads: int = 0,
+) -> np.ndarray:
+    """
+    C++ CRR binomial tree for several strikes / option types (one thread per contract).
+
+    Same arithmetic as american_option_crr_batch; agrees with it to rounding.
+    """
+    strikes = np.atleast_1d(np.asarray(strikes, dtype=float))
+    calls = np.broadcast_to(np.asarray(is_call, dtype=bool), strikes.shape)
+    return _mcop_cpp.crr_price_batch(
+        S0, strikes.tolist(), calls.tolist(), r, sigma, T, n_steps, q, n_threads
+    )
+
+
+def american_option_crr_cpp(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    is_call: bool,
+    q: float = 0.0,
+) -> float:
+    """
+    C++ Cox-Ross-Rubinstein binomial tree for an American option (call/put).
+    """
+    return float(american_option_crr_cpp_batch(S0, [K], r, sigma, T, n_steps, is_call, q=q)[0])
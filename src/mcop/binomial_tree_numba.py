@@ -0,0 +1,77 @@
+import numpy as np
+from numba import njit, prange
+
+from .american_lsm_numba import _num_threads
+from .binomial_tree import _crr_params
+
+
+@njit(parallel=True, cache=True)
+def _crr_kernel(S0, strikes, signs, u_pow, d_pow, disc, p, out):
+    n_steps = u_pow.size - 1
+    values = np.empty(n_steps + 1)
+    nxt = np.empty(n_steps + 1)
+    for c in range(strikes.size):
+        K = strikes[c]
+        sign = signs[c]
+        for j in prange(n_steps + 1):
+            values[j] = max((S0 * u_pow[j] * d_pow[n_steps - j] - K) * sign, 0.0)
+
+        # backward induction with early exercise; nodes of a level in parallel,
+        # ping-ponging between two buffers
+        for i in range(n_steps - 1, -1, -1):
+            for j in prange(i + 1):
+                cont = values[j + 1] * p
+                cont += values[j] * (1.0 - p)
+                cont *= disc
+                exer = max((S0 * u_pow[j] * d_pow[i - j] - K) * sign, 0.0)
+                nxt[j] = max(exer, cont)
+            values, nxt = nxt, values
+        out[c] = values[0]
+
+
+def american_option_crr_numba_batch(
+    S0: float,
+    strikes,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    is_call,
+    q: float = 0.0,
+    n_threads: int = 0,
+) -> np.ndarray:
+    """
+    Numba CRR binomial tree for several strikes / option types.
+
+    The nodes of each level are updated in parallel. Power tables and the
+    order of operations follow american_option_crr_batch, so prices are
+    bit-identical to it.
+    """
+    u, d, disc, p = _crr_params(r, sigma, T, n_steps, q)
+    strikes = np.atleast_1d(np.asarray(strikes, dtype=float))
+    calls = np.broadcast_to(np.asarray(is_call, dtype=bool), strikes.shape)
+    signs = np.where(calls, 1.0, -1.0)
+    # built with Python's pow, as in american_option_crr_batch
+    u_pow = np.array([u ** j for j in range(n_steps + 1)])
+    d_pow = np.array([d ** j for j in range(n_steps + 1)])
+
+    out = np.empty(strikes.size)
+    with _num_threads(n_threads):
+        _crr_kernel(float(S0), strikes, signs, u_pow, d_pow, disc, p, out)
+    return out
+
+
+def american_option_crr_numba(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    is_call: bool,
+    q: float = 0.0,
+) -> float:
+    """
+    Numba Cox-Ross-Rubinstein binomial tree for an American option (call/put).
+    """
+    return float(american_option_crr_numba_batch(S0, [K], r, sigma, T, n_steps, is_call, q=q)[0])
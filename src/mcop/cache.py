@@ -0,0 +1,143 @@
+import hashlib
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from .simulate_paths import simulate_gbm_paths
+
+
+class PathCache:
+    """
+    Simulated path sets keyed by their simulate_gbm_paths parameters.
+
+    Two tiers:
+
+    - memory: an LRU bounded by max_bytes of array data. Least recently used
+      path sets are evicted once the budget is exceeded.
+    - disk (if cache_dir is given): every simulated path set is also written
+      as a .npy file. A later process (or a memory miss) maps it back with
+      np.load(mmap_mode="r") instead of re-simulating. Mapped arrays are
+      file-backed, so they do not count against max_bytes.
+
+    Returned arrays are read-only; the LSM engines accept them (including
+    memmaps, in either layout) without copying. Only seeded simulations are
+    cached, since seed=None is meant to give fresh paths every call.
+
+    Counters: hits (memory), disk_hits, misses and evictions.
+    """
+
+    def __init__(self, max_bytes: int = 1 << 30, cache_dir: str | Path | None = None):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.max_bytes = max_bytes
+        self._mem: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(S0, r, sigma, T, n_steps, n_paths, q=0.0, seed=None, antithetic=False,
+            n_workers=None, layout="path_major", sampler="pseudo", replications=1,
+            strata=1, dtype=np.float64) -> tuple:
+        if seed is None:
+            raise ValueError("only seeded path sets can be cached")
+        # the parallel stream is the same for any thread count, but not the serial one
+        return (float(S0), float(r), float(sigma), float(T), int(n_steps), int(n_paths),
+                float(q), int(seed), bool(antithetic), n_workers is not None, layout,
+                sampler, int(replications), int(strata), np.dtype(dtype).name)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the in-memory tier."""
+        return self._bytes
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._mem),
+            "nbytes": self._bytes,
+        }
+
+    def _file(self, key: tuple) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:20]
+        return self.cache_dir / f"paths_{digest}.npy"
+
+    @staticmethod
+    def _size(paths: np.ndarray) -> int:
+        return 0 if isinstance(paths, np.memmap) else paths.nbytes
+
+    def _remember(self, key: tuple, paths: np.ndarray) -> None:
+        old = self._mem.pop(key, None)
+        if old is not None:
+            self._bytes -= self._size(old)
+        size = self._size(paths)
+        if size > self.max_bytes:
+            return
+        self._mem[key] = paths
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._mem.popitem(last=False)
+            self._bytes -= self._size(evicted)
+            self.evictions += 1
+
+    def get(self, **params) -> np.ndarray | None:
+        key = self.key(**params)
+        paths = self._mem.get(key)
+        if paths is not None:
+            self._mem.move_to_end(key)
+            self.hits += 1
+            return paths
+
+        path = self._file(key)
+        if path is not None and path.exists():
+            paths = np.load(path, mmap_mode="r")
+            self._remember(key, paths)
+            self.disk_hits += 1
+            return paths
+
+        self.misses += 1
+        return None
+
+    def put(self, paths: np.ndarray, **params) -> np.ndarray:
+        """Store paths (made read-only) under params and return them."""
+        key = self.key(**params)
+        paths.flags.writeable = False
+        path = self._file(key)
+        if path is not None:
+            # write then rename, so concurrent readers never see a partial file
+            tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+            np.save(tmp, paths)
+            os.replace(tmp, path)
+        self._remember(key, paths)
+        return paths
+
+    def get_or_simulate(self, **params) -> np.ndarray:
+        """
+        Cached paths for params, or simulate_gbm_paths(**params) stored in the cache.
+
+        Accepts the simulate_gbm_paths keyword arguments. Unseeded calls are
+        simulated and not cached.
+        """
+        if params.get("seed") is None:
+            return simulate_gbm_paths(**params)
+        paths = self.get(**params)
+        if paths is None:
+            paths = self.put(simulate_gbm_paths(**params), **params)
+        return paths
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (files in cache_dir are kept)."""
+        self._mem.clear()
+        self._bytes = 0
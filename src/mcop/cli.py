@@ -1,63 +1,440 @@
 # src/mcop/cli.py
 
 import argparse
+from contextlib import nullcontext
 
-from mcop.simulate_paths import simulate_gbm_paths
-from mcop.american_lsm import american_option_lsm
+from mcop.engines import EngineUnavailable, engine_names, get_spec, load_engine
+from mcop.simulate_paths import simulate_gbm_paths, SAMPLERS
+from mcop.variance_reduction import mc_mean_se
+
+# mcop.bench.CASES, spelled out so building the parser does not import the
+# bench module (and its POSIX-only / subprocess dependencies)
+BENCH_CASES = ("simulate", "european", "lsm_python", "lsm_cpp", "lsm_numba", "crr")
 
 
 def cmd_price(args: argparse.Namespace) -> None:
     """
-    Price an American option using LSM (Python or C++).
-    Simulates GBM paths then runs LSM backward induction.
+    Price an American option using LSM with the engine chosen from the registry.
+    Simulates GBM paths then runs LSM backward induction (fused engines do both).
     """
-    paths = simulate_gbm_paths(
-        S0=args.S0,
-        r=args.r,
-        sigma=args.sigma,
-        T=args.T,
-        n_steps=args.n_steps,
-        n_paths=args.n_paths,
-        q=args.q,
-        seed=args.seed,
-        antithetic=True,
-    )
+    adaptive = (args.target_se, args.rel_tol, args.max_seconds, args.max_paths)
+    if any(value is not None for value in adaptive):
+        _cmd_price_adaptive(args)
+        return
 
-    if args.engine == "cpp":
-        # Lazy import so Python engine works even if the C++ extension isn't built
-        try:
-            from mcop.american_lsm_cpp import american_option_lsm_cpp
-        except Exception as e:
-            raise SystemExit(
-                "C++ engine requested but C++ extension is not available.\n"
-                "Build it first (see README), or run with --engine python."
-            ) from e
-
-        price = american_option_lsm_cpp(
-            paths,
-            K=args.K,
-            r=args.r,
-            T=args.T,
-            is_call=args.call,
-            degree=args.degree,
-        )
-    else:
-        price = american_option_lsm(
-            paths,
+    se = None
+    args.engine = _resolve_engine(args.engine)
+    engine = _load_engine(args.engine)
+    caps = get_spec(args.engine).capabilities
+    if args.sampler != "antithetic" and "fused" in caps:
+        raise SystemExit(f"--sampler is not available with --engine {args.engine}")
+    profile = None
+    if args.profile is not None:
+        if "profile" not in caps:
+            raise SystemExit(f"--profile is not supported by --engine {args.engine}")
+        from mcop.profiling import LSMProfile
+        profile = LSMProfile()
+
+    if "fused" in caps:
+        # Paths are simulated inside the engine and never reach Python
+        price, se = engine(
+            S0=args.S0,
             K=args.K,
             r=args.r,
+            sigma=args.sigma,
             T=args.T,
+            n_steps=args.n_steps,
+            n_paths=args.n_paths,
             is_call=args.call,
             degree=args.degree,
             q=args.q,
+            seed=args.seed,
+            antithetic=True,
+            dtype=args.dtype,
         )
+    else:
+        with profile.phase("simulate") if profile is not None else nullcontext():
+            paths = _simulate(
+                args,
+                S0=args.S0,
+                r=args.r,
+                sigma=args.sigma,
+                T=args.T,
+                n_steps=args.n_steps,
+                n_paths=args.n_paths,
+                q=args.q,
+                seed=args.seed,
+                layout="time_major",  # the backward pass reads one time slice at a time
+                dtype=args.dtype,
+                **_sampler_kwargs(args),
+            )
+
+        if "cashflows" not in caps:
+            price = engine(
+                paths,
+                K=args.K,
+                r=args.r,
+                T=args.T,
+                is_call=args.call,
+                degree=args.degree,
+                **({"profile": profile} if profile is not None else {}),
+            )
+        else:
+            price, cashflows = engine(
+                paths,
+                K=args.K,
+                r=args.r,
+                T=args.T,
+                is_call=args.call,
+                degree=args.degree,
+                q=args.q,
+                return_cashflows=True,
+                profile=profile,
+            )
+            if args.sampler in ("lhs", "sobol"):
+                se = mc_mean_se(cashflows, replications=args.replications)[1]
+            elif args.sampler == "stratified":
+                se = mc_mean_se(cashflows, strata=args.replications)[1]
 
     opt_type = "call" if args.call else "put"
+    se_str = f" (se {se:.6f})" if se is not None else ""
     print(
-        f"American {opt_type} price (LSM, {args.engine}): {price:.6f} "
+        f"American {opt_type} price (LSM, {args.engine}): {price:.6f}{se_str} "
         f"[S0={args.S0}, K={args.K}, T={args.T}, r={args.r}, q={args.q}, sigma={args.sigma}, "
         f"steps={args.n_steps}, paths={args.n_paths}, degree={args.degree}]"
     )
+    if profile is not None:
+        if args.profile == "-":
+            print(profile.format_table())
+        else:
+            profile.to_json(args.profile)
+            print(f"Saved profile: {args.profile}")
+
+
+def cmd_greeks(args: argparse.Namespace) -> None:
+    """
+    Price and delta / gamma / vega / rho with standard errors from one set of paths.
+    """
+    from mcop.greeks import GREEKS, american_greeks, european_greeks
+
+    paths = _simulate(
+        args,
+        S0=args.S0,
+        r=args.r,
+        sigma=args.sigma,
+        T=args.T,
+        n_steps=1 if args.european else args.n_steps,
+        n_paths=args.n_paths,
+        q=args.q,
+        seed=args.seed,
+        layout="time_major",
+    )
+    if args.european:
+        g = european_greeks(paths, args.K, args.r, args.sigma, args.T, args.call, q=args.q)
+    else:
+        g = american_greeks(paths, args.K, args.r, args.sigma, args.T, args.call,
+                            degree=args.degree, q=args.q)
+
+    style = "European" if args.european else "American"
+    opt_type = "call" if args.call else "put"
+    print(f"{style} {opt_type} Greeks [S0={args.S0}, K={args.K}, T={args.T}, r={args.r}, "
+          f"q={args.q}, sigma={args.sigma}, paths={args.n_paths}]")
+    for name in GREEKS:
+        print(f"  {name:<6} {getattr(g, name):>12.6f}  (se {g.se[name]:.6f})")
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    """
+    Price every contract in a CSV / JSON / JSONL spec file, one path set per market group.
+    """
+    import sys
+    import time
+
+    from mcop.batch import price_batch, read_specs, write_results
+
+    try:
+        specs = read_specs(args.input)
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"mcop batch: {e}") from e
+
+    fmt = args.format
+    if fmt is None:
+        name = (args.output or "").lower()
+        fmt = "jsonl" if name.endswith(".jsonl") else "json" if name.endswith(".json") else "csv"
+    out = open(args.output, "w", newline="") if args.output else nullcontext(sys.stdout)
+
+    t0 = time.perf_counter()
+    groups = price_batch(specs, n_steps=args.n_steps, n_paths=args.n_paths, degree=args.degree,
+                         seed=args.seed, workers=args.workers)
+    report = sys.stderr
+    print(f"{'group':>5} {'S0':>9} {'sigma':>7} {'r':>7} {'q':>7} {'T':>6} "
+          f"{'contracts':>9} {'seconds':>8}", file=report)
+    with out as f:
+        for g in write_results(groups, f, fmt):
+            print(f"{g.group:>5} {g.S0:>9g} {g.sigma:>7g} {g.r:>7g} {g.q:>7g} {g.T:>6g} "
+                  f"{len(g.rows):>9} {g.seconds:>8.2f}", file=report)
+    elapsed = time.perf_counter() - t0
+    print(f"{len(specs)} contracts in {elapsed:.2f}s ({len(specs) / elapsed:.1f} contracts/s)",
+          file=report)
+
+
+def cmd_bench(args: argparse.Namespace) -> None:
+    """
+    Run the benchmark suite, save it as JSON and optionally check it against a baseline.
+    """
+    from mcop.bench import compare_to_baseline, load_report, run_suite, save_report
+
+    def show(row):
+        label = f"{row['case']:<11} paths={row['n_paths'] or '-':<8} steps={row['n_steps']:<5}"
+        if row["status"] != "ok":
+            print(f"{label} {row['status']}")
+            return
+        err = f" err {row['abs_err']:.5f} (sd {row['price_std']:.5f})" if "abs_err" in row else ""
+        print(f"{label} {row['time_s']:>8.4f}s  {row['throughput']:>10.3g} {row['unit']:<12} "
+              f"peak {row['peak_mb']:>7.1f} MB{err}")
+
+    baseline = None
+    if args.baseline is not None:
+        try:
+            baseline = load_report(args.baseline)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"mcop bench: cannot read baseline: {e}") from e
+
+    try:
+        report = run_suite(cases=args.cases, path_counts=args.paths, step_counts=args.steps,
+                           repeats=args.repeats, seed=args.seed, progress=show)
+    except ValueError as e:
+        raise SystemExit(f"mcop bench: {e}") from e
+    save_report(report, args.output)
+    print(f"\nSaved: {args.output}")
+
+    if baseline is None:
+        return
+    regressions = compare_to_baseline(report, baseline, threshold=args.threshold)
+    for reg in regressions:
+        print(f"REGRESSION {reg['case']} paths={reg['n_paths']} steps={reg['n_steps']} "
+              f"{reg['metric']}: {reg['baseline']:.4g} -> {reg['current']:.4g} "
+              f"({reg['ratio']:.2f}x)")
+    if regressions:
+        raise SystemExit(1)
+    print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+def _int_list(text: str) -> list[int]:
+    return [int(x) for x in text.split(",") if x]
+
+
+def _simulate(args: argparse.Namespace, **params):
+    # With --cache-dir, identical path sets are memory-mapped from disk on later runs
+    if args.cache_dir is None:
+        return simulate_gbm_paths(**params)
+    from mcop.cache import PathCache
+    return PathCache(cache_dir=args.cache_dir).get_or_simulate(**params)
+
+
+def _sampler_kwargs(args: argparse.Namespace) -> dict:
+    if args.sampler == "antithetic":
+        return {"antithetic": True, "n_workers": args.workers}
+    if args.sampler == "pseudo":
+        return {"n_workers": args.workers}
+    if args.workers is not None:
+        raise SystemExit("--workers only applies to --sampler antithetic/pseudo")
+    if args.n_paths % args.replications:
+        raise SystemExit("--n-paths must be a multiple of --replications")
+    if args.sampler == "stratified":
+        return {"sampler": "stratified", "strata": args.replications}
+    return {"sampler": args.sampler, "replications": args.replications}
+
+
+def _cmd_price_adaptive(args: argparse.Namespace) -> None:
+    """
+    Simulate in batches of --n-paths until the requested precision or budget is reached.
+    """
+    if args.profile is not None:
+        raise SystemExit("--profile is not available in adaptive mode")
+    if args.engine != "python":
+        raise SystemExit("Adaptive pricing (--target-se / --rel-tol / --max-seconds / "
+                         "--max-paths) uses the streaming Python engine; drop --engine.")
+    from mcop.adaptive import price_adaptive
+
+    res = price_adaptive(
+        S0=args.S0,
+        K=args.K,
+        r=args.r,
+        sigma=args.sigma,
+        T=args.T,
+        n_steps=args.n_steps,
+        is_call=args.call,
+        q=args.q,
+        seed=args.seed,
+        target_se=args.target_se,
+        rel_tol=args.rel_tol,
+        max_seconds=args.max_seconds,
+        max_paths=10_000_000 if args.max_paths is None else args.max_paths,
+        batch_size=args.n_paths,
+        n_train=args.n_paths,
+        degree=args.degree,
+    )
+
+    opt_type = "call" if args.call else "put"
+    print(
+        f"American {opt_type} price (LSM, adaptive): {res.price:.6f} (se {res.se:.6f}) "
+        f"95% CI [{res.ci_low:.6f}, {res.ci_high:.6f}] "
+        f"[paths={res.n_paths}, time={res.wall_time:.2f}s, stop={res.stop_reason}]"
+    )
+
+
+def cmd_convergence(args: argparse.Namespace) -> None:
+    """
+    Incremental convergence study: nested-prefix estimates from one simulation per repetition.
+    """
+    from mcop.analysis import (
+        convergence_summary, incremental_convergence, plot_convergence, write_convergence,
+    )
+
+    ref = None
+    if args.american:
+        from mcop.binomial_tree import american_option_crr
+        ref = american_option_crr(args.S0, args.K, args.r, args.sigma, args.T, n_steps=2000,
+                                  is_call=args.call, q=args.q)
+    try:
+        rows = incremental_convergence(
+            args.S0, args.K, args.r, args.sigma, args.T, args.paths, is_call=args.call,
+            american=args.american, q=args.q, n_steps=args.n_steps, degree=args.degree,
+            n_train=args.n_train, seed=args.seed, repetitions=args.repetitions,
+            workers=args.workers, block_size=args.block_size,
+        )
+        write_convergence(rows, args.output)
+    except ValueError as e:
+        raise SystemExit(f"mcop convergence: {e}") from e
+
+    summary = convergence_summary(rows)
+    style = "American (LSM policy)" if args.american else "European"
+    print(f"{style} {'call' if args.call else 'put'}, {args.repetitions} repetition(s)"
+          + (f", CRR reference {ref:.6f}" if ref is not None else ""))
+    print(f"{'paths':>10} {'price':>10} {'se':>9} {'rep std':>9} {'seconds':>8}")
+    for row in summary:
+        print(f"{row['n_paths']:>10} {row['price']:>10.6f} {row['se']:>9.6f} "
+              f"{row['rep_std']:>9.6f} {row['seconds']:>8.3f}")
+    print(f"\nSaved: {args.output}")
+
+    if args.plot is not None:
+        try:
+            plot_convergence([row["n_paths"] for row in summary],
+                             [row["price"] for row in summary],
+                             [row["se"] for row in summary], ref=ref, path=args.plot)
+        except ImportError as e:
+            raise SystemExit(f"mcop convergence: {e}") from e
+        print(f"Saved: {args.plot}")
+
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    """
+    Run a long-lived pricing server with warm path / policy / result caches.
+    """
+    import sys
+
+    from mcop.server import serve
+
+    def ready(address):
+        where = address if isinstance(address, str) else f"{address[0]}:{address[1]}"
+        print(f"mcop serve: {args.engine} engine listening on {where} "
+              f"(steps={args.n_steps}, paths={args.n_paths}, degree={args.degree})",
+              file=sys.stderr, flush=True)
+
+    args.engine = _resolve_engine(args.engine)
+    _load_engine(args.engine)
+    try:
+        serve(path=args.socket, host=args.host, port=args.port, ready=ready,
+              engine=args.engine, n_steps=args.n_steps, n_paths=args.n_paths,
+              degree=args.degree, seed=args.seed, workers=args.workers,
+              cache_bytes=int(args.cache_mb * 1e6))
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"mcop serve: {e}") from e
+    except KeyboardInterrupt:
+        pass
+
+
+def cmd_engines(args: argparse.Namespace) -> None:
+    """
+    List registered pricing engines, whether they load here, and their capabilities.
+    """
+    from mcop.engines import list_engines
+
+    rows = list_engines()
+    if args.json:
+        import json
+        print(json.dumps(rows, indent=2))
+        return
+    for row in rows:
+        status = "available" if row["available"] else "unavailable"
+        print(f"{row['name']:<10} {status:<11} {row['description']}")
+        print(f"{'':<10} capabilities: {', '.join(row['capabilities'])}")
+        if row["reason"]:
+            print(f"{'':<10} reason: {row['reason']}")
+
+
+def _resolve_engine(name: str) -> str:
+    # an engine with a fallback (e.g. numba -> python) degrades with a warning
+    # instead of failing when its backend is not installed
+    import sys
+
+    from mcop.engines import engine_status
+
+    try:
+        fallback = get_spec(name).fallback
+    except EngineUnavailable:
+        return name  # _load_engine reports it
+    ok, reason = engine_status(name)
+    if ok or fallback is None:
+        return name
+    print(f"warning: engine {name!r} is not available ({reason}); using {fallback!r}",
+          file=sys.stderr)
+    return fallback
+
+
+def _load_engine(name: str):
+    # Engines are imported on first use, so the Python engine works even if
+    # the C++ extension isn't built
+    try:
+        return load_engine(name)
+    except EngineUnavailable as e:
+        hint = ""
+        if name in engine_names():
+            hint = "Build it first (see README), or run with --engine python.\n"
+        raise SystemExit(f"{e}\n{hint}`mcop engines` lists what is available.") from e
+
+
+def _add_contract_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--S0", type=float, default=100.0, metavar="PRICE",
+                   help="Current stock price (default: 100)")
+    p.add_argument("--K", type=float, default=100.0, metavar="STRIKE",
+                   help="Strike price (default: 100)")
+    p.add_argument("--r", type=float, default=0.05, metavar="RATE",
+                   help="Annualised risk-free rate, e.g. 0.05 for 5%% (default: 0.05)")
+    p.add_argument("--q", type=float, default=0.0, metavar="YIELD",
+                   help="Continuous dividend yield (default: 0)")
+    p.add_argument("--sigma", type=float, default=0.2, metavar="VOL",
+                   help="Annualised volatility, e.g. 0.2 for 20%% (default: 0.2)")
+    p.add_argument("--T", type=float, default=1.0, metavar="YEARS",
+                   help="Time to expiry in years, e.g. 0.25 for 3 months (default: 1.0)")
+
+    p.add_argument("--n-steps", dest="n_steps", type=int, default=100, metavar="N",
+                   help="Number of time steps per path (default: 100)")
+    p.add_argument("--n-paths", dest="n_paths", type=int, default=50_000, metavar="N",
+                   help="Number of Monte Carlo paths (default: 50000)")
+    p.add_argument("--degree", type=int, default=2, metavar="D",
+                   help="Polynomial degree for LSM regression basis (default: 2)")
+    p.add_argument("--seed", type=int, default=123, metavar="SEED",
+                   help="RNG seed for reproducibility (default: 123)")
+    p.add_argument("--cache-dir", dest="cache_dir", default=None, metavar="DIR",
+                   help="Keep simulated path sets as .npy files in DIR and memory-map them "
+                        "on later runs with the same parameters")
+    p.add_argument(
+        "--call",
+        action="store_true",
+        help="Price a call (default: put)",
+    )
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -74,43 +451,176 @@ def build_parser() -> argparse.ArgumentParser:
         help="Price an American option using LSM",
     )
 
-    p_price.add_argument("--S0", type=float, default=100.0, metavar="PRICE",
-                         help="Current stock price (default: 100)")
-    p_price.add_argument("--K", type=float, default=100.0, metavar="STRIKE",
-                         help="Strike price (default: 100)")
-    p_price.add_argument("--r", type=float, default=0.05, metavar="RATE",
-                         help="Annualised risk-free rate, e.g. 0.05 for 5%% (default: 0.05)")
-    p_price.add_argument("--q", type=float, default=0.0, metavar="YIELD",
-                         help="Continuous dividend yield (default: 0)")
-    p_price.add_argument("--sigma", type=float, default=0.2, metavar="VOL",
-                         help="Annualised volatility, e.g. 0.2 for 20%% (default: 0.2)")
-    p_price.add_argument("--T", type=float, default=1.0, metavar="YEARS",
-                         help="Time to expiry in years, e.g. 0.25 for 3 months (default: 1.0)")
-
-    p_price.add_argument("--n-steps", dest="n_steps", type=int, default=100, metavar="N",
-                         help="Number of time steps per path (default: 100)")
-    p_price.add_argument("--n-paths", dest="n_paths", type=int, default=50_000, metavar="N",
-                         help="Number of Monte Carlo paths (default: 50000)")
-    p_price.add_argument("--degree", type=int, default=2, metavar="D",
-                         help="Polynomial degree for LSM regression basis (default: 2)")
-    p_price.add_argument("--seed", type=int, default=123, metavar="SEED",
-                         help="RNG seed for reproducibility (default: 123)")
+    _add_contract_args(p_price)
+    p_price.add_argument("--workers", type=int, default=None, metavar="N",
+                         help="Simulate paths on N threads using spawned RNG streams; "
+                              "results are identical for any N (default: serial)")
 
-    p_price.add_argument(
-        "--call",
-        action="store_true",
-        help="Price a call (default: put)",
-    )
+    p_price.add_argument("--dtype", choices=["float64", "float32"], default="float64",
+                         help="Path storage precision; float32 halves memory and bandwidth, "
+                              "regressions and sums stay float64 (default: float64)")
+    p_price.add_argument("--sampler", choices=("antithetic",) + SAMPLERS, default="antithetic",
+                         help="How path normals are drawn: antithetic pairs (default), plain "
+                              "pseudo-random, scrambled Sobol + Brownian bridge, Latin "
+                              "hypercube, or stratified terminal value")
+    p_price.add_argument("--replications", type=int, default=16, metavar="N",
+                         help="Independent randomizations for sobol/lhs, or number of strata "
+                              "for stratified; the Python engine then reports a valid SE "
+                              "(default: 16)")
+    p_price.add_argument("--target-se", dest="target_se", type=float, default=None, metavar="SE",
+                         help="Adaptive mode: simulate batches of --n-paths until the standard "
+                              "error is at most SE")
+    p_price.add_argument("--rel-tol", dest="rel_tol", type=float, default=None, metavar="TOL",
+                         help="Adaptive mode: stop once the 95%% half-width is at most TOL * price")
+    p_price.add_argument("--max-seconds", dest="max_seconds", type=float, default=None,
+                         metavar="S", help="Adaptive mode: wall-time budget in seconds")
+    p_price.add_argument("--max-paths", dest="max_paths", type=int, default=None,
+                         metavar="N", help="Adaptive mode: path budget (default in adaptive "
+                                           "mode: 10000000)")
+
+    p_price.add_argument("--profile", nargs="?", const="-", default=None, metavar="FILE",
+                         help="Record per-phase timings, per-step ITM counts and regression "
+                              "condition numbers; print a table, or write JSON to FILE")
 
     p_price.add_argument(
         "--engine",
-        choices=["python", "cpp"],
         default="python",
-        help="Pricing engine to use",
+        help=f"Pricing engine: {', '.join(engine_names())} or a plugin (see `mcop engines`); "
+             "cpp-fused simulates and prices entirely in C++; numba falls back to python "
+             "if Numba is not installed (default: python)",
     )
 
     p_price.set_defaults(func=cmd_price)
 
+    # ---- greeks command ----
+    p_greeks = sub.add_parser(
+        "greeks",
+        help="Price and Greeks from a single simulation (pathwise / likelihood ratio)",
+    )
+    _add_contract_args(p_greeks)
+    p_greeks.add_argument("--european", action="store_true",
+                          help="European exercise (default: American via LSM)")
+    p_greeks.set_defaults(func=cmd_greeks)
+
+    # ---- batch command ----
+    p_batch = sub.add_parser(
+        "batch",
+        help="Price many American options from a CSV / JSON / JSONL spec file",
+    )
+    p_batch.add_argument("input", metavar="SPECS",
+                         help="Contracts with columns S0, K, r, sigma, T, type (call/put) "
+                              "and optional q, id")
+    p_batch.add_argument("-o", "--output", default=None, metavar="FILE",
+                         help="Write results to FILE (default: stdout)")
+    p_batch.add_argument("--format", choices=["csv", "jsonl", "json"], default=None,
+                         help="Output format (default: from the output extension, else csv)")
+    p_batch.add_argument("--n-steps", dest="n_steps", type=int, default=100, metavar="N",
+                         help="Time steps over each contract's maturity (default: 100)")
+    p_batch.add_argument("--n-paths", dest="n_paths", type=int, default=50_000, metavar="N",
+                         help="Monte Carlo paths per group (default: 50000)")
+    p_batch.add_argument("--degree", type=int, default=2, metavar="D",
+                         help="Polynomial degree for LSM regression basis (default: 2)")
+    p_batch.add_argument("--seed", type=int, default=123, metavar="SEED",
+                         help="RNG seed, shared by all groups (default: 123)")
+    p_batch.add_argument("--workers", type=int, default=None, metavar="N",
+                         help="Price groups in N processes (default: serial)")
+    p_batch.set_defaults(func=cmd_batch)
+
+    # ---- convergence command ----
+    p_conv = sub.add_parser(
+        "convergence",
+        help="Price against path count from one incremental simulation; write CSV / JSON",
+    )
+    for flag, default, help_text in (("--S0", 100.0, "Current stock price"),
+                                     ("--K", 100.0, "Strike price"),
+                                     ("--r", 0.05, "Risk-free rate"),
+                                     ("--q", 0.0, "Continuous dividend yield"),
+                                     ("--sigma", 0.2, "Volatility"),
+                                     ("--T", 1.0, "Time to expiry in years")):
+        p_conv.add_argument(flag, type=float, default=default,
+                            help=f"{help_text} (default: {default:g})")
+    p_conv.add_argument("--call", action="store_true", help="Price a call (default: put)")
+    p_conv.add_argument("--american", action="store_true",
+                        help="American exercise via a fitted LSM policy (default: European)")
+    p_conv.add_argument("--paths", type=_int_list, default=[1_000, 10_000, 100_000, 1_000_000],
+                        metavar="N,N", help="Comma-separated path counts, even "
+                                            "(default: 1000,10000,100000,1000000)")
+    p_conv.add_argument("--n-steps", dest="n_steps", type=int, default=50, metavar="N",
+                        help="Time steps per path for --american (default: 50)")
+    p_conv.add_argument("--degree", type=int, default=2, metavar="D",
+                        help="LSM polynomial degree (default: 2)")
+    p_conv.add_argument("--n-train", dest="n_train", type=int, default=50_000, metavar="N",
+                        help="Training paths for the LSM policy (default: 50000)")
+    p_conv.add_argument("--repetitions", type=int, default=1, metavar="N",
+                        help="Independent repetitions, to check SEs against the spread "
+                             "(default: 1)")
+    p_conv.add_argument("--workers", type=int, default=None, metavar="N",
+                        help="Run repetitions in N processes (default: serial)")
+    p_conv.add_argument("--block-size", dest="block_size", type=int, default=65_536,
+                        metavar="N", help="Paths simulated at a time (default: 65536)")
+    p_conv.add_argument("--seed", type=int, default=123, metavar="SEED",
+                        help="RNG seed (default: 123)")
+    p_conv.add_argument("-o", "--output", default="artifacts/convergence.csv", metavar="FILE",
+                        help="Per-repetition rows as .csv or .json "
+                             "(default: artifacts/convergence.csv)")
+    p_conv.add_argument("--plot", default=None, metavar="FILE",
+                        help="Also save a price / CI plot to FILE (needs the plot extra)")
+    p_conv.set_defaults(func=cmd_convergence)
+
+    # ---- serve command ----
+    p_serve = sub.add_parser(
+        "serve",
+        help="Serve prices over a Unix socket or localhost TCP, keeping caches warm",
+    )
+    p_serve.add_argument("--socket", default=None, metavar="PATH",
+                         help="Listen on a Unix socket at PATH (default: TCP on --host/--port)")
+    p_serve.add_argument("--host", default="127.0.0.1", help="TCP host (default: 127.0.0.1)")
+    p_serve.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    p_serve.add_argument("--engine", default="python",
+                         help="Engine that prices path arrays, e.g. python, cpp or numba "
+                              "(default: python)")
+    p_serve.add_argument("--workers", type=int, default=None, metavar="N",
+                         help="Pricing threads (default: Python's thread pool default)")
+    p_serve.add_argument("--n-steps", dest="n_steps", type=int, default=100, metavar="N",
+                         help="Default time steps per path (default: 100)")
+    p_serve.add_argument("--n-paths", dest="n_paths", type=int, default=50_000, metavar="N",
+                         help="Default Monte Carlo paths (default: 50000)")
+    p_serve.add_argument("--degree", type=int, default=2, metavar="D",
+                         help="Default LSM polynomial degree (default: 2)")
+    p_serve.add_argument("--seed", type=int, default=123, metavar="SEED",
+                         help="Default RNG seed (default: 123)")
+    p_serve.add_argument("--cache-mb", dest="cache_mb", type=float, default=1024.0, metavar="MB",
+                         help="Memory budget for cached path sets (default: 1024)")
+    p_serve.set_defaults(func=cmd_serve)
+
+    # ---- engines command ----
+    p_engines = sub.add_parser("engines", help="List pricing engines and their capabilities")
+    p_engines.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    p_engines.set_defaults(func=cmd_engines)
+
+    # ---- bench command ----
+    p_bench = sub.add_parser(
+        "bench",
+        help="Benchmark simulation, European MC, LSM and CRR; compare against a baseline",
+    )
+    p_bench.add_argument("--cases", nargs="+", choices=BENCH_CASES, default=list(BENCH_CASES),
+                         help="Cases to run (default: all)")
+    p_bench.add_argument("--paths", type=_int_list, default=[10_000, 50_000], metavar="N,N",
+                         help="Comma-separated path counts (default: 10000,50000)")
+    p_bench.add_argument("--steps", type=_int_list, default=[50, 100], metavar="N,N",
+                         help="Comma-separated time-step counts (default: 50,100)")
+    p_bench.add_argument("--repeats", type=int, default=3, metavar="N",
+                         help="Timed runs per case, with seeds SEED, SEED+1, ... (default: 3)")
+    p_bench.add_argument("--seed", type=int, default=123, metavar="SEED",
+                         help="First RNG seed (default: 123)")
+    p_bench.add_argument("-o", "--output", default="artifacts/bench.json", metavar="FILE",
+                         help="JSON report path (default: artifacts/bench.json)")
+    p_bench.add_argument("--baseline", default=None, metavar="FILE",
+                         help="Earlier JSON report; exit with status 1 if any case regresses")
+    p_bench.add_argument("--threshold", type=float, default=0.25, metavar="FRAC",
+                         help="Allowed slowdown / memory growth vs the baseline (default: 0.25)")
+    p_bench.set_defaults(func=cmd_bench)
+
     return parser
 
 
@@ -0,0 +1,151 @@
+# Registry of LSM pricing engines. Engines are described by static metadata
+# and imported only when first used, so listing them or building the CLI
+# parser stays cheap; backends that fail to import (extension not built,
+# missing runtime) are reported as unavailable with the reason. Other
+# packages can add engines through the "mcop.engines" entry-point group,
+# each entry point resolving to an EngineSpec.
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib import import_module
+
+ENTRY_POINT_GROUP = "mcop.engines"
+
+
+class EngineUnavailable(ImportError):
+    """The requested engine is unknown or could not be imported."""
+
+
+@dataclass(frozen=True)
+class EngineSpec:
+    """
+    name : value of `mcop price --engine`
+    module, function : import path of the pricing function
+    capabilities : features the engine supports, from
+        "paths"     prices a pre-simulated path array
+        "fused"     simulates internally (no path array)
+        "float32"   single-precision paths
+        "threads"   multithreaded (n_threads argument)
+        "profile"   accepts profile= (mcop.profiling.LSMProfile)
+        "cashflows" can return per-path cashflows
+        "se"        reports a standard error
+    fallback : engine the CLI uses instead when this one cannot be loaded
+    """
+
+    name: str
+    module: str
+    function: str
+    description: str
+    capabilities: frozenset[str]
+    fallback: str | None = None
+
+
+_ENGINES: dict[str, EngineSpec] = {}
+_loaded: dict[str, Callable] = {}
+_errors: dict[str, str] = {}
+_plugins_scanned = False
+
+
+def register_engine(spec: EngineSpec, replace: bool = False) -> None:
+    if spec.name in _ENGINES and not replace:
+        raise ValueError(f"engine {spec.name!r} is already registered")
+    _ENGINES[spec.name] = spec
+    _loaded.pop(spec.name, None)
+    _errors.pop(spec.name, None)
+
+
+register_engine(EngineSpec(
+    "python", "mcop.american_lsm", "american_option_lsm",
+    "NumPy Longstaff–Schwartz (reference implementation)",
+    frozenset({"paths", "float32", "profile", "cashflows"}),
+))
+register_engine(EngineSpec(
+    "cpp", "mcop.american_lsm_cpp", "american_option_lsm_cpp",
+    "C++ / Eigen backward pass over NumPy paths (GIL released, OpenMP)",
+    frozenset({"paths", "float32", "threads", "profile"}),
+))
+register_engine(EngineSpec(
+    "cpp-fused", "mcop.american_lsm_cpp", "american_option_lsm_cpp_fused",
+    "C++ simulate-and-price (Philox RNG), no Python path matrix",
+    frozenset({"fused", "float32", "threads", "se"}),
+))
+register_engine(EngineSpec(
+    "numba", "mcop.american_lsm_numba", "american_option_lsm_numba",
+    "Numba-compiled fused backward pass over NumPy paths (parallel, no C++ toolchain)",
+    frozenset({"paths", "float32", "threads"}),
+    fallback="python",
+))
+
+
+def _scan_plugins() -> None:
+    global _plugins_scanned
+    if _plugins_scanned:
+        return
+    _plugins_scanned = True
+    from importlib.metadata import entry_points
+
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            spec = ep.load()
+        except Exception as e:  # a broken plugin must not break the CLI
+            _errors[ep.name] = f"plugin failed to load: {e}"
+            continue
+        if isinstance(spec, EngineSpec) and spec.name not in _ENGINES:
+            register_engine(spec)
+
+
+def engine_names(plugins: bool = False) -> tuple[str, ...]:
+    """Registered engine names; plugins=True also scans the entry-point group."""
+    if plugins:
+        _scan_plugins()
+    return tuple(_ENGINES)
+
+
+def get_spec(name: str) -> EngineSpec:
+    if name not in _ENGINES:
+        _scan_plugins()
+    try:
+        return _ENGINES[name]
+    except KeyError:
+        known = ", ".join(engine_names())
+        raise EngineUnavailable(f"unknown engine {name!r} (known: {known})") from None
+
+
+def load_engine(name: str) -> Callable:
+    """
+    The pricing function of engine name, importing its module on first use.
+
+    Raises EngineUnavailable (an ImportError) with the reason if the engine
+    is unknown or its module cannot be imported.
+    """
+    if name in _loaded:
+        return _loaded[name]
+    spec = get_spec(name)
+    try:
+        fn = getattr(import_module(spec.module), spec.function)
+    except Exception as e:
+        _errors[name] = f"{type(e).__name__}: {e}"
+        raise EngineUnavailable(f"engine {name!r} is not available: {_errors[name]}") from e
+    _loaded[name] = fn
+    return fn
+
+
+def engine_status(name: str) -> tuple[bool, str | None]:
+    """(available, reason if not) for engine name; tries to load it."""
+    try:
+        load_engine(name)
+    except EngineUnavailable:
+        return False, _errors.get(name, "unknown engine")
+    return True, None
+
+
+def list_engines() -> list[dict]:
+    """Name, availability, reason, capabilities and description of every engine."""
+    rows = []
+    for name in engine_names(plugins=True):
+        spec = _ENGINES[name]
+        ok, reason = engine_status(name)
+        rows.append({"name": name, "available": ok, "reason": reason,
+                     "capabilities": sorted(spec.capabilities),
+                     "description": spec.description, "fallback": spec.fallback})
+    return rows
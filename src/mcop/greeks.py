@@ -0,0 +1,134 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .american_lsm import _lsm_backward
+from .payoffs import european_call, european_call_derivative, european_put, european_put_derivative
+
+GREEKS = ("price", "delta", "gamma", "vega", "rho")
+
+
+@dataclass(frozen=True)
+class Greeks:
+    """Price and first-order Greeks (plus gamma) with their standard errors."""
+
+    price: float
+    delta: float
+    gamma: float
+    vega: float
+    rho: float
+    se: dict[str, float] = field(default_factory=dict)
+
+
+def _from_samples(samples: dict[str, np.ndarray]) -> Greeks:
+    values = {k: float(x.mean(dtype=np.float64)) for k, x in samples.items()}
+    se = {k: float(x.std(ddof=1, dtype=np.float64) / np.sqrt(x.size)) for k, x in samples.items()}
+    return Greeks(**values, se=se)
+
+
+def _pathwise_samples(
+    S0: float,
+    S: np.ndarray,
+    t: np.ndarray,
+    value: np.ndarray,
+    slope: np.ndarray,
+    score: np.ndarray,
+    r: float,
+    sigma: float,
+    q: float,
+) -> dict[str, np.ndarray]:
+    """
+    Per-path estimators for a payoff f(S_t) paid at time t (per path).
+
+    value = discounted f(S_t), slope = discounted f'(S_t). Since
+    S_t = S0 exp((r - q - sigma^2/2) t + sigma W_t):
+
+    dS_t/dS0 = S_t / S0,  dS_t/dsigma = S_t (W_t - sigma t),  dS_t/dr = t S_t.
+
+    Gamma differentiates the pathwise delta once more with the
+    likelihood-ratio method: score is d log(density) / d S0 times S0.
+    """
+    W = (np.log(S / S0) - (r - q - 0.5 * sigma**2) * t) / sigma
+    delta = slope * S / S0
+    return {
+        "price": value,
+        "delta": delta,
+        "gamma": delta / S0 * (score - 1.0),
+        "vega": slope * S * (W - sigma * t),
+        "rho": t * (slope * S - value),
+    }
+
+
+def european_greeks(
+    paths: np.ndarray,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    is_call: bool,
+    q: float = 0.0,
+) -> Greeks:
+    """
+    Price, delta, gamma, vega and rho of a European option from one set of GBM paths.
+
+    Delta, vega and rho are pathwise derivatives; gamma uses a
+    likelihood-ratio weight on the pathwise delta. Only paths[:, 0] and
+    paths[:, -1] are used (n_steps=1 paths suffice). Paths must be
+    independent draws (not antithetic pairs) for the SEs to be valid.
+    """
+    S0 = float(paths[0, 0])
+    ST = paths[:, -1]
+    disc = np.exp(-r * T)
+
+    if is_call:
+        value = disc * european_call(paths, K)
+        slope = disc * european_call_derivative(paths, K)
+    else:
+        value = disc * european_put(paths, K)
+        slope = disc * european_put_derivative(paths, K)
+
+    Z = (np.log(ST / S0) - (r - q - 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    samples = _pathwise_samples(S0, ST, np.full(ST.shape, T), value, slope,
+                                Z / (sigma * np.sqrt(T)), r, sigma, q)
+    return _from_samples(samples)
+
+
+def american_greeks(
+    paths: np.ndarray,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    is_call: bool,
+    degree: int = 2,
+    q: float = 0.0,
+    basis: str = "monomial",
+    solver: str = "lstsq",
+) -> Greeks:
+    """
+    LSM price and Greeks of an American option from one simulation.
+
+    The LSM backward pass gives each path's stopping time tau; holding the
+    exercise rule fixed (its first-order effect vanishes at the optimum),
+    the Greeks are pathwise derivatives of exp(-r tau) f(S_tau). Gamma uses
+    the likelihood-ratio score of the first step, the only one whose
+    density depends on S0, and is noticeably noisier than the other Greeks.
+    """
+    n_paths, n_cols = paths.shape
+    n_steps = n_cols - 1
+    dt = T / n_steps
+    S0 = float(paths[0, 0])
+
+    value, tau = _lsm_backward(paths, K, r, T, is_call, degree, basis, solver)
+    S = paths[np.arange(n_paths), tau]
+    t = tau * dt
+    disc = np.exp(-r * t)
+    # the stopped spots as one-column paths
+    if is_call:
+        slope = disc * european_call_derivative(S[:, None], K)
+    else:
+        slope = disc * european_put_derivative(S[:, None], K)
+
+    Z1 = (np.log(paths[:, 1] / S0) - (r - q - 0.5 * sigma**2) * dt) / (sigma * np.sqrt(dt))
+    samples = _pathwise_samples(S0, S, t, value, slope, Z1 / (sigma * np.sqrt(dt)), r, sigma, q)
+    return _from_samples(samples)
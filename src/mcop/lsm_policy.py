@@ -0,0 +1,294 @@
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from .american_lsm import _fill_basis, _lsm_backward, BASES
+from .pricing import RunningMoments, moments_price
+from .simulate_paths import iter_gbm_path_blocks
+
+
+@dataclass(frozen=True)
+class LSMPolicy:
+    """
+    Fitted Longstaff–Schwartz exercise rule.
+
+    coefficients[t] are the regression coefficients of the continuation value
+    at step t on basis(S_t); rows are NaN where no regression was fitted (no
+    exercise at that step). bounds[t] are the chebyshev bounds (NaN for other
+    bases). The contract and model parameters are kept so the policy can be
+    checked against, and cached by, the contract it prices.
+    """
+
+    K: float
+    r: float
+    T: float
+    n_steps: int
+    is_call: bool
+    degree: int
+    basis: str
+    q: float
+    sigma: float | None
+    coefficients: np.ndarray
+    bounds: np.ndarray
+
+    def continuation(self, t: int, S: np.ndarray) -> np.ndarray:
+        """Fitted continuation value at step t for spots S."""
+        beta = self.coefficients[t]
+        if np.isnan(beta[0]):
+            return np.full(S.shape, np.inf)
+        X = np.empty((self.degree + 1, S.size))
+        work = np.empty((2, S.size))
+        step_bounds = tuple(self.bounds[t]) if self.basis == "chebyshev" else None
+        _fill_basis(X, S, self.basis, self.K, work, bounds=step_bounds)
+        return beta @ X
+
+    def power_coefficients(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Express every step's continuation as a plain polynomial in z = (S - shift) * scale.
+
+        Returns (coef (n_steps+1, degree+1), shift (n_steps+1,), scale (n_steps+1,)),
+        the form consumed by the C++ engine.
+        """
+        from numpy.polynomial import chebyshev, laguerre
+
+        n = self.n_steps + 1
+        coef = np.full((n, self.degree + 1), np.nan)
+        shift = np.zeros(n)
+        scale = np.ones(n) if self.basis == "monomial" else np.full(n, 1.0 / self.K)
+
+        for t in range(n):
+            beta = self.coefficients[t]
+            if np.isnan(beta[0]):
+                continue
+            if self.basis in ("monomial", "scaled"):
+                c = beta
+            elif self.basis == "laguerre":
+                c = laguerre.lag2poly(beta)
+            else:
+                lo, hi = self.bounds[t]
+                half = 0.5 * (hi - lo)
+                c = chebyshev.cheb2poly(beta)
+                shift[t] = 0.5 * (hi + lo)
+                scale[t] = 1.0 / half if half > 0.0 else 0.0
+            coef[t, :len(c)] = c
+            coef[t, len(c):] = 0.0
+        return coef, shift, scale
+
+    def save(self, path) -> None:
+        """Write the policy to a small .npz file."""
+        np.savez_compressed(
+            path,
+            K=self.K, r=self.r, T=self.T, n_steps=self.n_steps, is_call=self.is_call,
+            degree=self.degree, basis=self.basis, q=self.q,
+            sigma=np.nan if self.sigma is None else self.sigma,
+            coefficients=self.coefficients, bounds=self.bounds,
+        )
+
+    @classmethod
+    def load(cls, path) -> "LSMPolicy":
+        with np.load(path) as f:
+            sigma = float(f["sigma"])
+            return cls(
+                K=float(f["K"]), r=float(f["r"]), T=float(f["T"]), n_steps=int(f["n_steps"]),
+                is_call=bool(f["is_call"]), degree=int(f["degree"]), basis=str(f["basis"]),
+                q=float(f["q"]), sigma=None if np.isnan(sigma) else sigma,
+                coefficients=f["coefficients"], bounds=f["bounds"],
+            )
+
+
+def fit_lsm_policy(
+    paths: np.ndarray,
+    K: float,
+    r: float,
+    T: float,
+    is_call: bool,
+    degree: int = 2,
+    q: float = 0.0,
+    basis: str = "scaled",
+    solver: str = "lstsq",
+    sigma: float | None = None,
+) -> LSMPolicy:
+    """
+    Run the LSM backward pass on training paths and keep the per-step coefficients.
+
+    The default "scaled" basis (powers of S / K) makes the rule depend on
+    moneyness, so it stays valid after small spot moves.
+    """
+    n_steps = paths.shape[1] - 1
+    coefficients = np.full((n_steps + 1, degree + 1), np.nan)
+    bounds = np.full((n_steps + 1, 2), np.nan)
+    _lsm_backward(paths, K, r, T, is_call, degree, basis, solver,
+                  coefficients=coefficients, bounds=bounds)
+    return LSMPolicy(
+        K=float(K), r=float(r), T=float(T), n_steps=n_steps, is_call=bool(is_call),
+        degree=degree, basis=basis, q=float(q), sigma=sigma,
+        coefficients=coefficients, bounds=bounds,
+    )
+
+
+def policy_cashflows(policy: LSMPolicy, paths: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """
+    Discounted (to time 0) cashflow of each path when following the policy.
+
+    Walks backwards and overwrites, so each path ends up with its earliest
+    exercise. No regression is done. The spots are paths * scale, applied
+    one step at a time (e.g. unit-spot paths priced at S0 without a scaled
+    copy of the path matrix).
+    """
+    n_paths, n_cols = paths.shape
+    if n_cols - 1 != policy.n_steps:
+        raise ValueError("paths must have the policy's n_steps + 1 columns")
+
+    n_steps = policy.n_steps
+    dt = policy.T / n_steps
+    K = policy.K
+
+    def payoff(S):
+        if policy.is_call:
+            return np.maximum(S - K, 0.0)
+        return np.maximum(K - S, 0.0)
+
+    def spots(t):
+        return paths[:, t] if scale == 1.0 else paths[:, t] * scale
+
+    cashflow = payoff(spots(-1)) * np.exp(-policy.r * n_steps * dt)
+    for t in range(n_steps - 1, 0, -1):
+        if np.isnan(policy.coefficients[t, 0]):
+            continue
+        St = spots(t)
+        immediate = payoff(St)
+        itm = np.flatnonzero(immediate > 0.0)
+        if itm.size == 0:
+            continue
+        cont = policy.continuation(t, St[itm])
+        ex = itm[immediate[itm] > cont]
+        cashflow[ex] = immediate[ex] * np.exp(-policy.r * t * dt)
+    return cashflow
+
+
+def price_with_policy(
+    policy: LSMPolicy,
+    paths: np.ndarray | Iterable[np.ndarray],
+    antithetic: bool = False,
+) -> tuple[float, float, float, float]:
+    """
+    Out-of-sample price: apply a fitted policy to independent paths.
+
+    paths is either one (n_paths, n_steps+1) array or an iterable of path
+    blocks (e.g. iter_gbm_path_blocks), consumed in one streaming pass.
+    With antithetic, paths (2j, 2j+1) of every block are mirrored pairs, as
+    from iter_gbm_path_blocks(..., antithetic=True); the SE is then taken
+    over the pair means and blocks must have an even number of paths.
+
+    Returns (price, se, ci_low, ci_high). Since the rule is fixed, the
+    estimate is a low-biased lower bound, unlike the in-sample LSM price.
+    """
+    if isinstance(paths, np.ndarray):
+        paths = [paths]
+    acc = RunningMoments()
+    for block in paths:
+        x = policy_cashflows(policy, block)
+        if antithetic:
+            if x.size % 2:
+                raise ValueError("path blocks must hold whole antithetic pairs")
+            x = 0.5 * (x[0::2] + x[1::2])
+        acc.update(x)
+    return moments_price(acc)
+
+
+def american_option_lsm_oos(
+    S0: float,
+    policy: LSMPolicy,
+    sigma: float,
+    n_paths: int,
+    q: float | None = None,
+    seed: int | None = None,
+    antithetic: bool = True,
+    block_size: int = 65_536,
+) -> tuple[float, float, float, float]:
+    """
+    Simulate fresh paths block by block and price them with a fitted policy.
+
+    Memory is bounded by block_size. With antithetic, n_paths must be even
+    and the SE comes from the pair means. Returns (price, se, ci_low, ci_high).
+    """
+    if antithetic and n_paths % 2:
+        raise ValueError("n_paths must be even when antithetic=True")
+    q = policy.q if q is None else q
+    blocks = iter_gbm_path_blocks(
+        S0, policy.r, sigma, policy.T, policy.n_steps, n_paths,
+        block_size=block_size, q=q, seed=seed, antithetic=antithetic,
+    )
+    return price_with_policy(policy, blocks, antithetic=antithetic)
+
+
+class PolicyCache:
+    """
+    Policies keyed by contract and model parameters (spot excluded).
+
+    Repricing after a small spot move hits the cache and skips every
+    regression. If cache_dir is given, policies are also persisted there as
+    .npz files and found again by later processes.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None):
+        self._mem: dict[tuple, LSMPolicy] = {}
+        self.cache_dir = None if cache_dir is None else Path(cache_dir)
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(K, r, T, n_steps, is_call, degree=2, basis="scaled", q=0.0, sigma=None) -> tuple:
+        if basis not in BASES:
+            raise ValueError(f"basis must be one of {BASES}")
+        return (float(K), float(r), float(T), int(n_steps), bool(is_call), int(degree),
+                basis, float(q), None if sigma is None else float(sigma))
+
+    def _file(self, key: tuple) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:20]
+        return self.cache_dir / f"policy_{digest}.npz"
+
+    def get(self, **params) -> LSMPolicy | None:
+        key = self.key(**params)
+        policy = self._mem.get(key)
+        if policy is None:
+            path = self._file(key)
+            if path is not None and path.exists():
+                policy = LSMPolicy.load(path)
+                self._mem[key] = policy
+        if policy is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return policy
+
+    def put(self, policy: LSMPolicy) -> None:
+        key = self.key(policy.K, policy.r, policy.T, policy.n_steps, policy.is_call,
+                       policy.degree, policy.basis, policy.q, policy.sigma)
+        self._mem[key] = policy
+        path = self._file(key)
+        if path is not None:
+            policy.save(path)
+
+    def get_or_fit(self, paths_factory, **params) -> LSMPolicy:
+        """
+        Cached policy for params, or fit one on paths_factory() and store it.
+        """
+        policy = self.get(**params)
+        if policy is None:
+            policy = fit_lsm_policy(
+                paths_factory(), params["K"], params["r"], params["T"], params["is_call"],
+                degree=params.get("degree", 2), q=params.get("q", 0.0),
+                basis=params.get("basis", "scaled"), sigma=params.get("sigma"),
+            )
+            if policy.n_steps != params["n_steps"]:
+                raise ValueError("training paths do not match n_steps")
+            self.put(policy)
+        return policy
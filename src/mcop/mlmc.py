@@ -0,0 +1,213 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+SCHEMES = ("euler", "milstein")
+
+
+@dataclass(frozen=True)
+class MLMCLevel:
+    """Statistics of one MLMC level (level 0: P_0, level l > 0: P_l - P_{l-1})."""
+
+    level: int
+    n_steps: int
+    n_samples: int
+    mean: float
+    variance: float
+    cost_per_sample: float  # time steps simulated per sample (fine + coarse)
+    wall_time: float
+
+
+@dataclass(frozen=True)
+class MLMCResult:
+    price: float
+    se: float
+    rmse: float  # requested
+    levels: list[MLMCLevel]
+    total_cost: float  # time steps simulated over all levels
+    wall_time: float
+    converged: bool  # False if max_level was reached with the bias test still failing
+
+
+def _scheme_paths(S0: float, mu: float, sigma: float, dt: float, dW: np.ndarray,
+                  scheme: str) -> np.ndarray:
+    """Euler or Milstein GBM paths (n, n_steps + 1) driven by Brownian increments dW."""
+    n, n_steps = dW.shape
+    paths = np.empty((n, n_steps + 1))
+    paths[:, 0] = S0
+    S = paths[:, 0]
+    for k in range(n_steps):
+        step = 1.0 + mu * dt + sigma * dW[:, k]
+        if scheme == "milstein":
+            step += 0.5 * sigma**2 * (dW[:, k] ** 2 - dt)
+        S = S * step
+        paths[:, k + 1] = S
+    return paths
+
+
+def mlmc_level(
+    payoff: Callable[[np.ndarray], np.ndarray],
+    level: int,
+    n: int,
+    rng: np.random.Generator,
+    S0: float,
+    r: float,
+    sigma: float,
+    T: float,
+    q: float = 0.0,
+    base_steps: int = 1,
+    M: int = 2,
+    scheme: str = "milstein",
+) -> np.ndarray:
+    """
+    n discounted samples of the level-l correction.
+
+    Level l uses base_steps * M**l time steps. For l > 0 the coarse path
+    (base_steps * M**(l-1) steps) is driven by sums of the same fine
+    Brownian increments, so P_l - P_{l-1} has small variance.
+    """
+    nf = base_steps * M**level
+    dtf = T / nf
+    mu = r - q
+    disc = np.exp(-r * T)
+
+    dW = rng.standard_normal((n, nf)) * np.sqrt(dtf)
+    fine = disc * payoff(_scheme_paths(S0, mu, sigma, dtf, dW, scheme))
+    if level == 0:
+        return fine
+
+    dWc = dW.reshape(n, nf // M, M).sum(axis=2)
+    coarse = disc * payoff(_scheme_paths(S0, mu, sigma, dtf * M, dWc, scheme))
+    return fine - coarse
+
+
+def mlmc_price(
+    payoff: Callable[[np.ndarray], np.ndarray],
+    S0: float,
+    r: float,
+    sigma: float,
+    T: float,
+    rmse: float,
+    q: float = 0.0,
+    seed: int | None = None,
+    scheme: str = "milstein",
+    base_steps: int = 1,
+    M: int = 2,
+    min_level: int = 2,
+    max_level: int = 10,
+    n_initial: int = 10_000,
+    batch_size: int = 50_000,
+) -> MLMCResult:
+    """
+    Multilevel Monte Carlo price of E[exp(-rT) payoff(paths)] to a target RMSE.
+
+    payoff takes a path array (n, n_steps + 1) like the functions in
+    mcop.payoffs (e.g. functools.partial(european_call, K=100)), so
+    path-dependent payoffs work as well.
+
+    GBM is discretized with a non-exact scheme (Euler or Milstein) on level
+    l with base_steps * M**l steps. Following Giles (2008):
+
+    1. n_initial samples on each level give V_l (variance) and C_l (cost).
+    2. N_l = sqrt(V_l / C_l) * sum_k sqrt(V_k C_k) / (rmse^2 / 2) samples
+       keep the statistical error below rmse / sqrt(2).
+    3. The weak order is estimated from the level means; if the remaining
+       bias exceeds rmse / sqrt(2) another level is added (up to max_level).
+
+    Costs are counted in simulated time steps (deterministic); per-level
+    wall time is reported alongside. Samples are drawn in batches of at
+    most batch_size paths.
+    """
+    if scheme not in SCHEMES:
+        raise ValueError(f"scheme must be one of {SCHEMES}")
+    if rmse <= 0:
+        raise ValueError("rmse must be positive")
+    if not 1 <= min_level <= max_level:
+        raise ValueError("need 1 <= min_level <= max_level")
+    if M < 2 or base_steps < 1:
+        raise ValueError("M must be at least 2 and base_steps at least 1")
+
+    t_start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    kw = dict(S0=S0, r=r, sigma=sigma, T=T, q=q, base_steps=base_steps, M=M, scheme=scheme)
+
+    def cost(level):
+        nf = base_steps * M**level
+        return nf + (nf // M if level > 0 else 0)
+
+    # running sums per level: count, sum, sum of squares, wall time
+    n_done, s1, s2, wall = [], [], [], []
+
+    def add_level():
+        for lst in (n_done, s1, s2, wall):
+            lst.append(0)
+
+    for _ in range(min_level + 1):
+        add_level()
+    extra = [n_initial] * (min_level + 1)
+
+    def stats():
+        n = np.maximum(np.array(n_done, dtype=float), 1.0)
+        mean = np.array(s1) / n
+        var = np.maximum(np.array(s2) / n - mean**2, 0.0) * n / np.maximum(n - 1, 1.0)
+        return mean, var
+
+    converged = False
+    while True:
+        # draw the outstanding samples, batch by batch
+        for level, dn in enumerate(extra):
+            t0 = time.perf_counter()
+            while dn > 0:
+                m = min(dn, batch_size)
+                y = mlmc_level(payoff, level, m, rng, **kw)
+                n_done[level] += m
+                s1[level] += float(y.sum())
+                s2[level] += float(np.dot(y, y))
+                dn -= m
+            wall[level] += time.perf_counter() - t0
+
+        mean, var = stats()
+        L = len(n_done) - 1
+        C = np.array([cost(level) for level in range(L + 1)], dtype=float)
+
+        # optimal allocation for a statistical error of rmse / sqrt(2)
+        N_opt = np.ceil(np.sqrt(var / C) * np.sum(np.sqrt(var * C)) / (0.5 * rmse**2))
+        extra = np.maximum(0, N_opt.astype(int) - np.array(n_done)).tolist()
+        if any(dn > 0.01 * n for dn, n in zip(extra, n_done)):
+            continue
+
+        # bias test on the last two levels, with the weak order from a fit of log|mean|
+        alpha = 1.0
+        if L >= 2:
+            slope = np.polyfit(np.arange(1, L + 1), np.log(np.abs(mean[1:]) + 1e-300) / np.log(M), 1)[0]
+            alpha = max(0.5, -slope)
+        bias = max(abs(mean[L]), abs(mean[L - 1]) / M**alpha) / (M**alpha - 1.0)
+        if bias <= rmse / np.sqrt(2.0):
+            converged = True
+            break
+        if L == max_level:
+            break
+
+        # add a finer level with n_initial pilot samples
+        add_level()
+        extra = extra + [n_initial]
+
+    mean, var = stats()
+    n = np.array(n_done, dtype=float)
+    levels = [
+        MLMCLevel(level=level, n_steps=base_steps * M**level, n_samples=int(n_done[level]),
+                  mean=float(mean[level]), variance=float(var[level]),
+                  cost_per_sample=float(cost(level)), wall_time=wall[level])
+        for level in range(len(n_done))
+    ]
+    return MLMCResult(
+        price=float(mean.sum()),
+        se=float(np.sqrt(np.sum(var / n))),
+        rmse=rmse,
+        levels=levels,
+        total_cost=float(sum(cost(level) * n_done[level] for level in range(len(n_done)))),
+        wall_time=time.perf_counter() - t_start,
+        converged=converged,
+    )
@@ -0,0 +1,242 @@
+from collections.abc import Sequence
+
+import numpy as np
+from scipy.special import ndtr
+
+from .simulate_paths import iter_gbm_steps
+from .variance_reduction import control_variate_adjustment
+
+BARRIER_KINDS = ("up-and-out", "up-and-in", "down-and-out", "down-and-in")
+
+# Broadie–Glasserman–Kou continuity correction, zeta(1/2) / sqrt(2 pi)
+_BGK_BETA = 0.5826
+
+
+def _vanilla(S: np.ndarray, K: float, is_call: bool) -> np.ndarray:
+    return np.maximum(S - K, 0.0) if is_call else np.maximum(K - S, 0.0)
+
+
+class AsianAccumulator:
+    """
+    Asian option on the arithmetic or geometric average of S(t_1), ..., S(t_n).
+
+    Keeps one running sum per path (of S, or of log S for the geometric
+    average); S(t_0) is not part of the average.
+    """
+
+    def __init__(self, K: float, is_call: bool, average: str = "arithmetic"):
+        if average not in ("arithmetic", "geometric"):
+            raise ValueError("average must be 'arithmetic' or 'geometric'")
+        self.K = K
+        self.is_call = is_call
+        self.average = average
+
+    def start(self, S: np.ndarray) -> None:
+        self._sum = np.zeros(S.shape[0])
+        self._n = 0
+
+    def update(self, S_prev: np.ndarray, S: np.ndarray, dt: float) -> None:
+        self._sum += np.log(S) if self.average == "geometric" else S
+        self._n += 1
+
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        avg = self._sum / self._n
+        if self.average == "geometric":
+            avg = np.exp(avg)
+        return _vanilla(avg, self.K, self.is_call)
+
+
+class BarrierAccumulator:
+    """
+    Knock-in / knock-out barrier option with a vanilla payoff at expiry.
+
+    Without sigma the barrier is monitored at the simulation dates only.
+    With sigma, each step multiplies a per-path survival probability by
+    1 - P(the Brownian bridge between S_prev and S crosses the barrier),
+
+        P = exp(-2 log(S_prev / B) log(S / B) / (sigma^2 dt)),
+
+    which prices the continuously monitored barrier without discretization
+    bias (and with lower variance than sampling the crossing). Knock-in
+    payoffs are vanilla * (1 - survival), so in + out = vanilla path by path.
+    """
+
+    def __init__(self, K: float, barrier: float, is_call: bool, kind: str = "down-and-out",
+                 sigma: float | None = None):
+        if kind not in BARRIER_KINDS:
+            raise ValueError(f"kind must be one of {BARRIER_KINDS}")
+        self.K = K
+        self.barrier = barrier
+        self.is_call = is_call
+        self.kind = kind
+        self.sigma = sigma
+
+    def _breached(self, S: np.ndarray) -> np.ndarray:
+        return S >= self.barrier if self.kind.startswith("up") else S <= self.barrier
+
+    def start(self, S: np.ndarray) -> None:
+        self._alive = np.where(self._breached(S), 0.0, 1.0)
+
+    def update(self, S_prev: np.ndarray, S: np.ndarray, dt: float) -> None:
+        self._alive[self._breached(S)] = 0.0
+        if self.sigma is not None:
+            # an endpoint on the far side (log product <= 0) means a sure crossing
+            log_prod = np.log(S_prev / self.barrier) * np.log(S / self.barrier)
+            np.maximum(log_prod, 0.0, out=log_prod)
+            self._alive *= -np.expm1(-2.0 * log_prod / (self.sigma**2 * dt))
+
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        weight = self._alive if self.kind.endswith("out") else 1.0 - self._alive
+        return weight * _vanilla(S_T, self.K, self.is_call)
+
+
+class LookbackAccumulator:
+    """
+    Lookback option on the running maximum / minimum (including S(t_0)).
+
+    K=None gives the floating-strike payoffs S_T - min (call) and max - S_T
+    (put); otherwise the fixed-strike max(max - K, 0) (call) and
+    max(K - min, 0) (put). With sigma, the discretely monitored extremes are
+    shifted by exp(+-0.5826 sigma sqrt(dt)) (Broadie–Glasserman–Kou) to
+    approximate continuous monitoring.
+    """
+
+    def __init__(self, is_call: bool, K: float | None = None, sigma: float | None = None):
+        self.is_call = is_call
+        self.K = K
+        self.sigma = sigma
+
+    def start(self, S: np.ndarray) -> None:
+        self._max = S.astype(float)
+        self._min = S.astype(float)
+        self._dt = None
+
+    def update(self, S_prev: np.ndarray, S: np.ndarray, dt: float) -> None:
+        np.maximum(self._max, S, out=self._max)
+        np.minimum(self._min, S, out=self._min)
+        self._dt = dt
+
+    def payoff(self, S_T: np.ndarray) -> np.ndarray:
+        hi, lo = self._max, self._min
+        if self.sigma is not None and self._dt is not None:
+            shift = np.exp(_BGK_BETA * self.sigma * np.sqrt(self._dt))
+            hi, lo = hi * shift, lo / shift
+        if self.K is None:
+            return S_T - lo if self.is_call else hi - S_T
+        return _vanilla(hi, self.K, True) if self.is_call else _vanilla(lo, self.K, False)
+
+
+def _run(accumulators: Sequence, S_start: np.ndarray, steps, dt: float) -> list[np.ndarray]:
+    # accumulator protocol: start(S_0), update(S_prev, S, dt) per step, payoff(S_T)
+    for acc in accumulators:
+        acc.start(S_start)
+    S_prev = S_start
+    for S in steps:
+        for acc in accumulators:
+            acc.update(S_prev, S, dt)
+        S_prev = S
+    return [acc.payoff(S_prev) for acc in accumulators]
+
+
+def simulate_path_payoffs(
+    accumulators: Sequence,
+    S0: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    n_paths: int,
+    q: float = 0.0,
+    seed: int | None = None,
+    antithetic: bool = False,
+) -> list[np.ndarray]:
+    """
+    Undiscounted payoffs of each accumulator over GBM paths generated step by step.
+
+    Paths come from iter_gbm_steps and are never stored: memory is
+    O(n_paths) per accumulator, independent of n_steps. Several
+    accumulators share one simulation (e.g. an option and its control).
+    """
+    steps = iter_gbm_steps(S0, r, sigma, T, n_steps, n_paths, q=q, seed=seed,
+                           antithetic=antithetic)
+    return _run(accumulators, np.full(n_paths, float(S0)), steps, T / n_steps)
+
+
+def accumulate_paths(accumulators: Sequence, paths: np.ndarray, T: float) -> list[np.ndarray]:
+    """
+    Undiscounted payoffs of each accumulator over an existing (n_paths, n_steps + 1) array.
+
+    Reads one column at a time, so a time-major memmap is streamed from disk.
+    """
+    n_steps = paths.shape[1] - 1
+    steps = (np.asarray(paths[:, t], dtype=float) for t in range(1, n_steps + 1))
+    return _run(accumulators, np.asarray(paths[:, 0], dtype=float), steps, T / n_steps)
+
+
+def geometric_asian_price(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    is_call: bool,
+    q: float = 0.0,
+) -> float:
+    """
+    Closed-form price of the discretely monitored geometric Asian option.
+
+    The average is over S(t_1), ..., S(t_n) with t_i = i T / n, as in
+    AsianAccumulator. log G is normal with mean
+    log S0 + (r - q - sigma^2/2) T (n+1)/(2n) and variance
+    sigma^2 T (n+1)(2n+1)/(6n^2).
+    """
+    n = n_steps
+    m = np.log(S0) + (r - q - 0.5 * sigma**2) * T * (n + 1) / (2 * n)
+    v = sigma**2 * T * (n + 1) * (2 * n + 1) / (6 * n**2)
+    sd = np.sqrt(v)
+    d1 = (m - np.log(K) + v) / sd
+    d2 = d1 - sd
+    forward = np.exp(m + 0.5 * v)
+    if is_call:
+        value = forward * ndtr(d1) - K * ndtr(d2)
+    else:
+        value = K * ndtr(-d2) - forward * ndtr(-d1)
+    return float(np.exp(-r * T) * value)
+
+
+def arithmetic_asian_price(
+    S0: float,
+    K: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    n_paths: int,
+    is_call: bool,
+    q: float = 0.0,
+    seed: int | None = None,
+    control_variate: bool = True,
+) -> tuple[float, float]:
+    """
+    Arithmetic Asian price and SE from a streaming simulation.
+
+    With control_variate, the geometric Asian payoff on the same paths is
+    the control (its mean is geometric_asian_price) and the estimate comes
+    from control_variate_adjustment. The two averages are almost perfectly
+    correlated, so the SE typically drops by one to two orders of magnitude.
+    """
+    accs = [AsianAccumulator(K, is_call)]
+    if control_variate:
+        accs.append(AsianAccumulator(K, is_call, average="geometric"))
+    disc = np.exp(-r * T)
+    payoffs = simulate_path_payoffs(accs, S0, r, sigma, T, n_steps, n_paths, q=q, seed=seed)
+    x = disc * payoffs[0]
+    if not control_variate:
+        return float(x.mean()), float(x.std(ddof=1) / np.sqrt(n_paths))
+
+    y = disc * payoffs[1]
+    y_mean = geometric_asian_price(S0, K, r, sigma, T, n_steps, is_call, q=q)
+    price, beta = control_variate_adjustment(x, y, y_mean)
+    se = float((x - beta * y).std(ddof=1) / np.sqrt(n_paths))
+    return price, se
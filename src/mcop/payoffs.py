@@ -7,3 +7,13 @@ def european_call(paths: np.ndarray, K: float) -> np.ndarray:
 def european_put(paths: np.ndarray, K: float) -> np.ndarray:
     ST = paths[:, -1]
     return np.maximum(K - ST, 0.0)
+
+def european_call_derivative(paths: np.ndarray, K: float) -> np.ndarray:
+    """d payoff / d S_T for a call (pathwise Greeks)."""
+    ST = paths[:, -1]
+    return (ST > K).astype(float)
+
+def european_put_derivative(paths: np.ndarray, K: float) -> np.ndarray:
+    """d payoff / d S_T for a put (pathwise Greeks)."""
+    ST = paths[:, -1]
+    return -(ST < K).astype(float)
@@ -1,19 +1,187 @@
+from collections.abc import Iterable
+
 import numpy as np
 
-def mc_price(payoffs: np.ndarray, r: float, T: float) -> tuple[float, float, float, float]:
+_Z_975 = 1.959963984540054  # ~N(0,1) 97.5% quantile
+
+
+def mc_price(
+    payoffs: np.ndarray,
+    r: float,
+    T: float,
+    replications: int = 1,
+    strata: int = 1,
+) -> tuple[float, float, float, float]:
     """
     Discounted Monte Carlo estimator with standard error and 95% CI (normal approx).
 
+    With replications > 1 the payoffs are taken as that many consecutive,
+    equally sized, independent replications (e.g. randomized QMC from
+    simulate_gbm_paths(..., sampler="sobol", replications=...)). The SE then
+    comes from the spread of the replication means, since points within a
+    replication are not independent.
+
+    With strata > 1 the payoffs are taken as that many consecutive, equally
+    sized strata of equal probability (simulate_gbm_paths(...,
+    sampler="stratified", strata=...)) and the SE is the stratified one,
+    built from the within-stratum variances.
+
     Returns (price, se, ci_low, ci_high)
     """
     disc = np.exp(-r * T)
     x = disc * payoffs
 
-    price = float(x.mean())
-    s = float(x.std(ddof=1))
-    se = s / np.sqrt(x.size)
+    # float64 accumulation, also for float32 payoffs
+    price = float(x.mean(dtype=np.float64))
+    if replications > 1:
+        se = _replication_se(x, replications)
+    elif strata > 1:
+        se = _stratified_se(x, strata)
+    else:
+        s = float(x.std(ddof=1, dtype=np.float64))
+        se = s / np.sqrt(x.size)
+
+    ci_low = price - _Z_975 * se
+    ci_high = price + _Z_975 * se
+    return price, se, ci_low, ci_high
+
+
+def _replication_se(x: np.ndarray, replications: int) -> float:
+    if replications < 2 or x.size % replications:
+        raise ValueError("replications must be at least 2 and divide the number of samples")
+    means = x.reshape(replications, -1).mean(axis=1, dtype=np.float64)
+    return float(means.std(ddof=1)) / np.sqrt(replications)
+
+
+def _stratified_se(x: np.ndarray, strata: int) -> float:
+    """SE of the mean over equiprobable, equally sized strata (proportional allocation)."""
+    if x.size % strata or x.size // strata < 2:
+        raise ValueError("strata must divide the number of samples, with at least 2 per stratum")
+    var = x.reshape(strata, -1).var(axis=1, ddof=1, dtype=np.float64)
+    return float(np.sqrt(var.sum() / x.size)) / np.sqrt(strata)
+
+
+def _mirrored_pair_means(x: np.ndarray) -> np.ndarray:
+    """
+    Means of the antithetic pairs (i, i + m) of simulate_gbm_paths(...,
+    antithetic=True) along the last axis, m = ceil(n / 2). With odd n the
+    unpaired sample m - 1 is kept as is.
+    """
+    n = x.shape[-1]
+    m = (n + 1) // 2
+    out = np.array(x[..., :m], dtype=np.float64)
+    out[..., : n - m] += x[..., m:]
+    out[..., : n - m] *= 0.5
+    return out
+
+
+class RunningMoments:
+    """
+    Online mean / variance accumulator (Welford, merged window by window).
+
+    Samples are folded in fixed windows of `window` values using the pairwise
+    update of Chan et al., so the result only depends on the sample sequence,
+    not on how it was split across update() calls.
+    """
+
+    def __init__(self, window: int = 4096):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._buf = np.empty(window, dtype=float)
+        self._buf_n = 0
+
+    @staticmethod
+    def _merge(n_a, mean_a, m2_a, x):
+        n_b = x.size
+        mean_b = float(x.mean())
+        m2_b = float(np.sum((x - mean_b) ** 2))
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        mean = mean_a + delta * n_b / n
+        m2 = m2_a + m2_b + delta * delta * n_a * n_b / n
+        return n, mean, m2
+
+    def update(self, x: np.ndarray) -> None:
+        x = np.asarray(x, dtype=float).ravel()
+        w = self.window
+
+        if self._buf_n:
+            take = min(w - self._buf_n, x.size)
+            self._buf[self._buf_n:self._buf_n + take] = x[:take]
+            self._buf_n += take
+            x = x[take:]
+            if self._buf_n < w:
+                return
+            self._n, self._mean, self._m2 = self._merge(self._n, self._mean, self._m2, self._buf)
+            self._buf_n = 0
+
+        n_full = (x.size // w) * w
+        for start in range(0, n_full, w):
+            self._n, self._mean, self._m2 = self._merge(
+                self._n, self._mean, self._m2, x[start:start + w]
+            )
+
+        tail = x.size - n_full
+        self._buf[:tail] = x[n_full:]
+        self._buf_n = tail
+
+    def _state(self) -> tuple[int, float, float]:
+        if self._buf_n == 0:
+            return self._n, self._mean, self._m2
+        return self._merge(self._n, self._mean, self._m2, self._buf[:self._buf_n])
+
+    @property
+    def count(self) -> int:
+        return self._n + self._buf_n
+
+    @property
+    def mean(self) -> float:
+        return self._state()[1]
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1)."""
+        n, _, m2 = self._state()
+        if n < 2:
+            return float("nan")
+        return m2 / (n - 1)
+
+
+def mc_price_stream(
+    payoff_blocks: Iterable[np.ndarray],
+    r: float,
+    T: float,
+) -> tuple[float, float, float, float]:
+    """
+    Streaming counterpart of mc_price: consumes payoff blocks one at a time.
+
+    Memory is bounded by the largest block. For the same sequence of payoffs
+    the result is identical whatever the block sizes were.
+
+    Returns (price, se, ci_low, ci_high)
+    """
+    disc = np.exp(-r * T)
+    acc = RunningMoments()
+    for payoffs in payoff_blocks:
+        acc.update(disc * payoffs)
+
+    return moments_price(acc)
+
+
+def moments_price(acc: RunningMoments) -> tuple[float, float, float, float]:
+    """
+    (price, se, ci_low, ci_high) from an accumulator of already discounted samples.
+    """
+    if acc.count == 0:
+        raise ValueError("no payoffs were provided")
+
+    price = acc.mean
+    se = float(np.sqrt(acc.variance / acc.count))
 
-    z = 1.959963984540054  # ~N(0,1) 97.5% quantile
-    ci_low = price - z * se
-    ci_high = price + z * se
+    ci_low = price - _Z_975 * se
+    ci_high = price + _Z_975 * se
     return price, se, ci_low, ci_high
@@ -0,0 +1,104 @@
+import json
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class LSMProfile:
+    """
+    Opt-in instrumentation for an LSM pricing run.
+
+    Pass an instance as profile= to american_option_lsm or
+    american_option_lsm_cpp (and wrap other work, e.g. path simulation, in
+    profile.phase(name)). Engines then record
+
+    - phase_seconds: wall time per phase. The Python engine reports payoff,
+      itm_mask, basis, regression and exercise; the C++ engine fuses
+      payoff, ITM test, basis and normal equations into one pass and
+      reports accumulate, regression and exercise.
+    - steps, n_itm, cond: per regression step, the number of ITM paths and
+      the 2-norm condition number of the basis design matrix (computed from
+      the Gram matrix, timed separately as diagnostics in Python).
+    - bytes_allocated: bytes of the engine's work buffers.
+
+    callback(step, n_itm, cond), if given, is called for every regression
+    step: as it happens in Python, after the kernel returns for C++ (the
+    kernel runs without the GIL). Without a profile the engines skip all of
+    this; the cost is one None check per phase and step.
+    """
+
+    def __init__(self, callback: Callable[[int, int, float], None] | None = None):
+        self.callback = callback
+        self.engine: str | None = None
+        self.phase_seconds: dict[str, float] = {}
+        self.steps: list[int] = []
+        self.n_itm: list[int] = []
+        self.cond: list[float] = []
+        self.bytes_allocated = 0
+        self._last = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add(name, time.perf_counter() - t0)
+
+    def start(self) -> None:
+        """Start the lap clock used by lap()."""
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the previous lap() / start() to phase."""
+        now = time.perf_counter()
+        self.add(phase, now - self._last)
+        self._last = now
+
+    def record_step(self, step: int, n_itm: int, cond: float) -> None:
+        self.steps.append(int(step))
+        self.n_itm.append(int(n_itm))
+        self.cond.append(float(cond))
+        if self.callback is not None:
+            self.callback(int(step), int(n_itm), float(cond))
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.phase_seconds.values())
+
+    def to_dict(self) -> dict:
+        return {
+            "engine": self.engine,
+            "phase_seconds": dict(self.phase_seconds),
+            "total_seconds": self.total_seconds,
+            "bytes_allocated": self.bytes_allocated,
+            "steps": list(self.steps),
+            "n_itm": list(self.n_itm),
+            "cond": list(self.cond),
+        }
+
+    def to_json(self, path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def format_table(self) -> str:
+        """Phase breakdown plus a summary of the per-step diagnostics."""
+        total = self.total_seconds or 1.0
+        lines = [f"{'phase':<12} {'seconds':>9} {'share':>7}"]
+        for name, sec in sorted(self.phase_seconds.items(), key=lambda kv: -kv[1]):
+            lines.append(f"{name:<12} {sec:>9.4f} {sec / total:>7.1%}")
+        lines.append(f"{'total':<12} {self.total_seconds:>9.4f}")
+        lines.append(f"work buffers: {self.bytes_allocated / 1e6:.1f} MB")
+        if self.steps:
+            itm, cond = np.array(self.n_itm), np.array(self.cond)
+            lines.append(f"regression steps: {len(self.steps)}, ITM paths per step "
+                         f"min {itm.min()} / mean {itm.mean():.0f} / max {itm.max()}")
+            lines.append(f"design condition number: median {np.median(cond):.3g}, "
+                         f"max {cond.max():.3g}")
+        return "\n".join(lines)
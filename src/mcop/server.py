@@ -0,0 +1,328 @@
+import asyncio
+import json
+import socket
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .batch import _normalize
+from .cache import PathCache
+from .engines import get_spec, load_engine
+from .lsm_policy import LSMPolicy, fit_lsm_policy, policy_cashflows
+from .pricing import _mirrored_pair_means
+from .simulate_paths import simulate_gbm_paths
+
+DEFAULT_PORT = 8765
+_MAX_LINE = 1 << 20
+
+
+class PricingServer:
+    """
+    Long-running American option pricer behind mcop serve.
+
+    Keeps the engine imported and three caches warm between requests:
+
+    - path sets (PathCache, bounded by cache_bytes). Paths are simulated for
+      S0 = 1 and keyed by (r, q, sigma, T, n_steps, n_paths, seed): GBM
+      scales with spot and the LSM regression is invariant to rescaling S,
+      so a request is priced as S0 * price(K / S0) and every spot in a
+      market shares one path set.
+    - fitted exercise policies, used by requests with "policy": true. A
+      policy is fitted per contract and spot bucket (log S0 rounded to
+      policy_bucket) on independent training paths started at the bucket
+      centre, then applied to the request's own paths without regressions:
+      an out-of-sample (low-biased) estimate, as in price_with_policy, with
+      its SE taken over the antithetic pair means.
+    - finished results (LRU of result_cache entries), for exact repeats.
+
+    Pricing runs on a pool of `workers` threads (NumPy and the C++ engine
+    release the GIL, and threads share the caches). Concurrent requests
+    that need the same path set, policy or result wait for a single
+    computation instead of starting their own.
+
+    price(request) takes a dict with S0, K, r, sigma, T, type and optional
+    q, id, n_steps, n_paths, degree, seed and policy (server defaults
+    otherwise) and returns {"id", "price", "seconds", ...} or
+    {"id", "error"}.
+    """
+
+    def __init__(
+        self,
+        engine: str = "python",
+        n_steps: int = 100,
+        n_paths: int = 50_000,
+        degree: int = 2,
+        seed: int = 123,
+        workers: int | None = None,
+        cache_bytes: int = 1 << 30,
+        result_cache: int = 10_000,
+        policy_bucket: float = 0.02,
+    ):
+        if policy_bucket <= 0:
+            raise ValueError("policy_bucket must be positive")
+        if "paths" not in get_spec(engine).capabilities:
+            raise ValueError(f"engine {engine!r} does not price path arrays")
+        self.engine_name = engine
+        self.engine = load_engine(engine)
+        self.defaults = {"n_steps": n_steps, "n_paths": n_paths, "degree": degree, "seed": seed}
+        self.paths = PathCache(max_bytes=cache_bytes)
+        self.policy_bucket = policy_bucket
+        self._policies: dict[tuple, LSMPolicy] = {}
+        self.policy_hits = 0
+        self.policy_misses = 0
+        self._results: OrderedDict[tuple, dict] = OrderedDict()
+        self._max_results = result_cache
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._started = time.time()
+        self._stop: asyncio.Event | None = None
+        self._connections: dict[asyncio.Task, asyncio.StreamWriter] = {}
+        self.requests = 0
+        self.errors = 0
+        self.coalesced = 0
+        self.result_hits = 0
+
+    async def _once(self, key: tuple, fn, *args):
+        # one computation per key; concurrent callers await the same future
+        fut = self._inflight.get(key)
+        if fut is not None:
+            self.coalesced += 1
+            return await asyncio.shield(fut)
+        fut = asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+        self._inflight[key] = fut
+        try:
+            return await asyncio.shield(fut)
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _unit_paths(self, spec: dict, n_steps: int, n_paths: int, seed: int) -> np.ndarray:
+        params = dict(S0=1.0, r=spec["r"], sigma=spec["sigma"], T=spec["T"], n_steps=n_steps,
+                      n_paths=n_paths, q=spec["q"], seed=seed, antithetic=True,
+                      layout="time_major")
+        paths = self.paths.get(**params)
+        if paths is None:
+            key = ("paths",) + self.paths.key(**params)
+            paths = await self._once(key, lambda: simulate_gbm_paths(**params))
+            # PathCache is only touched from the event loop thread
+            paths = self.paths.put(paths, **params)
+        return paths
+
+    def _price_paths(self, paths, S0, K, r, T, is_call, degree) -> float:
+        return S0 * self.engine(paths, K=K / S0, r=r, T=T, is_call=is_call, degree=degree)
+
+    @staticmethod
+    def _fit_policy(spot, spec, is_call, n_steps, n_paths, degree, seed) -> LSMPolicy:
+        # training stream is independent of every pricing stream (seed, 1)
+        train = simulate_gbm_paths(spot, spec["r"], spec["sigma"], spec["T"], n_steps, n_paths,
+                                   q=spec["q"], seed=np.random.SeedSequence((seed, 1)),
+                                   antithetic=True)
+        return fit_lsm_policy(train, spec["K"], spec["r"], spec["T"], is_call, degree,
+                              q=spec["q"], sigma=spec["sigma"])
+
+    @staticmethod
+    def _price_policy(policy, paths, S0) -> tuple[float, float]:
+        # unit paths scaled to S0 step by step; the SE is over antithetic pair means
+        cashflow = policy_cashflows(policy, paths, scale=S0)
+        pairs = _mirrored_pair_means(cashflow)
+        return float(cashflow.mean()), float(pairs.std(ddof=1) / np.sqrt(pairs.size))
+
+    async def price(self, request: dict) -> dict:
+        self.requests += 1
+        rid = request.get("id")
+        t0 = time.perf_counter()
+        try:
+            spec = _normalize(request, 0)
+            n_steps, n_paths, degree, seed = (
+                int(self.defaults[name] if request.get(name) is None else request[name])
+                for name in ("n_steps", "n_paths", "degree", "seed")
+            )
+            use_policy = bool(request.get("policy", False))
+            is_call = spec["type"] == "call"
+            key = (spec["S0"], spec["K"], spec["r"], spec["q"], spec["sigma"], spec["T"],
+                   is_call, n_steps, n_paths, degree, seed, use_policy)
+
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                self.result_hits += 1
+                return {**cached, "id": rid, "cached": True,
+                        "seconds": time.perf_counter() - t0}
+
+            paths = await self._unit_paths(spec, n_steps, n_paths, seed)
+            out = {"policy": use_policy}
+            if use_policy:
+                bucket = round(np.log(spec["S0"]) / self.policy_bucket)
+                pkey = (bucket, spec["K"], spec["r"], spec["q"], spec["sigma"], spec["T"],
+                        is_call, n_steps, n_paths, degree, seed)
+                policy = self._policies.get(pkey)
+                if policy is None:
+                    self.policy_misses += 1
+                    policy = await self._once(
+                        ("policy",) + pkey, self._fit_policy,
+                        float(np.exp(bucket * self.policy_bucket)), spec, is_call, n_steps,
+                        n_paths, degree, seed,
+                    )
+                    self._policies[pkey] = policy
+                else:
+                    self.policy_hits += 1
+                out["price"], out["se"] = await self._once(
+                    ("price",) + key, self._price_policy, policy, paths, spec["S0"])
+            else:
+                out["price"] = await self._once(
+                    ("price",) + key, self._price_paths, paths, spec["S0"], spec["K"],
+                    spec["r"], spec["T"], is_call, degree)
+        except Exception as e:
+            self.errors += 1
+            return {"id": rid, "error": f"{type(e).__name__}: {e}"}
+
+        self._results[key] = out
+        while len(self._results) > self._max_results:
+            self._results.popitem(last=False)
+        return {**out, "id": rid, "cached": False, "seconds": time.perf_counter() - t0}
+
+    def stats(self) -> dict:
+        return {
+            "engine": self.engine_name,
+            "defaults": dict(self.defaults),
+            "uptime_s": time.time() - self._started,
+            "requests": self.requests,
+            "errors": self.errors,
+            "coalesced": self.coalesced,
+            "result_hits": self.result_hits,
+            "inflight": len(self._inflight),
+            "paths": self.paths.stats(),
+            "policies": {"entries": len(self._policies), "hits": self.policy_hits,
+                         "misses": self.policy_misses},
+        }
+
+    async def handle(self, request: dict) -> dict:
+        op = request.get("op", "price")
+        if op == "price":
+            return await self.price(request)
+        if op == "stats":
+            return {"id": request.get("id"), **self.stats()}
+        if op == "ping":
+            return {"id": request.get("id"), "ok": True}
+        if op == "shutdown":
+            if self._stop is not None:
+                self._stop.set()
+            return {"id": request.get("id"), "ok": True}
+        return {"id": request.get("id"), "error": f"unknown op {op!r}"}
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # one JSON object per line each way; requests on a connection are
+        # handled concurrently and answered as they finish (match them by id)
+        async def reply(line: bytes):
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                self.errors += 1
+                response = {"id": None, "error": f"bad request: {e}"}
+            else:
+                response = await self.handle(request)
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+        self._connections[asyncio.current_task()] = writer
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    task = asyncio.create_task(reply(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            await asyncio.gather(*tasks, return_exceptions=True)
+        except (ConnectionError, ValueError):
+            pass  # client went away, or sent a line longer than the limit
+        finally:
+            self._connections.pop(asyncio.current_task(), None)
+            writer.close()
+
+    async def serve(self, path: str | None = None, host: str = "127.0.0.1",
+                    port: int = DEFAULT_PORT, ready=None) -> None:
+        """
+        Accept connections on the Unix socket path, else on host:port, until
+        a shutdown request arrives. ready(address), if given, is called once
+        the socket is listening.
+        """
+        self._stop = asyncio.Event()
+        if path is not None:
+            server = await asyncio.start_unix_server(self._connection, path=path,
+                                                     limit=_MAX_LINE)
+            address = path
+        else:
+            server = await asyncio.start_server(self._connection, host=host, port=port,
+                                                limit=_MAX_LINE)
+            address = server.sockets[0].getsockname()[:2]
+        if ready is not None:
+            ready(address)
+        async with server:
+            await self._stop.wait()
+            # closing the transports ends each connection's read loop cleanly
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def serve(path: str | None = None, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+          ready=None, **options) -> None:
+    """Run a PricingServer(**options) until it is shut down (blocking)."""
+    asyncio.run(PricingServer(**options).serve(path=path, host=host, port=port, ready=ready))
+
+
+class PricingClient:
+    """
+    Blocking client for mcop serve.
+
+    address is a Unix socket path or a (host, port) tuple. One request is
+    in flight per client; use one client per thread for concurrency.
+    """
+
+    def __init__(self, address: str | tuple[str, int], timeout: float | None = 60.0):
+        if isinstance(address, str):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock.settimeout(timeout)
+        self._sock.connect(address if isinstance(address, str) else tuple(address))
+        self._file = self._sock.makefile("rb")
+        self._next_id = 0
+
+    def request(self, payload: dict) -> dict:
+        """Send one request and return the response dict (which may hold "error")."""
+        self._next_id += 1
+        payload = {"id": self._next_id, **payload}
+        self._sock.sendall(json.dumps(payload).encode() + b"\n")
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        return json.loads(line)
+
+    def price(self, **contract) -> dict:
+        """Price one contract (request fields as keywords); raises RuntimeError on errors."""
+        response = self.request({"op": "price", **contract})
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response
+
+    def stats(self) -> dict:
+        return self.request({"op": "stats"})
+
+    def shutdown(self) -> None:
+        self.request({"op": "shutdown"})
+
+    def close(self) -> None:
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,5 +1,58 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
+# Paths per spawned RNG substream in parallel mode. Fixed (not derived from
+# n_workers) so that the output only depends on the seed.
+_PARALLEL_CHUNK = 32_768
+
+SAMPLERS = ("pseudo", "sobol", "lhs", "stratified")
+
+
+def _float_dtype(dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float64, np.float32):
+        raise ValueError("dtype must be float64 or float32")
+    return dtype
+
+
+def _validate_gbm_args(n_steps: int, n_paths: int, sigma: float, T: float) -> None:
+    if n_steps <= 0:
+        raise ValueError("n_steps must be positive")
+    if n_paths <= 0:
+        raise ValueError("n_paths must be positive")
+    if sigma < 0:
+        raise ValueError("sigma must be non-negative")
+    if T <= 0:
+        raise ValueError("T must be positive")
+
+
+def _fill_gbm_paths(
+    out: np.ndarray,
+    Z: np.ndarray,
+    S0: float,
+    drift: float,
+    vol: float,
+) -> np.ndarray:
+    """
+    Turn standard normals Z (n, n_steps) into GBM paths written to out (n, n_steps + 1).
+
+    Z is overwritten with the log increments (after a cast to out.dtype if
+    they differ, e.g. float64 QMC normals for float32 paths); out[:, 1:] holds
+    the cumulative sum until it is exponentiated in place, so no further
+    temporaries are made.
+    """
+    Z = Z.astype(out.dtype, copy=False)
+    Z *= vol
+    Z += drift
+    out[:, 0] = S0
+    np.cumsum(Z, axis=1, out=out[:, 1:])
+    np.exp(out[:, 1:], out=out[:, 1:])
+    out[:, 1:] *= S0
+    return out
+
+
 def simulate_gbm_paths(
     S0: float,
     r: float,
@@ -10,6 +63,12 @@ def simulate_gbm_paths(
     q: float = 0.0,
     seed: int | None = None,
     antithetic: bool = False,
+    n_workers: int | None = None,
+    layout: str = "path_major",
+    sampler: str = "pseudo",
+    replications: int = 1,
+    strata: int = 1,
+    dtype=np.float64,
 ) -> np.ndarray:
     """
     Simulate GBM paths under the risk-neutral measure.
@@ -19,36 +78,328 @@ def simulate_gbm_paths(
     Exact discretization:
     S_{t+dt} = S_t * exp((r-q-0.5*sigma^2)dt + sigma*sqrt(dt)*Z),  Z~N(0,1)
 
+    Parameters
+    ----------
+    n_workers : if given, simulate in parallel with this many threads. Paths are
+        split into fixed-size chunks, each driven by its own child of
+        SeedSequence(seed).spawn(...), and written straight into the output
+        array. Results are identical for any n_workers (but differ from the
+        serial n_workers=None stream).
+    layout : "path_major" (C order, each path contiguous) or "time_major"
+        (Fortran order, each time slice paths[:, t] contiguous). Both hold the
+        same values with the same (n_paths, n_steps + 1) indexing; time_major
+        suits the column-by-column LSM backward pass and is accepted without
+        copying by american_option_lsm and the C++ engine.
+    sampler : how the normals are drawn.
+        "pseudo" (default): rng.standard_normal.
+        "sobol": randomized quasi-Monte Carlo. Each path is one point of a
+        scrambled Sobol sequence in n_steps dimensions, mapped to normals and
+        assigned to the time steps in Brownian-bridge order, so the leading
+        (best distributed) coordinates fix W_T and the coarse path shape.
+        "lhs": Latin hypercube across the n_steps time-step normals.
+        "stratified": W_T is stratified into `strata` equiprobable strata
+        with n_paths // strata paths each; the intermediate steps are filled
+        in by the Brownian bridge.
+    replications : with sampler="sobol" or "lhs", the paths are split into
+        this many independent randomizations of n_paths // replications points
+        each, stored consecutively. Pass the same value to mc_price to get a
+        valid standard error from the spread of the replication means. Powers
+        of two for n_paths // replications keep the Sobol balance properties.
+    strata : with sampler="stratified", the number of strata (each stored
+        consecutively). Pass the same value to mc_price for the stratified SE.
+    dtype : float64 (default) or float32. float32 halves memory and
+        bandwidth; pseudo-random normals are then drawn in float32 too (a
+        different stream from float64). The pricers keep regressions and
+        sums in float64.
+
     Returns
     -------
     paths : ndarray, shape (n_paths, n_steps + 1)
         paths[:, 0] = S0
     """
-    if n_steps <= 0:
-        raise ValueError("n_steps must be positive")
-    if n_paths <= 0:
-        raise ValueError("n_paths must be positive")
-    if sigma < 0:
-        raise ValueError("sigma must be non-negative")
-    if T <= 0:
-        raise ValueError("T must be positive")
+    _validate_gbm_args(n_steps, n_paths, sigma, T)
+    order = _layout_order(layout)
+    dtype = _float_dtype(dtype)
 
-    rng = np.random.default_rng(seed)
     dt = T / n_steps
+    drift = (r - q - 0.5 * sigma**2) * dt
+    vol = sigma * np.sqrt(dt)
+
+    if sampler not in SAMPLERS:
+        raise ValueError(f"sampler must be one of {SAMPLERS}")
+    if replications != 1 and sampler not in ("sobol", "lhs"):
+        raise ValueError("replications is only used with sampler='sobol' or 'lhs'")
+    if strata != 1 and sampler != "stratified":
+        raise ValueError("strata is only used with sampler='stratified'")
+
+    if sampler != "pseudo":
+        if antithetic or n_workers is not None:
+            raise ValueError(f"sampler={sampler!r} does not combine with antithetic or n_workers")
+        if sampler == "stratified":
+            Z = _stratified_normals(n_paths, n_steps, seed, strata)
+        else:
+            Z = _randomized_normals(sampler, n_paths, n_steps, seed, replications)
+        paths = np.empty((n_paths, n_steps + 1), dtype=dtype, order=order)
+        return _fill_gbm_paths(paths, Z, S0, drift, vol)
+
+    if n_workers is not None:
+        return _simulate_gbm_paths_parallel(
+            S0, drift, vol, n_steps, n_paths, seed, antithetic, n_workers, order, dtype
+        )
+
+    rng = np.random.default_rng(seed)
 
     m = n_paths
     if antithetic:
         m = (n_paths + 1) // 2
 
-    Z = rng.standard_normal((m, n_steps))
+    Z = rng.standard_normal((m, n_steps), dtype=dtype)
     if antithetic:
         Z = np.vstack([Z, -Z])[:n_paths]
 
-    drift = (r - q - 0.5 * sigma**2) * dt
-    diffusion = sigma * np.sqrt(dt) * Z
-    log_increments = drift + diffusion
+    paths = np.empty((n_paths, n_steps + 1), dtype=dtype, order=order)
+    return _fill_gbm_paths(paths, Z, S0, drift, vol)
+
+
+def _layout_order(layout: str) -> str:
+    if layout == "path_major":
+        return "C"
+    if layout == "time_major":
+        return "F"
+    raise ValueError("layout must be 'path_major' or 'time_major'")
+
+
+def _bridge_schedule(n_steps: int) -> list[tuple[int, int, int, float, float, float]]:
+    """
+    Brownian-bridge construction order on the grid 0..n_steps (unit time step).
+
+    Entry k gives (m, left, right, w_left, w_right, sd): coordinate k + 1 of a
+    normal vector sets W[m] = w_left*W[left] + w_right*W[right] + sd*Z. The
+    first coordinate (not listed) sets W[n_steps]; intervals are then bisected
+    breadth first, so earlier coordinates control coarser features.
+    """
+    schedule = []
+    queue = [(0, n_steps)]
+    while queue:
+        nxt = []
+        for left, right in queue:
+            if right - left < 2:
+                continue
+            m = (left + right) // 2
+            span = right - left
+            schedule.append((m, left, right, (right - m) / span, (m - left) / span,
+                             np.sqrt((m - left) * (right - m) / span)))
+            nxt += [(left, m), (m, right)]
+        queue = nxt
+    return schedule
+
+
+def _brownian_bridge_increments(G: np.ndarray) -> np.ndarray:
+    """
+    Map normals G (n, n_steps), most important coordinate first, to standard
+    normal time increments (n, n_steps) via the Brownian bridge.
+    """
+    n, n_steps = G.shape
+    W = np.zeros((n_steps + 1, n))
+    W[n_steps] = np.sqrt(n_steps) * G[:, 0]
+    for k, (m, left, right, wl, wr, sd) in enumerate(_bridge_schedule(n_steps), start=1):
+        W[m] = wl * W[left] + wr * W[right] + sd * G[:, k]
+    return np.diff(W, axis=0).T
+
+
+def _randomized_normals(
+    sampler: str,
+    n_paths: int,
+    n_steps: int,
+    seed,
+    replications: int,
+) -> np.ndarray:
+    """
+    Standard normal increments (n_paths, n_steps) from scrambled Sobol points
+    (in Brownian-bridge order) or a Latin hypercube, one independent
+    randomization per replication.
+    """
+    from scipy.special import ndtri
+
+    if replications <= 0 or n_paths % replications:
+        raise ValueError("replications must be positive and divide n_paths")
+    n_rep = n_paths // replications
+
+    G = np.empty((n_paths, n_steps))
+    for i, child in enumerate(np.random.SeedSequence(seed).spawn(replications)):
+        rng = np.random.default_rng(child)
+        if sampler == "sobol":
+            from scipy.stats import qmc
+            U = qmc.Sobol(d=n_steps, scramble=True, rng=rng).random(n_rep)
+        else:
+            # one random permutation of the n_rep strata per coordinate
+            U = rng.random((n_rep, n_steps)).argsort(axis=0)
+            U = (U + rng.random((n_rep, n_steps))) / n_rep
+        G[i * n_rep:(i + 1) * n_rep] = ndtri(U)
+
+    if sampler == "sobol":
+        return np.ascontiguousarray(_brownian_bridge_increments(G))
+    return G
 
-    paths = np.empty((n_paths, n_steps + 1), dtype=float)
-    paths[:, 0] = S0
-    paths[:, 1:] = S0 * np.exp(np.cumsum(log_increments, axis=1))
+
+def _stratified_normals(n_paths: int, n_steps: int, seed, strata: int) -> np.ndarray:
+    """
+    Standard normal increments (n_paths, n_steps) with W_T stratified.
+
+    Rows [j * n, (j + 1) * n) hold stratum j, whose terminal normal lies in the
+    j-th of `strata` equiprobable intervals; the rest of the path is a
+    Brownian bridge with pseudo-random normals.
+    """
+    from scipy.special import ndtri
+
+    if strata <= 0 or n_paths % strata:
+        raise ValueError("strata must be positive and divide n_paths")
+    n = n_paths // strata
+
+    rng = np.random.default_rng(seed)
+    G = rng.standard_normal((n_paths, n_steps))
+    U = (np.repeat(np.arange(strata), n) + rng.random(n_paths)) / strata
+    G[:, 0] = ndtri(U)
+    return np.ascontiguousarray(_brownian_bridge_increments(G))
+
+
+def _simulate_gbm_paths_parallel(
+    S0: float,
+    drift: float,
+    vol: float,
+    n_steps: int,
+    n_paths: int,
+    seed: int | None,
+    antithetic: bool,
+    n_workers: int,
+    order: str,
+    dtype: np.dtype = np.dtype(np.float64),
+) -> np.ndarray:
+    """
+    Thread-parallel simulation over spawned RNG substreams.
+
+    NumPy's generators, cumsum and exp release the GIL, so threads scale
+    without pickling or copying paths between processes. With antithetic,
+    the layout matches the serial mode: rows [0, m) hold the base draws and
+    rows [m, n_paths) their mirrors.
+    """
+    if n_workers <= 0:
+        raise ValueError("n_workers must be positive")
+
+    m = (n_paths + 1) // 2 if antithetic else n_paths
+    n_chunks = -(-m // _PARALLEL_CHUNK)
+    children = np.random.SeedSequence(seed).spawn(n_chunks)
+
+    paths = np.empty((n_paths, n_steps + 1), dtype=dtype, order=order)
+
+    def work(i: int) -> None:
+        lo = i * _PARALLEL_CHUNK
+        hi = min(lo + _PARALLEL_CHUNK, m)
+        Z = np.random.default_rng(children[i]).standard_normal((hi - lo, n_steps), dtype=dtype)
+        if antithetic:
+            # mirrors of the last base row are dropped when n_paths is odd
+            n_mirror = min(hi, n_paths - m) - lo
+            if n_mirror > 0:
+                Z_neg = np.negative(Z[:n_mirror])
+                _fill_gbm_paths(paths[m + lo:m + lo + n_mirror], Z_neg, S0, drift, vol)
+        _fill_gbm_paths(paths[lo:hi], Z, S0, drift, vol)
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        list(pool.map(work, range(n_chunks)))
     return paths
+
+
+def iter_gbm_path_blocks(
+    S0: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    n_paths: int,
+    block_size: int = 65_536,
+    q: float = 0.0,
+    seed: int | None = None,
+    antithetic: bool = False,
+    dtype=np.float64,
+) -> Iterator[np.ndarray]:
+    """
+    Generate the same GBM model as simulate_gbm_paths in blocks of at most block_size paths.
+
+    Only one block (plus its normals) is alive at a time, so peak memory is
+    O(block_size * n_steps) regardless of n_paths.
+
+    Normals are drawn from a single generator in path order, so concatenating
+    the blocks gives the same array for any block_size. Without antithetic
+    this is exactly simulate_gbm_paths(..., antithetic=False). With antithetic,
+    paths are interleaved pairs (Z, -Z) and block_size must be even so that
+    every pair stays inside one block. dtype is float64 or float32, as in
+    simulate_gbm_paths.
+
+    Yields
+    ------
+    block : ndarray, shape (n_block, n_steps + 1)
+    """
+    _validate_gbm_args(n_steps, n_paths, sigma, T)
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    if antithetic and block_size % 2:
+        raise ValueError("block_size must be even when antithetic=True")
+
+    dtype = _float_dtype(dtype)
+    rng = np.random.default_rng(seed)
+    dt = T / n_steps
+    drift = (r - q - 0.5 * sigma**2) * dt
+    vol = sigma * np.sqrt(dt)
+
+    for start in range(0, n_paths, block_size):
+        n_block = min(block_size, n_paths - start)
+
+        if antithetic:
+            base = rng.standard_normal(((n_block + 1) // 2, n_steps), dtype=dtype)
+            Z = np.empty((2 * base.shape[0], n_steps), dtype=dtype)
+            Z[0::2] = base
+            np.negative(base, out=Z[1::2])
+            Z = Z[:n_block]
+        else:
+            Z = rng.standard_normal((n_block, n_steps), dtype=dtype)
+
+        block = np.empty((n_block, n_steps + 1), dtype=dtype)
+        yield _fill_gbm_paths(block, Z, S0, drift, vol)
+
+
+def iter_gbm_steps(
+    S0: float,
+    r: float,
+    sigma: float,
+    T: float,
+    n_steps: int,
+    n_paths: int,
+    q: float = 0.0,
+    seed: int | None = None,
+    antithetic: bool = False,
+) -> Iterator[np.ndarray]:
+    """
+    Generate GBM prices one time step at a time for all paths.
+
+    Yields S(t_1), ..., S(t_n) as fresh arrays of shape (n_paths,), so a
+    consumer that only keeps running statistics (path_dependent accumulators)
+    needs O(n_paths) memory. The normals are drawn one step at a time, so the
+    values differ from simulate_gbm_paths with the same seed; with antithetic,
+    the second half of the paths mirrors the first, as in simulate_gbm_paths.
+    """
+    _validate_gbm_args(n_steps, n_paths, sigma, T)
+    rng = np.random.default_rng(seed)
+    dt = T / n_steps
+    drift = (r - q - 0.5 * sigma**2) * dt
+    vol = sigma * np.sqrt(dt)
+    m = (n_paths + 1) // 2 if antithetic else n_paths
+
+    S = np.full(n_paths, float(S0))
+    for _ in range(n_steps):
+        Z = rng.standard_normal(m)
+        if antithetic:
+            Z = np.concatenate([Z, -Z])[:n_paths]
+        Z *= vol
+        Z += drift
+        S = S * np.exp(Z, out=Z)
+        yield S
@@ -1,5 +1,7 @@
 import numpy as np
 
+from .pricing import _replication_se, _stratified_se
+
 def control_variate_adjustment(
     x: np.ndarray,
     y: np.ndarray,
@@ -35,11 +37,20 @@ def control_variate_adjustment(
     return float(x_cv.mean()), float(beta)
 
 
-def mc_mean_se(x: np.ndarray) -> tuple[float, float]:
+def mc_mean_se(x: np.ndarray, replications: int = 1, strata: int = 1) -> tuple[float, float]:
     """
     Return mean and standard error.
+
+    With replications > 1, x holds that many consecutive independent
+    replications (randomized QMC / LHS) and the SE uses their means. With
+    strata > 1, x holds that many consecutive equiprobable strata and the
+    stratified SE is returned.
     """
     x = np.asarray(x, dtype=float)
     mean = float(x.mean())
+    if replications > 1:
+        return mean, _replication_se(x, replications)
+    if strata > 1:
+        return mean, _stratified_se(x, strata)
     se = float(x.std(ddof=1)) / np.sqrt(x.size)
     return mean, se
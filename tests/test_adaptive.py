@@ -0,0 +1,61 @@
+import pytest
+
+from mcop.adaptive import price_adaptive
+from mcop.binomial_tree import american_option_crr
+from mcop.cli import main
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+BS_CALL = 10.450583572185565
+
+
+def test_european_stops_at_target_se():
+    res = price_adaptive(S0, K, R, SIGMA, T, 1, is_call=True, american=False,
+                         seed=1, target_se=0.02, batch_size=20_000)
+
+    assert res.converged and res.stop_reason == "target"
+    assert res.se <= 0.02
+    assert res.ci_low < BS_CALL < res.ci_high
+    # a single batch is not precise enough, a handful are
+    assert 20_000 < res.n_paths <= 400_000
+
+
+def test_relative_tolerance_on_half_width():
+    res = price_adaptive(S0, K, R, SIGMA, T, 1, is_call=True, american=False,
+                         seed=2, rel_tol=0.005, batch_size=10_000)
+    assert res.converged
+    assert 0.5 * (res.ci_high - res.ci_low) <= 0.005 * res.price
+
+
+def test_path_budget_caps_american_run():
+    ref = american_option_crr(S0, K, R, SIGMA, T, n_steps=500, is_call=False)
+    res = price_adaptive(S0, K, R, SIGMA, T, 50, is_call=False, seed=3,
+                         target_se=1e-6, max_paths=60_000, batch_size=20_000, n_train=20_000)
+
+    assert res.stop_reason == "max_paths" and not res.converged
+    assert res.n_paths == 60_000
+    # out-of-sample estimate is a lower bound up to noise
+    assert ref - 0.15 < res.price < ref + 3 * res.se
+
+
+def test_reproducible_and_validated():
+    kw = dict(is_call=False, seed=4, target_se=0.05, batch_size=4_000, n_train=4_000)
+    a = price_adaptive(S0, K, R, SIGMA, T, 20, **kw)
+    b = price_adaptive(S0, K, R, SIGMA, T, 20, **kw)
+    assert (a.price, a.se, a.n_paths) == (b.price, b.se, b.n_paths)
+
+    with pytest.raises(ValueError):
+        price_adaptive(S0, K, R, SIGMA, T, 20, is_call=False, max_paths=None)
+    # a deep OTM price of ~0 never meets a relative tolerance: a budget is required
+    with pytest.raises(ValueError, match="budget"):
+        price_adaptive(S0, 10.0, R, SIGMA, T, 20, is_call=False, rel_tol=0.01, max_paths=None)
+
+
+def test_cli_adaptive(capsys):
+    main(["price", "--n-steps", "20", "--n-paths", "5000", "--target-se", "0.05"])
+    out = capsys.readouterr().out
+    assert "adaptive" in out and "stop=target" in out
+
+    # a path budget on its own also selects adaptive mode
+    main(["price", "--n-steps", "20", "--n-paths", "4000", "--max-paths", "8000"])
+    out = capsys.readouterr().out
+    assert "adaptive" in out and "paths=8000" in out and "stop=max_paths" in out
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from mcop.analysis import (
+    convergence_summary, incremental_convergence, prefix_estimates, write_convergence,
+)
+from mcop.pricing import mc_price
+from mcop.simulate_paths import iter_gbm_path_blocks
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+
+
+def test_prefix_estimates_match_direct_estimates():
+    x = np.random.default_rng(0).exponential(size=10_000)
+    blocks = np.array_split(x, 7)  # boundaries do not line up with the counts
+    rows = prefix_estimates(blocks, [100, 2_500, 10_000])
+
+    for row in rows:
+        price, se, _, _ = mc_price(x[:row["n"]], 0.0, 1.0)
+        assert row["price"] == pytest.approx(price, rel=1e-12)
+        assert row["se"] == pytest.approx(se, rel=1e-9)
+    with pytest.raises(ValueError, match="stream ended"):
+        prefix_estimates(blocks, [20_000])
+
+
+def test_european_prefixes_reuse_one_simulation():
+    counts = [1_000, 8_000, 40_000]
+    rows = incremental_convergence(S0, K, R, SIGMA, T, counts, seed=5, block_size=4_096)
+    assert [row["n_paths"] for row in rows] == counts
+    assert rows[-1]["se"] < rows[0]["se"]
+
+    # the largest prefix is the plain estimate over one antithetic stream
+    price_seed = np.random.SeedSequence(5).spawn(1)[0].spawn(2)[1]
+    S_T = np.concatenate([b[:, -1] for b in iter_gbm_path_blocks(
+        S0, R, SIGMA, T, 1, 40_000, block_size=4_096, seed=price_seed, antithetic=True)])
+    assert rows[-1]["price"] == pytest.approx(
+        np.exp(-R * T) * np.maximum(K - S_T, 0.0).mean(), rel=1e-12)
+
+
+def test_american_repetitions_do_not_depend_on_workers(tmp_path):
+    kw = dict(american=True, n_steps=20, n_train=4_000, repetitions=2, seed=3)
+    serial = incremental_convergence(S0, K, R, SIGMA, T, [2_000, 10_000], **kw)
+    pooled = incremental_convergence(S0, K, R, SIGMA, T, [2_000, 10_000], workers=2, **kw)
+
+    assert [r["price"] for r in serial] == [r["price"] for r in pooled]
+    summary = convergence_summary(serial)
+    assert [s["repetitions"] for s in summary] == [2, 2]
+    assert 5.7 < summary[-1]["price"] < 6.3  # CRR: 6.09; out of sample, so low-biased
+
+    write_convergence(serial, tmp_path / "conv.csv")
+    assert (tmp_path / "conv.csv").read_text().startswith("rep,n_paths,price,se")
+    with pytest.raises(ValueError):
+        incremental_convergence(S0, K, R, SIGMA, T, [1_001])
@@ -0,0 +1,95 @@
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from mcop.american_lsm import american_option_lsm_batch
+from mcop.batch import group_specs, price_batch, read_specs
+from mcop.cli import main
+from mcop.simulate_paths import simulate_gbm_paths
+
+CONTRACTS = [
+    {"id": "a", "S0": 100, "K": 95, "r": 0.05, "sigma": 0.2, "T": 1.0, "type": "put"},
+    {"id": "b", "S0": 100, "K": 105, "r": 0.05, "sigma": 0.2, "T": 0.5, "type": "call"},
+    {"id": "c", "S0": 100, "K": 100, "r": 0.05, "sigma": 0.3, "T": 1.0, "type": "put"},
+    {"id": "d", "S0": 100, "K": 100, "r": 0.05, "sigma": 0.2, "T": 0.33, "type": "put"},
+    {"id": "e", "S0": 100, "K": 100, "r": 0.05, "q": 0.02, "sigma": 0.2, "T": 1.0,
+     "type": "call"},
+]
+
+
+@pytest.fixture
+def spec_csv(tmp_path):
+    path = tmp_path / "specs.csv"
+    with path.open("w", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=["id", "S0", "K", "r", "q", "sigma", "T", "type"])
+        w.writeheader()
+        w.writerows(CONTRACTS)
+    return path
+
+
+def test_read_formats_agree(tmp_path, spec_csv):
+    (tmp_path / "specs.json").write_text(json.dumps(CONTRACTS))
+    (tmp_path / "specs.jsonl").write_text("\n".join(json.dumps(c) for c in CONTRACTS))
+    specs = read_specs(spec_csv)
+    assert specs == read_specs(tmp_path / "specs.json") == read_specs(tmp_path / "specs.jsonl")
+    assert specs[0]["q"] == 0.0 and specs[4]["q"] == 0.02
+
+    (tmp_path / "bad.json").write_text(json.dumps([{"S0": 100, "K": 100, "type": "put"}]))
+    with pytest.raises(ValueError, match="missing"):
+        read_specs(tmp_path / "bad.json")
+
+
+def test_grouping_by_market_and_maturity(spec_csv):
+    specs = read_specs(spec_csv)
+    # T=0.5 lies on the 10-step grid of T=1 but would only get 5 of its steps
+    assert group_specs(specs, n_steps=10) == [[0], [1], [3], [2], [4]]
+    assert group_specs(specs + specs[:2], n_steps=10) == [[0, 5], [1, 6], [3], [2], [4]]
+
+
+def test_prices_do_not_depend_on_other_contracts():
+    short = {"S0": 100, "K": 110, "r": 0.05, "q": 0.0, "sigma": 0.2, "T": 0.25, "type": "put"}
+    specs = [dict(short, id=0)]
+    alone = list(price_batch(specs, n_steps=20, n_paths=4_000, seed=5))[0].rows[0]
+    more = [dict(short, id=0), dict(short, id=1, T=5.0), dict(short, id=2, T=0.01)]
+    rows = {row["id"]: row for g in price_batch(more, n_steps=20, n_paths=4_000, seed=5)
+            for row in g.rows}
+    assert rows[0]["price"] == alone["price"]
+
+    # a very short contract keeps n_steps exercise dates over its own maturity
+    paths = simulate_gbm_paths(100, 0.05, 0.2, 0.01, 20, 4_000, seed=5, antithetic=True,
+                               layout="time_major")
+    assert rows[2]["price"] == pytest.approx(
+        american_option_lsm_batch(paths, [110.0], 0.05, 0.01, False)[0])
+
+
+def test_group_prices_match_direct_batch(spec_csv):
+    specs = read_specs(spec_csv)
+    groups = list(price_batch(specs, n_steps=10, n_paths=4_000, seed=5))
+    assert [row["id"] for g in groups for row in g.rows] == ["a", "b", "d", "c", "e"]
+
+    for g, (K, T, call) in zip(groups[:2], [(95, 1.0, False), (105, 0.5, True)]):
+        paths = simulate_gbm_paths(100, 0.05, 0.2, T, 10, 4_000, seed=5, antithetic=True,
+                                   layout="time_major")
+        prices = american_option_lsm_batch(paths, [K], 0.05, T, call)
+        np.testing.assert_allclose([row["price"] for row in g.rows], prices)
+
+    pooled = list(price_batch(specs, n_steps=10, n_paths=4_000, seed=5, workers=2))
+    assert [g.rows for g in pooled] == [g.rows for g in groups]
+
+
+def test_cli_batch_outputs(spec_csv, tmp_path, capsys):
+    out_csv, out_jsonl = tmp_path / "out.csv", tmp_path / "out.jsonl"
+    out_json = tmp_path / "out.json"
+    args = [str(spec_csv), "--n-steps", "10", "--n-paths", "2000"]
+    main(["batch", *args, "-o", str(out_csv)])
+    main(["batch", *args, "-o", str(out_jsonl)])
+    main(["batch", *args, "-o", str(out_json)])
+
+    rows = list(csv.DictReader(out_csv.open()))
+    lines = [json.loads(line) for line in out_jsonl.read_text().splitlines()]
+    assert json.loads(out_json.read_text()) == lines
+    assert len(rows) == len(lines) == len(CONTRACTS)
+    assert float(rows[0]["price"]) == pytest.approx(lines[0]["price"])
+    assert "contracts/s" in capsys.readouterr().err
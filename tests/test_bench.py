@@ -0,0 +1,61 @@
+import copy
+import json
+
+import pytest
+
+from mcop.bench import CASES, compare_to_baseline, run_suite
+from mcop.cli import BENCH_CASES, main
+
+
+@pytest.fixture(scope="module")
+def report():
+    return run_suite(cases=("simulate", "lsm_python", "crr"), path_counts=(2_000,),
+                     step_counts=(10,), repeats=2)
+
+
+def test_suite_rows_and_metadata(report):
+    rows = {row["case"]: row for row in report["results"]}
+    assert set(rows) == {"simulate", "lsm_python", "crr"}
+    assert rows["crr"]["n_paths"] is None
+
+    lsm = rows["lsm_python"]
+    assert lsm["status"] == "ok" and lsm["unit"] == "path-steps/s"
+    assert lsm["throughput"] == pytest.approx(2_000 * 10 / lsm["time_s"])
+    assert lsm["peak_mb"] > 0.1  # at least the path matrix
+    assert lsm["abs_err"] < 0.5 and lsm["price_std"] > 0
+    assert "price_mean" not in rows["simulate"]
+
+    meta = report["metadata"]
+    assert {"platform", "python", "numpy", "cpu_count", "timestamp"} <= set(meta)
+    json.dumps(report)
+
+
+def test_baseline_comparison(report):
+    assert compare_to_baseline(report, report) == []
+
+    fast = copy.deepcopy(report)
+    for row in fast["results"]:
+        row["time_s"] /= 2
+    regs = compare_to_baseline(report, fast, threshold=0.25)
+    assert {r["case"] for r in regs} == {"simulate", "lsm_python", "crr"}
+    assert all(r["metric"] == "time_s" and r["ratio"] == pytest.approx(2.0) for r in regs)
+
+
+def test_cli_exits_nonzero_on_regression(tmp_path, report):
+    baseline = copy.deepcopy(report)
+    for row in baseline["results"]:
+        row["time_s"] *= 1e-6
+    base_file = tmp_path / "base.json"
+    base_file.write_text(json.dumps(baseline))
+    out = tmp_path / "bench.json"
+
+    args = ["bench", "--cases", "crr", "--steps", "10", "--repeats", "1", "-o", str(out)]
+    main(args)
+    assert json.loads(out.read_text())["results"][0]["case"] == "crr"
+    with pytest.raises(SystemExit) as exc:
+        main(args + ["--baseline", str(base_file)])
+    assert exc.value.code == 1
+
+
+def test_cli_case_choices_match_bench():
+    assert BENCH_CASES == CASES
@@ -0,0 +1,71 @@
+import math
+
+import numpy as np
+import pytest
+
+from mcop.binomial_tree import american_option_crr, american_option_crr_batch
+
+
+def _crr_node_by_node(S0, K, r, sigma, T, n_steps, is_call, q=0.0):
+    # the original scalar double loop, kept as the reference
+    dt = T / n_steps
+    u = math.exp(sigma * math.sqrt(dt))
+    d = 1.0 / u
+    disc = math.exp(-r * dt)
+    p = (math.exp((r - q) * dt) - d) / (u - d)
+
+    def payoff(S):
+        return max(S - K, 0.0) if is_call else max(K - S, 0.0)
+
+    values = [payoff(S0 * (u ** j) * (d ** (n_steps - j))) for j in range(n_steps + 1)]
+    for i in range(n_steps - 1, -1, -1):
+        for j in range(i + 1):
+            Sij = S0 * (u ** j) * (d ** (i - j))
+            cont = disc * (p * values[j + 1] + (1.0 - p) * values[j])
+            values[j] = max(payoff(Sij), cont)
+    return values[0]
+
+
+CASES = [
+    (100.0, 100.0, 0.05, 0.2, 1.0, 500, False, 0.0),
+    (100.0, 90.0, 0.03, 0.3, 0.5, 333, True, 0.05),
+    (50.0, 60.0, 0.01, 0.4, 2.0, 101, False, 0.02),
+    (100.0, 100.0, 0.05, 0.2, 1.0, 1, True, 0.0),
+]
+
+
+@pytest.mark.parametrize("S0, K, r, sigma, T, n_steps, is_call, q", CASES)
+def test_vectorised_crr_identical_to_node_by_node(S0, K, r, sigma, T, n_steps, is_call, q):
+    expected = _crr_node_by_node(S0, K, r, sigma, T, n_steps, is_call, q)
+    assert american_option_crr(S0, K, r, sigma, T, n_steps, is_call, q=q) == expected
+
+
+def test_crr_batch_identical_to_single_contracts():
+    strikes = [80.0, 100.0, 100.0, 125.0]
+    calls = [False, False, True, True]
+    batch = american_option_crr_batch(100.0, strikes, 0.04, 0.25, 0.75, 250, calls, q=0.01)
+
+    single = [american_option_crr(100.0, K, 0.04, 0.25, 0.75, 250, c, q=0.01) for K, c in zip(strikes, calls)]
+    assert batch.tolist() == single
+
+
+def test_cpp_crr_matches_python():
+    pytest.importorskip("mcop._mcop_cpp")
+    from mcop.binomial_tree_cpp import american_option_crr_cpp_batch
+
+    strikes = np.array([90.0, 100.0, 110.0])
+    calls = np.array([True, False, False])
+    py = american_option_crr_batch(100.0, strikes, 0.05, 0.2, 1.0, 2_000, calls, q=0.02)
+    cpp = american_option_crr_cpp_batch(100.0, strikes, 0.05, 0.2, 1.0, 2_000, calls, q=0.02)
+    assert np.allclose(cpp, py, rtol=1e-12, atol=1e-12)
+
+
+def test_numba_crr_identical_to_python():
+    pytest.importorskip("numba")
+    from mcop.binomial_tree_numba import american_option_crr_numba_batch
+
+    strikes = np.array([90.0, 100.0, 110.0])
+    calls = np.array([True, False, False])
+    py = american_option_crr_batch(100.0, strikes, 0.05, 0.2, 1.0, 2_000, calls, q=0.02)
+    nb = american_option_crr_numba_batch(100.0, strikes, 0.05, 0.2, 1.0, 2_000, calls, q=0.02)
+    assert np.array_equal(nb, py)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from mcop.american_lsm import american_option_lsm, american_option_lsm_batch
+from mcop.payoffs import european_call
+from mcop.pricing import mc_price
+from mcop.simulate_paths import iter_gbm_path_blocks, simulate_gbm_paths
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+BS_CALL = 10.450583572185565
+
+
+@pytest.fixture(scope="module")
+def paths64():
+    return simulate_gbm_paths(S0, R, SIGMA, T, 50, 100_000, seed=4, antithetic=True,
+                              layout="time_major")
+
+
+def test_float32_simulation_dtype_and_layout():
+    p = simulate_gbm_paths(S0, R, SIGMA, T, 10, 1_000, seed=1, dtype=np.float32,
+                           layout="time_major")
+    assert p.dtype == np.float32 and p.flags.f_contiguous
+    blocks = list(iter_gbm_path_blocks(S0, R, SIGMA, T, 10, 1_000, block_size=300, seed=1,
+                                       dtype="float32"))
+    assert all(b.dtype == np.float32 for b in blocks)
+    assert np.array_equal(np.concatenate(blocks), simulate_gbm_paths(
+        S0, R, SIGMA, T, 10, 1_000, seed=1, dtype=np.float32))
+    with pytest.raises(ValueError):
+        simulate_gbm_paths(S0, R, SIGMA, T, 10, 100, dtype=np.float16)
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("sampler", ["sobol", "lhs", "stratified"])
+def test_float32_non_pseudo_samplers(sampler):
+    p32 = simulate_gbm_paths(S0, R, SIGMA, T, 8, 1_024, seed=3, sampler=sampler, dtype=np.float32)
+    p64 = simulate_gbm_paths(S0, R, SIGMA, T, 8, 1_024, seed=3, sampler=sampler)
+    assert p32.dtype == np.float32 and np.all(np.isfinite(p32))
+    # same normals, rounded to float32
+    assert np.allclose(p32, p64, rtol=1e-5)
+
+
+def test_lsm_precision_delta_on_same_draws(paths64):
+    # Rounding the paths to float32 moves the LSM price by far less than the MC error
+    ref, cf = american_option_lsm(paths64, K, R, T, is_call=False, return_cashflows=True)
+    price = american_option_lsm(paths64.astype(np.float32, order="F"), K, R, T, is_call=False)
+    se = cf.std(ddof=1) / np.sqrt(cf.size)
+
+    assert abs(price - ref) < 1e-6 * ref
+    assert abs(price - ref) < 1e-3 * se
+
+    strikes = [90.0, 100.0, 110.0]
+    batch64 = american_option_lsm_batch(paths64, strikes, R, T, is_call=False)
+    batch32 = american_option_lsm_batch(paths64.astype(np.float32), strikes, R, T, is_call=False)
+    assert np.allclose(batch32, batch64, rtol=1e-4)
+
+
+def test_end_to_end_float32_within_mc_error():
+    p = simulate_gbm_paths(S0, R, SIGMA, T, 1, 400_000, seed=2, dtype=np.float32)
+    price, se, lo, hi = mc_price(european_call(p, K), R, T)
+    assert isinstance(price, float)
+    assert lo < BS_CALL < hi
+
+
+def test_cpp_float32_kernel(paths64):
+    pytest.importorskip("mcop._mcop_cpp")
+    from mcop.american_lsm_cpp import american_option_lsm_cpp, american_option_lsm_cpp_fused
+
+    ref = american_option_lsm_cpp(paths64, K, R, T, is_call=False)
+    price = american_option_lsm_cpp(paths64.astype(np.float32, order="F"), K, R, T, is_call=False)
+    assert abs(price - ref) < 1e-6 * ref
+
+    p64, se = american_option_lsm_cpp_fused(S0, K, R, SIGMA, T, 50, 50_000, False, seed=3)
+    p32, _ = american_option_lsm_cpp_fused(S0, K, R, SIGMA, T, 50, 50_000, False, seed=3,
+                                           dtype=np.float32)
+    assert abs(p32 - p64) < 0.01 * se
@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+from mcop.binomial_tree import american_option_crr
+from mcop.cli import main
+from mcop.greeks import american_greeks, european_greeks
+from mcop.simulate_paths import simulate_gbm_paths
+
+S0, K, R, Q, SIGMA, T = 100.0, 100.0, 0.05, 0.01, 0.2, 1.0
+
+
+def _bs_greeks(is_call):
+    N = lambda x: 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+    n = lambda x: math.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+    sqT = math.sqrt(T)
+    d1 = (math.log(S0 / K) + (R - Q + 0.5 * SIGMA**2) * T) / (SIGMA * sqT)
+    d2 = d1 - SIGMA * sqT
+    dq, dr = math.exp(-Q * T), math.exp(-R * T)
+    gamma = dq * n(d1) / (S0 * SIGMA * sqT)
+    vega = S0 * dq * n(d1) * sqT
+    if is_call:
+        return dict(price=S0 * dq * N(d1) - K * dr * N(d2), delta=dq * N(d1),
+                    gamma=gamma, vega=vega, rho=K * T * dr * N(d2))
+    return dict(price=K * dr * N(-d2) - S0 * dq * N(-d1), delta=-dq * N(-d1),
+                gamma=gamma, vega=vega, rho=-K * T * dr * N(-d2))
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_european_greeks_match_black_scholes(is_call):
+    paths = simulate_gbm_paths(S0, R, SIGMA, T, 1, 400_000, q=Q, seed=11)
+    g = european_greeks(paths, K, R, SIGMA, T, is_call, q=Q)
+    ref = _bs_greeks(is_call)
+    for name, value in ref.items():
+        assert abs(getattr(g, name) - value) < 4 * g.se[name], name
+
+
+def test_american_put_greeks_close_to_binomial_bumps():
+    paths = simulate_gbm_paths(S0, R, SIGMA, T, 50, 100_000, seed=5, layout="time_major")
+    g = american_greeks(paths, K, R, SIGMA, T, is_call=False, degree=3)
+
+    def crr(S=S0, sigma=SIGMA, r=R):
+        # fine tree and a wide spot bump keep the CRR oscillation out of gamma
+        return american_option_crr(S, K, r, sigma, T, n_steps=2000, is_call=False)
+
+    h = 2.0
+    delta = (crr(S0 + h) - crr(S0 - h)) / (2 * h)
+    gamma = (crr(S0 + h) - 2 * crr() + crr(S0 - h)) / h**2
+    vega = (crr(sigma=SIGMA + 0.01) - crr(sigma=SIGMA - 0.01)) / 0.02
+    rho = (crr(r=R + 0.001) - crr(r=R - 0.001)) / 0.002
+
+    assert abs(g.delta - delta) < 0.02
+    assert abs(g.gamma - gamma) < 4 * g.se["gamma"]
+    assert abs(g.vega - vega) / vega < 0.05
+    assert abs(g.rho - rho) / abs(rho) < 0.05
+
+
+def test_cli_greeks(capsys):
+    main(["greeks", "--n-steps", "10", "--n-paths", "5000"])
+    out = capsys.readouterr().out
+    for name in ("price", "delta", "gamma", "vega", "rho"):
+        assert name in out
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from mcop.simulate_paths import simulate_gbm_paths
+from mcop.american_lsm import american_option_lsm, american_option_lsm_batch
+
+R, T = 0.05, 1.0
+
+
+@pytest.fixture(scope="module")
+def paths():
+    return simulate_gbm_paths(100.0, R, 0.2, T, 40, 20_000, seed=21, antithetic=True, layout="time_major")
+
+
+def test_batch_matches_single_strike_pricer(paths):
+    strikes = np.array([85.0, 100.0, 115.0, 90.0, 110.0])
+    calls = np.array([False, False, False, True, True])
+
+    prices, ses = american_option_lsm_batch(paths, strikes, R, T, calls, return_se=True)
+    single = [american_option_lsm(paths, K, R, T, is_call=c) for K, c in zip(strikes, calls)]
+
+    assert np.allclose(prices, single, atol=1e-3)
+    assert np.all((ses > 0) & (ses < 0.2))
+
+
+def test_batch_antithetic_se_uses_pair_means(paths):
+    strikes, calls = [95.0, 105.0], [False, True]
+    half = paths[: paths.shape[0] // 2]
+    # a path set mirrored onto itself: each pair mean is one path's cashflow
+    doubled = np.concatenate([half, half])
+    _, paired = american_option_lsm_batch(doubled, strikes, R, T, calls, return_se=True, antithetic=True)
+    _, single = american_option_lsm_batch(half, strikes, R, T, calls, return_se=True)
+    assert np.allclose(paired, single, rtol=1e-12)
+
+    _, naive = american_option_lsm_batch(paths, strikes, R, T, calls, return_se=True)
+    _, paired = american_option_lsm_batch(paths, strikes, R, T, calls, return_se=True, antithetic=True)
+    assert np.all(paired < naive)
+
+
+def test_batch_maturities_on_sub_grid(paths):
+    prices = american_option_lsm_batch(paths, [100.0, 100.0, 95.0], R, T, False, maturities=[1.0, 0.5, 0.25])
+
+    assert prices[0] == pytest.approx(american_option_lsm(paths, 100.0, R, T, is_call=False), abs=1e-3)
+    assert prices[1] == pytest.approx(american_option_lsm(paths[:, :21], 100.0, R, 0.5, is_call=False), abs=1e-3)
+    assert prices[2] == pytest.approx(american_option_lsm(paths[:, :11], 95.0, R, 0.25, is_call=False), abs=1e-3)
+
+    with pytest.raises(ValueError):
+        american_option_lsm_batch(paths, [100.0], R, T, False, maturities=[0.33])
+
+
+def test_cpp_batch_matches_python_batch(paths):
+    pytest.importorskip("mcop._mcop_cpp")
+    from mcop.american_lsm_cpp import american_option_lsm_cpp_batch
+
+    strikes = np.linspace(80.0, 120.0, 9)
+    calls = strikes > 100.0
+    mats = np.where(calls, 0.5, 1.0)
+
+    py_prices, py_ses = american_option_lsm_batch(paths, strikes, R, T, calls, maturities=mats, return_se=True)
+    cpp_prices, cpp_ses = american_option_lsm_cpp_batch(paths, strikes, R, T, calls, maturities=mats)
+
+    assert np.allclose(cpp_prices, py_prices, atol=1e-3)
+    assert np.allclose(cpp_ses, py_ses, rtol=1e-2)
+
+    # same pair-mean SEs on the mirrored antithetic halves
+    _, py_pair_ses = american_option_lsm_batch(paths, strikes, R, T, calls, maturities=mats,
+                                               return_se=True, antithetic=True)
+    _, cpp_pair_ses = american_option_lsm_cpp_batch(paths, strikes, R, T, calls, maturities=mats,
+                                                    antithetic=True)
+    assert np.allclose(cpp_pair_ses, py_pair_ses, rtol=1e-2)
+    assert np.all(cpp_pair_ses < cpp_ses)
@@ -0,0 +1,29 @@
+import pytest
+
+from mcop.binomial_tree import american_option_crr
+
+_cpp = pytest.importorskip("mcop._mcop_cpp")
+from mcop.american_lsm_cpp import american_option_lsm_cpp_fused
+
+
+def test_fused_put_close_to_binomial_and_thread_independent():
+    S0, K, r, q, sigma, T = 100.0, 100.0, 0.05, 0.0, 0.2, 1.0
+    ref = american_option_crr(S0, K, r, sigma, T, n_steps=500, is_call=False, q=q)
+
+    one = american_option_lsm_cpp_fused(S0, K, r, sigma, T, 50, 100_000, is_call=False, seed=4, n_threads=1)
+    two = american_option_lsm_cpp_fused(S0, K, r, sigma, T, 50, 100_000, is_call=False, seed=4, n_threads=2)
+    assert one == two
+
+    price, se = one
+    assert 0.0 < se < 0.05
+    assert abs(price - ref) < 0.1
+
+
+def test_fused_handles_dividends_and_plain_sampling():
+    S0, K, r, q, sigma, T = 100.0, 95.0, 0.03, 0.04, 0.25, 0.5
+    ref = american_option_crr(S0, K, r, sigma, T, n_steps=500, is_call=True, q=q)
+
+    price, se = american_option_lsm_cpp_fused(
+        S0, K, r, sigma, T, 25, 60_001, is_call=True, q=q, seed=8, antithetic=False
+    )
+    assert abs(price - ref) < 4 * se + 0.05
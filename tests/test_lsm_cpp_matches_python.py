@@ -5,7 +5,7 @@ from mcop.simulate_paths import simulate_gbm_paths
 from mcop.american_lsm import american_option_lsm
 
 _cpp = pytest.importorskip("mcop._mcop_cpp")
-from mcop.american_lsm_cpp import american_option_lsm_cpp
+from mcop.american_lsm_cpp import _as_path_buffer, american_option_lsm_cpp
 
 def test_cpp_lsm_matches_python_reasonably():
     S0, K, r, q, sigma, T = 100.0, 100.0, 0.05, 0.0, 0.2, 1.0
@@ -18,3 +18,44 @@ def test_cpp_lsm_matches_python_reasonably():
     cpp_price = american_option_lsm_cpp(paths, K, r, T, is_call=False, degree=2)
 
     assert abs(py_price - cpp_price) < 1e-2
+
+
+def test_cpp_lsm_threads_deterministic_and_match_python():
+    S0, K, r, q, sigma, T = 100.0, 110.0, 0.03, 0.0, 0.3, 0.5
+    paths = simulate_gbm_paths(S0, r, sigma, T, 50, 40_000, q=q, seed=9, antithetic=True)
+
+    prices = [american_option_lsm_cpp(paths, K, r, T, is_call=False, degree=3, n_threads=n)
+              for n in (1, 2, 4)]
+    assert prices[0] == prices[1] == prices[2]
+
+    py_price = american_option_lsm(paths, K, r, T, is_call=False, degree=3, q=q)
+    assert abs(py_price - prices[0]) < 1e-2
+
+
+def test_cpp_lsm_runs_concurrently_from_python_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    r, T = 0.05, 1.0
+    paths = simulate_gbm_paths(100.0, r, 0.2, T, 50, 20_000, seed=1, antithetic=True)
+    strikes = [90.0, 100.0, 110.0, 120.0]
+
+    serial = [american_option_lsm_cpp(paths, K, r, T, is_call=False) for K in strikes]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threaded = list(pool.map(lambda K: american_option_lsm_cpp(paths, K, r, T, is_call=False), strikes))
+
+    assert threaded == serial
+
+
+def test_cpp_lsm_accepts_time_major_paths_without_copy():
+    r, T = 0.05, 1.0
+    kw = dict(S0=100.0, r=r, sigma=0.2, T=T, n_steps=40, n_paths=10_000, seed=2, antithetic=True)
+    path_major = simulate_gbm_paths(**kw)
+    time_major = simulate_gbm_paths(**kw, layout="time_major")
+
+    a = american_option_lsm_cpp(path_major, 100.0, r, T, is_call=False)
+    b = american_option_lsm_cpp(time_major, 100.0, r, T, is_call=False)
+    # strided view of a larger array is read in place as well
+    view = np.hstack([path_major, path_major])[:, :41]
+    assert _as_path_buffer(view) is view
+    c = american_option_lsm_cpp(view, 100.0, r, T, is_call=False)
+    assert a == b == c
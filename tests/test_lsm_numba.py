@@ -0,0 +1,55 @@
+import sys
+
+import numpy as np
+import pytest
+
+from mcop import engines
+from mcop.american_lsm import american_option_lsm
+from mcop.cli import main
+from mcop.simulate_paths import simulate_gbm_paths
+
+
+@pytest.fixture(scope="module")
+def lsm_numba():
+    pytest.importorskip("numba")
+    from mcop.american_lsm_numba import american_option_lsm_numba
+    return american_option_lsm_numba
+
+
+@pytest.mark.parametrize("K, is_call, degree", [(100.0, False, 2), (110.0, False, 3),
+                                                 (95.0, True, 2)])
+def test_numba_lsm_matches_python(lsm_numba, K, is_call, degree):
+    r, q, T = 0.05, 0.04, 1.0
+    paths = simulate_gbm_paths(100.0, r, 0.25, T, 50, 40_000, q=q, seed=11, antithetic=True)
+
+    py_price = american_option_lsm(paths, K, r, T, is_call=is_call, degree=degree, q=q)
+    nb_price = lsm_numba(paths, K, r, T, is_call=is_call, degree=degree)
+    assert nb_price == pytest.approx(py_price, abs=1e-6)
+
+
+def test_numba_lsm_layouts_dtypes_and_threads(lsm_numba):
+    r, T = 0.05, 1.0
+    kw = dict(S0=100.0, r=r, sigma=0.2, T=T, n_steps=40, n_paths=20_000, seed=2, antithetic=True)
+    path_major = simulate_gbm_paths(**kw)
+    time_major = simulate_gbm_paths(**kw, layout="time_major")
+
+    prices = [lsm_numba(time_major, 100.0, r, T, is_call=False, n_threads=n) for n in (1, 2)]
+    assert prices[0] == prices[1] == lsm_numba(path_major, 100.0, r, T, is_call=False)
+    single = lsm_numba(path_major.astype(np.float32), 100.0, r, T, is_call=False)
+    assert single == pytest.approx(prices[0], abs=1e-3)
+
+    price, se = lsm_numba(path_major, 100.0, r, T, is_call=False, return_se=True)
+    assert price == prices[0] and 0.0 < se < 0.1
+
+
+def test_cli_numba_engine_falls_back_to_python(monkeypatch, capsys):
+    # simulate a host without Numba
+    monkeypatch.setitem(sys.modules, "numba", None)
+    monkeypatch.delitem(sys.modules, "mcop.american_lsm_numba", raising=False)
+    monkeypatch.setattr(engines, "_loaded", {})
+    monkeypatch.setattr(engines, "_errors", {})
+
+    main(["price", "--engine", "numba", "--n-paths", "2000", "--n-steps", "10"])
+    out = capsys.readouterr()
+    assert "engine 'numba' is not available" in out.err and "using 'python'" in out.err
+    assert "(LSM, python)" in out.out
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from mcop.simulate_paths import iter_gbm_path_blocks, simulate_gbm_paths
+from mcop.binomial_tree import american_option_crr
+from mcop.lsm_policy import (
+    LSMPolicy, PolicyCache, american_option_lsm_oos, fit_lsm_policy, policy_cashflows,
+    price_with_policy,
+)
+
+S0, K, R, SIGMA, T, N_STEPS = 100.0, 100.0, 0.05, 0.2, 1.0, 50
+
+
+@pytest.fixture(scope="module")
+def policy():
+    train = simulate_gbm_paths(S0, R, SIGMA, T, N_STEPS, 40_000, seed=1, antithetic=True)
+    return fit_lsm_policy(train, K, R, T, is_call=False, degree=3, sigma=SIGMA)
+
+
+def test_out_of_sample_price_close_to_binomial(policy):
+    ref = american_option_crr(S0, K, R, SIGMA, T, n_steps=500, is_call=False)
+    price, se, lo, hi = american_option_lsm_oos(S0, policy, SIGMA, 100_000, seed=2, block_size=16_384)
+
+    assert lo < price < hi
+    # out-of-sample is a lower bound up to MC noise
+    assert ref - 0.1 < price < ref + 3 * se
+
+
+def test_streaming_blocks_match_single_array(policy):
+    fresh = simulate_gbm_paths(S0, R, SIGMA, T, N_STEPS, 10_000, seed=3)
+    whole = price_with_policy(policy, fresh)
+    blocks = price_with_policy(policy, (fresh[i:i + 1_000] for i in range(0, 10_000, 1_000)))
+    assert whole == blocks
+
+
+def test_antithetic_se_uses_pair_means(policy):
+    blocks = list(iter_gbm_path_blocks(S0, R, SIGMA, T, N_STEPS, 20_000, block_size=4_000, seed=6,
+                                       antithetic=True))
+    price, se, _, _ = price_with_policy(policy, blocks, antithetic=True)
+
+    cf = np.concatenate([policy_cashflows(policy, b) for b in blocks])
+    pairs = 0.5 * (cf[0::2] + cf[1::2])
+    assert price == pytest.approx(cf.mean(), rel=1e-12)
+    assert se == pytest.approx(pairs.std(ddof=1) / np.sqrt(pairs.size), rel=1e-9)
+    # treating the mirrored paths as independent overstates the SE
+    assert se < price_with_policy(policy, blocks)[1]
+
+    with pytest.raises(ValueError, match="even"):
+        american_option_lsm_oos(S0, policy, SIGMA, 1_001, seed=2)
+
+
+def test_policy_roundtrip_and_cache(tmp_path, policy):
+    path = tmp_path / "put.npz"
+    policy.save(path)
+    loaded = LSMPolicy.load(path)
+    assert loaded.K == policy.K and loaded.basis == policy.basis and loaded.sigma == SIGMA
+    assert np.array_equal(loaded.coefficients, policy.coefficients, equal_nan=True)
+
+    params = dict(K=K, r=R, T=T, n_steps=N_STEPS, is_call=False, degree=3, sigma=SIGMA)
+    cache = PolicyCache(tmp_path / "cache")
+    assert cache.get(**params) is None
+    cache.put(policy)
+
+    # a fresh process-level cache finds it on disk
+    other = PolicyCache(tmp_path / "cache")
+    fitted = other.get_or_fit(lambda: pytest.fail("should not refit"), **params)
+    assert np.array_equal(fitted.coefficients, policy.coefficients, equal_nan=True)
+    assert (other.hits, other.misses) == (1, 0)
+
+
+@pytest.mark.parametrize("basis", ["monomial", "scaled", "laguerre", "chebyshev"])
+def test_cpp_engine_accepts_policy(basis):
+    pytest.importorskip("mcop._mcop_cpp")
+    from mcop.american_lsm_cpp import american_option_lsm_cpp_with_policy
+
+    train = simulate_gbm_paths(S0, R, SIGMA, T, 20, 10_000, seed=4, antithetic=True)
+    fresh = simulate_gbm_paths(S0, R, SIGMA, T, 20, 10_000, seed=5, layout="time_major")
+    pol = fit_lsm_policy(train, K, R, T, is_call=False, degree=3, basis=basis)
+
+    py_price, py_se, _, _ = price_with_policy(pol, fresh)
+    cpp_price, cpp_se = american_option_lsm_cpp_with_policy(fresh, pol)
+    assert cpp_price == pytest.approx(py_price, abs=1e-9)
+    assert cpp_se == pytest.approx(py_se, rel=1e-6)
+
+    pairs = next(iter_gbm_path_blocks(S0, R, SIGMA, T, 20, 10_000, block_size=10_000, seed=5,
+                                      antithetic=True))
+    py_price, py_se, _, _ = price_with_policy(pol, pairs, antithetic=True)
+    cpp_price, cpp_se = american_option_lsm_cpp_with_policy(pairs, pol, antithetic=True)
+    assert cpp_price == pytest.approx(py_price, abs=1e-9)
+    assert cpp_se == pytest.approx(py_se, rel=1e-6)
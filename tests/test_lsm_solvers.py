@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from numpy.polynomial import chebyshev, laguerre
+
+from mcop.simulate_paths import simulate_gbm_paths
+from mcop.american_lsm import american_option_lsm, _fill_basis, BASES, SOLVERS
+
+
+def test_basis_families_match_numpy_polynomials():
+    S = np.linspace(60.0, 140.0, 9)
+    out = np.empty((5, S.size))
+    work = np.empty((2, S.size))
+
+    _fill_basis(out, S, "monomial", 100.0, work)
+    assert np.allclose(out, np.vander(S, 5, increasing=True).T)
+
+    _fill_basis(out, S, "scaled", 100.0, work)
+    assert np.allclose(out, np.vander(S / 100.0, 5, increasing=True).T)
+
+    _fill_basis(out, S, "laguerre", 100.0, work)
+    assert np.allclose(out, laguerre.lagvander(S / 100.0, 4).T)
+
+    bounds = _fill_basis(out, S, "chebyshev", 100.0, work)
+    assert bounds == (60.0, 140.0)
+    assert np.allclose(out, chebyshev.chebvander((S - 100.0) / 40.0, 4).T)
+
+
+@pytest.mark.parametrize("basis", BASES)
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_all_basis_solver_combinations_agree(basis, solver):
+    r, T = 0.05, 1.0
+    paths = simulate_gbm_paths(100.0, r, 0.2, T, 30, 20_000, seed=17, antithetic=True, layout="time_major")
+
+    ref = american_option_lsm(paths, 100.0, r, T, is_call=False, degree=3)
+    est = american_option_lsm(paths, 100.0, r, T, is_call=False, degree=3, basis=basis, solver=solver)
+    assert abs(est - ref) < 1e-3
+
+
+def test_unknown_basis_or_solver_rejected():
+    paths = simulate_gbm_paths(100.0, 0.05, 0.2, 1.0, 5, 100, seed=1)
+    with pytest.raises(ValueError):
+        american_option_lsm(paths, 100.0, 0.05, 1.0, is_call=False, basis="hermite")
+    with pytest.raises(ValueError):
+        american_option_lsm(paths, 100.0, 0.05, 1.0, is_call=False, solver="svd")
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_deep_otm_steps_with_few_itm_paths(solver):
+    # some steps have fewer ITM paths than basis columns
+    paths = simulate_gbm_paths(100.0, 0.05, 0.2, 1.0, 20, 2_000, seed=1)
+    est = american_option_lsm(paths, 60.0, 0.05, 1.0, is_call=False, degree=3, solver=solver)
+    assert est == pytest.approx(0.0079477, abs=1e-6)
@@ -0,0 +1,48 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from mcop.mlmc import mlmc_level, mlmc_price
+from mcop.payoffs import european_call, european_put
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+BS_CALL = 10.450583572185565
+
+
+def test_hits_requested_rmse():
+    res = mlmc_price(partial(european_call, K=K), S0, R, SIGMA, T, rmse=0.02, seed=1)
+
+    assert res.converged
+    assert res.se <= 0.02 / np.sqrt(2) + 1e-12
+    assert abs(res.price - BS_CALL) < 3 * 0.02
+    assert res.total_cost == sum(lv.cost_per_sample * lv.n_samples for lv in res.levels)
+
+
+def test_correction_variance_decays():
+    res = mlmc_price(partial(european_put, K=K), S0, R, SIGMA, T, rmse=0.02, seed=2)
+    var = [lv.variance for lv in res.levels[1:]]
+    # Milstein: V_l ~ 2^-2l, so each finer level needs fewer samples
+    assert all(b < 0.5 * a for a, b in zip(var, var[1:]))
+    assert res.levels[0].n_samples > res.levels[-1].n_samples
+
+
+def test_levels_share_brownian_increments():
+    payoff = partial(european_call, K=K)
+    fine = mlmc_level(payoff, 3, 1_000, np.random.default_rng(0), S0, R, SIGMA, T)
+    # independent coarse and fine paths would give a variance close to 2 * Var(P)
+    assert fine.var() < 0.01 * mlmc_level(payoff, 0, 1_000, np.random.default_rng(0),
+                                          S0, R, SIGMA, T).var()
+
+
+def test_path_dependent_payoff_and_validation():
+    def asian_call(paths):
+        return np.maximum(paths[:, 1:].mean(axis=1) - K, 0.0)
+
+    a = mlmc_price(asian_call, S0, R, SIGMA, T, rmse=0.05, seed=3, scheme="euler")
+    b = mlmc_price(asian_call, S0, R, SIGMA, T, rmse=0.05, seed=3, scheme="euler")
+    assert a.price == b.price
+    assert 5.0 < a.price < 6.5  # arithmetic Asian call, continuous monitoring ~5.76
+
+    with pytest.raises(ValueError):
+        mlmc_price(asian_call, S0, R, SIGMA, T, rmse=0.05, scheme="exact")
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from mcop import simulate_paths
+from mcop.simulate_paths import simulate_gbm_paths
+
+ARGS = dict(S0=100.0, r=0.03, sigma=0.25, T=0.5, n_steps=8, q=0.01)
+
+
+@pytest.mark.parametrize("antithetic", [False, True])
+def test_parallel_paths_identical_for_any_worker_count(monkeypatch, antithetic):
+    # small chunks so several substreams are exercised
+    monkeypatch.setattr(simulate_paths, "_PARALLEL_CHUNK", 100)
+
+    ref = simulate_gbm_paths(n_paths=1_001, seed=11, antithetic=antithetic, n_workers=1, **ARGS)
+    for n_workers in (2, 3, 8):
+        paths = simulate_gbm_paths(n_paths=1_001, seed=11, antithetic=antithetic, n_workers=n_workers, **ARGS)
+        assert np.array_equal(paths, ref)
+
+    assert np.all(paths[:, 0] == ARGS["S0"])
+    if antithetic:
+        log_inc = np.diff(np.log(ref), axis=1)
+        drift = (ARGS["r"] - ARGS["q"] - 0.5 * ARGS["sigma"] ** 2) * ARGS["T"] / ARGS["n_steps"]
+        assert np.allclose(log_inc[:500] + log_inc[501:], 2 * drift)
+
+
+def test_parallel_paths_reject_bad_worker_count():
+    with pytest.raises(ValueError):
+        simulate_gbm_paths(n_paths=10, seed=1, n_workers=0, **ARGS)
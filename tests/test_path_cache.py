@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from mcop.american_lsm import american_option_lsm
+from mcop.cache import PathCache
+from mcop.simulate_paths import simulate_gbm_paths
+
+PARAMS = dict(S0=100.0, r=0.05, sigma=0.2, T=1.0, n_steps=20, n_paths=2_000, seed=1,
+              antithetic=True, layout="time_major")
+NBYTES = 2_000 * 21 * 8
+
+
+def test_memory_hits_return_same_read_only_array():
+    cache = PathCache()
+    a = cache.get_or_simulate(**PARAMS)
+    b = cache.get_or_simulate(**PARAMS)
+
+    assert a is b and not a.flags.writeable
+    assert np.array_equal(a, simulate_gbm_paths(**PARAMS))
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.nbytes == NBYTES
+
+
+def test_lru_evicts_least_recently_used_within_byte_budget():
+    cache = PathCache(max_bytes=2 * NBYTES)
+    for seed in (1, 2):
+        cache.get_or_simulate(**{**PARAMS, "seed": seed})
+    cache.get_or_simulate(**PARAMS)                    # touch seed 1
+    cache.get_or_simulate(**{**PARAMS, "seed": 3})     # evicts seed 2
+
+    assert cache.evictions == 1 and cache.nbytes == 2 * NBYTES
+    assert cache.get(**PARAMS) is not None
+    assert cache.get(**{**PARAMS, "seed": 2}) is None
+    assert cache.stats()["entries"] == 2
+
+
+def test_disk_tier_is_memory_mapped_in_a_new_cache(tmp_path):
+    first = PathCache(cache_dir=tmp_path).get_or_simulate(**PARAMS)
+
+    cache = PathCache(cache_dir=tmp_path)
+    mapped = cache.get_or_simulate(**PARAMS)
+    assert isinstance(mapped, np.memmap) and mapped.flags.f_contiguous
+    assert (cache.disk_hits, cache.misses, cache.nbytes) == (1, 0, 0)
+    assert np.array_equal(mapped, first)
+
+    price = american_option_lsm(mapped, 100.0, 0.05, 1.0, is_call=False)
+    assert price == american_option_lsm(np.array(first), 100.0, 0.05, 1.0, is_call=False)
+
+
+def test_memmap_used_in_place_by_cpp_engine(tmp_path):
+    cpp = pytest.importorskip("mcop._mcop_cpp")  # noqa: F841
+    from mcop.american_lsm_cpp import _as_path_buffer, american_option_lsm_cpp
+
+    PathCache(cache_dir=tmp_path).get_or_simulate(**PARAMS)
+    mapped = PathCache(cache_dir=tmp_path).get_or_simulate(**PARAMS)
+    assert np.shares_memory(_as_path_buffer(mapped), mapped)
+    assert american_option_lsm_cpp(mapped, 100.0, 0.05, 1.0, is_call=False) > 0.0
+
+
+def test_unseeded_and_parallel_keys():
+    cache = PathCache()
+    cache.get_or_simulate(**{**PARAMS, "seed": None})
+    assert cache.stats()["entries"] == 0
+
+    serial = cache.get_or_simulate(**PARAMS)
+    parallel = cache.get_or_simulate(**PARAMS, n_workers=2)
+    assert parallel is not serial
+    assert cache.get_or_simulate(**PARAMS, n_workers=4) is parallel
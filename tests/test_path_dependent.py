@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from mcop.path_dependent import (
+    AsianAccumulator,
+    BarrierAccumulator,
+    LookbackAccumulator,
+    accumulate_paths,
+    arithmetic_asian_price,
+    geometric_asian_price,
+    simulate_path_payoffs,
+)
+from mcop.simulate_paths import simulate_gbm_paths
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+BS_CALL = 10.450583572185565
+# continuously monitored down-and-in call, barrier 90 (Reiner–Rubinstein)
+DI_CALL = 1.7851119139398985
+
+
+def test_accumulators_match_full_matrix():
+    paths = simulate_gbm_paths(S0, R, SIGMA, T, 20, 2_000, seed=0, layout="time_major")
+    accs = [
+        AsianAccumulator(K, True),
+        AsianAccumulator(K, False, average="geometric"),
+        LookbackAccumulator(True),
+        LookbackAccumulator(False, K=K),
+        BarrierAccumulator(K, 110.0, True, kind="up-and-out"),
+    ]
+    asian, geo, look_float, look_fixed, up_out = accumulate_paths(accs, paths, T)
+
+    S, ST = paths[:, 1:], paths[:, -1]
+    np.testing.assert_allclose(asian, np.maximum(S.mean(axis=1) - K, 0.0))
+    np.testing.assert_allclose(geo, np.maximum(K - np.exp(np.log(S).mean(axis=1)), 0.0))
+    np.testing.assert_allclose(look_float, ST - paths.min(axis=1))
+    np.testing.assert_allclose(look_fixed, np.maximum(K - paths.min(axis=1), 0.0))
+    knocked = (paths >= 110.0).any(axis=1)
+    np.testing.assert_allclose(up_out, np.where(knocked, 0.0, np.maximum(ST - K, 0.0)))
+
+
+@pytest.mark.parametrize("is_call", [True, False])
+def test_geometric_asian_closed_form(is_call):
+    (g,) = simulate_path_payoffs([AsianAccumulator(K, is_call, average="geometric")],
+                                 S0, R, SIGMA, T, 12, 200_000, seed=1)
+    x = np.exp(-R * T) * g
+    exact = geometric_asian_price(S0, K, R, SIGMA, T, 12, is_call)
+    assert abs(x.mean() - exact) < 4 * x.std() / np.sqrt(x.size)
+
+
+def test_geometric_control_variate_cuts_se():
+    plain, se_plain = arithmetic_asian_price(S0, K, R, SIGMA, T, 50, 50_000, True, seed=2,
+                                             control_variate=False)
+    cv, se_cv = arithmetic_asian_price(S0, K, R, SIGMA, T, 50, 50_000, True, seed=2)
+    assert se_cv < se_plain / 10
+    assert abs(cv - plain) < 4 * se_plain
+    # arithmetic average dominates the geometric one
+    assert cv > geometric_asian_price(S0, K, R, SIGMA, T, 50, True)
+
+
+def test_bridge_corrected_barrier_is_continuous():
+    accs = [
+        BarrierAccumulator(K, 90.0, True, kind="down-and-in", sigma=SIGMA),
+        BarrierAccumulator(K, 90.0, True, kind="down-and-out", sigma=SIGMA),
+        BarrierAccumulator(K, 90.0, True, kind="down-and-in"),
+    ]
+    d_in, d_out, d_in_discrete = simulate_path_payoffs(accs, S0, R, SIGMA, T, 25, 100_000,
+                                                       seed=3)
+    disc = np.exp(-R * T)
+    x = disc * d_in
+    assert abs(x.mean() - DI_CALL) < 4 * x.std() / np.sqrt(x.size)
+    # discrete monitoring misses crossings between dates
+    assert disc * d_in_discrete.mean() < DI_CALL - 0.2
+    # in + out is the vanilla payoff on every path
+    vanilla = simulate_path_payoffs([BarrierAccumulator(K, 0.0, True, kind="down-and-out")],
+                                    S0, R, SIGMA, T, 25, 100_000, seed=3)[0]
+    np.testing.assert_allclose(d_in + d_out, vanilla)
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        AsianAccumulator(K, True, average="harmonic")
+    with pytest.raises(ValueError):
+        BarrierAccumulator(K, 90.0, True, kind="sideways")
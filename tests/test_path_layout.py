@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from mcop.simulate_paths import simulate_gbm_paths
+from mcop.american_lsm import american_option_lsm
+
+ARGS = dict(S0=100.0, r=0.05, sigma=0.2, T=1.0, n_steps=30, n_paths=5_001, seed=3, antithetic=True)
+
+
+def test_time_major_layout_same_values_contiguous_columns():
+    path_major = simulate_gbm_paths(**ARGS)
+    time_major = simulate_gbm_paths(**ARGS, layout="time_major")
+
+    assert path_major.flags.c_contiguous
+    assert time_major.flags.f_contiguous
+    assert np.array_equal(path_major, time_major)
+    assert time_major[:, 7].flags.c_contiguous
+
+    a = american_option_lsm(path_major, 100.0, 0.05, 1.0, is_call=False)
+    b = american_option_lsm(time_major, 100.0, 0.05, 1.0, is_call=False)
+    assert a == b
+
+
+def test_unknown_layout_rejected():
+    with pytest.raises(ValueError):
+        simulate_gbm_paths(**ARGS, layout="column")
@@ -1,5 +1,7 @@
 import numpy as np
-from mcop.payoffs import european_call, european_put
+from mcop.payoffs import (
+    european_call, european_call_derivative, european_put, european_put_derivative,
+)
 
 def test_european_call_put_payoffs():
     paths = np.array([
@@ -13,3 +15,6 @@ def test_european_call_put_payoffs():
 
     assert np.allclose(call, [0.0, 0.0, 10.0])
     assert np.allclose(put, [10.0, 0.0, 0.0])
+    # the derivatives take the same paths array
+    assert np.allclose(european_call_derivative(paths, K), [0.0, 0.0, 1.0])
+    assert np.allclose(european_put_derivative(paths, K), [-1.0, 0.0, 0.0])
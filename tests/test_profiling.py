@@ -0,0 +1,62 @@
+import json
+
+import numpy as np
+import pytest
+
+from mcop.american_lsm import american_option_lsm
+from mcop.cli import main
+from mcop.profiling import LSMProfile
+from mcop.simulate_paths import simulate_gbm_paths
+
+K, R, T = 100.0, 0.05, 1.0
+
+
+@pytest.fixture(scope="module")
+def paths():
+    return simulate_gbm_paths(100.0, R, 0.2, T, 20, 5_000, seed=7, antithetic=True,
+                              layout="time_major")
+
+
+def expected_itm(paths):
+    return [int(np.count_nonzero(paths[:, t] < K)) for t in range(paths.shape[1] - 2, 0, -1)]
+
+
+def test_python_profile_is_transparent(paths):
+    seen = []
+    prof = LSMProfile(callback=lambda step, n_itm, cond: seen.append(step))
+    price = american_option_lsm(paths, K, R, T, is_call=False, basis="scaled", profile=prof)
+
+    assert price == american_option_lsm(paths, K, R, T, is_call=False, basis="scaled")
+    assert prof.engine == "python"
+    assert set(prof.phase_seconds) == {"payoff", "itm_mask", "basis", "regression",
+                                       "exercise", "diagnostics"}
+    assert prof.steps == seen == list(range(19, 0, -1))
+    assert prof.n_itm == expected_itm(paths)
+    assert all(c >= 1.0 for c in prof.cond)
+    assert prof.bytes_allocated > paths.shape[0] * 8 * 5
+
+
+def test_cpp_profile_matches_python_diagnostics(paths):
+    pytest.importorskip("mcop._mcop_cpp")
+    from mcop.american_lsm_cpp import american_option_lsm_cpp
+
+    prof = LSMProfile()
+    price = american_option_lsm_cpp(paths, K, R, T, is_call=False, profile=prof)
+    assert price == american_option_lsm_cpp(paths, K, R, T, is_call=False)
+    assert prof.engine == "cpp"
+    assert set(prof.phase_seconds) == {"accumulate", "regression", "exercise"}
+    assert prof.n_itm == expected_itm(paths)
+    assert prof.bytes_allocated >= paths.shape[0] * 8
+
+
+def test_cli_profile_table_and_json(tmp_path, capsys):
+    args = ["price", "--n-paths", "2000", "--n-steps", "10"]
+    main(args + ["--profile"])
+    out = capsys.readouterr().out
+    assert "simulate" in out and "regression" in out and "condition number" in out
+
+    target = tmp_path / "profile.json"
+    main(args + ["--profile", str(target)])
+    data = json.loads(target.read_text())
+    assert data["engine"] == "python" and len(data["steps"]) == 9
+    assert data["total_seconds"] == pytest.approx(sum(data["phase_seconds"].values()))
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from mcop.payoffs import european_call
+from mcop.pricing import mc_price
+from mcop.simulate_paths import _brownian_bridge_increments, simulate_gbm_paths
+from mcop.variance_reduction import mc_mean_se
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+BS_CALL = 10.450583572185565
+
+
+def test_brownian_bridge_gives_iid_increments():
+    G = np.random.default_rng(0).standard_normal((100_000, 12))
+    Z = _brownian_bridge_increments(G)
+    assert np.allclose(np.cov(Z.T), np.eye(12), atol=0.02)
+    # the first coordinate alone fixes the terminal value
+    assert np.allclose(Z.sum(axis=1), np.sqrt(12) * G[:, 0])
+
+
+def test_sobol_replications_give_valid_and_much_smaller_se():
+    n_rep, n = 16, 16 * 2048
+    qmc = simulate_gbm_paths(S0, R, SIGMA, T, 8, n, seed=1, sampler="sobol", replications=n_rep)
+    mc = simulate_gbm_paths(S0, R, SIGMA, T, 8, n, seed=1)
+
+    price, se, lo, hi = mc_price(european_call(qmc, K), R, T, replications=n_rep)
+    _, se_mc, _, _ = mc_price(european_call(mc, K), R, T)
+
+    assert lo < BS_CALL < hi
+    assert se < se_mc / 10
+    assert mc_mean_se(np.exp(-R * T) * european_call(qmc, K), replications=n_rep) == (
+        pytest.approx(price), pytest.approx(se))
+
+
+def test_sobol_reproducible_and_layouts_match():
+    a = simulate_gbm_paths(S0, R, SIGMA, T, 5, 1024, seed=7, sampler="sobol", replications=4)
+    b = simulate_gbm_paths(S0, R, SIGMA, T, 5, 1024, seed=7, sampler="sobol", replications=4,
+                           layout="time_major")
+    assert np.array_equal(a, b) and b.flags.f_contiguous
+    assert np.all(a[:, 0] == S0)
+
+
+def test_sampler_validation():
+    with pytest.raises(ValueError):
+        simulate_gbm_paths(S0, R, SIGMA, T, 5, 1000, sampler="sobol", replications=3)
+    with pytest.raises(ValueError):
+        simulate_gbm_paths(S0, R, SIGMA, T, 5, 1024, sampler="sobol", antithetic=True)
+    with pytest.raises(ValueError):
+        simulate_gbm_paths(S0, R, SIGMA, T, 5, 1024, replications=4)
+    with pytest.raises(ValueError):
+        mc_price(np.ones(10), R, T, replications=3)
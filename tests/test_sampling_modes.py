@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from scipy.special import ndtr
+
+from mcop.cli import main
+from mcop.payoffs import european_call
+from mcop.pricing import mc_price
+from mcop.simulate_paths import simulate_gbm_paths
+from mcop.variance_reduction import mc_mean_se
+
+S0, K, R, SIGMA, T = 100.0, 100.0, 0.05, 0.2, 1.0
+BS_CALL = 10.450583572185565
+
+
+def test_stratified_terminal_values_cover_each_stratum():
+    strata, n = 32, 32 * 64
+    paths = simulate_gbm_paths(S0, R, SIGMA, T, 10, n, seed=1, sampler="stratified", strata=strata)
+    # standardised terminal Brownian value, mapped back to its stratum
+    W = (np.log(paths[:, -1] / S0) - (R - 0.5 * SIGMA**2) * T) / (SIGMA * np.sqrt(T))
+    stratum = np.floor(ndtr(W) * strata).astype(int)
+    assert np.array_equal(stratum, np.repeat(np.arange(strata), 64))
+
+
+def test_lhs_marginals_are_latin():
+    n = 256
+    paths = simulate_gbm_paths(S0, R, SIGMA, T, 4, n, seed=2, sampler="lhs")
+    dt = T / 4
+    Z = (np.diff(np.log(paths), axis=1) - (R - 0.5 * SIGMA**2) * dt) / (SIGMA * np.sqrt(dt))
+    for d in range(4):
+        assert np.array_equal(np.sort(np.floor(ndtr(Z[:, d]) * n)), np.arange(n))
+
+
+@pytest.mark.parametrize("sampler, kw", [
+    ("stratified", {"strata": 64}),
+    ("lhs", {"replications": 16}),
+])
+def test_se_is_valid_and_beats_plain_mc(sampler, kw):
+    n = 2**15
+    se_key = "strata" if sampler == "stratified" else "replications"
+    ests = []
+    for seed in range(8):
+        paths = simulate_gbm_paths(S0, R, SIGMA, T, 4, n, seed=seed, sampler=sampler, **kw)
+        ests.append(mc_price(european_call(paths, K), R, T, **{se_key: kw[se_key]})[:2])
+    prices, ses = np.array(ests).T
+
+    plain = simulate_gbm_paths(S0, R, SIGMA, T, 4, n, seed=0)
+    se_plain = mc_price(european_call(plain, K), R, T)[1]
+
+    assert abs(prices.mean() - BS_CALL) < 4 * ses.mean() / np.sqrt(len(ses))
+    assert ses.mean() < se_plain
+    # reported SE agrees with the spread across seeds
+    assert 0.4 < prices.std(ddof=1) / ses.mean() < 2.0
+
+
+def test_stratified_se_helper():
+    x = np.concatenate([np.zeros(10), np.ones(10)])
+    # no variation inside strata -> zero stratified SE
+    assert mc_mean_se(x, strata=2) == (0.5, 0.0)
+    with pytest.raises(ValueError):
+        mc_mean_se(np.ones(9), strata=2)
+    with pytest.raises(ValueError):
+        simulate_gbm_paths(S0, R, SIGMA, T, 4, 100, strata=4)
+
+
+def test_cli_sampler_reports_se(capsys):
+    main(["price", "--n-steps", "10", "--n-paths", "4096", "--sampler", "stratified"])
+    assert "(se " in capsys.readouterr().out
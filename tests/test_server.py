@@ -0,0 +1,84 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from mcop.american_lsm import american_option_lsm
+from mcop.lsm_policy import policy_cashflows
+from mcop.server import PricingClient, PricingServer, serve
+from mcop.simulate_paths import simulate_gbm_paths
+
+MARKET = dict(r=0.05, sigma=0.2, T=1.0)
+OPTS = dict(n_steps=20, n_paths=4_000, seed=7)
+
+
+def test_price_matches_direct_lsm_on_same_seed():
+    server = PricingServer(**OPTS)
+    out = asyncio.run(server.price(dict(S0=97.0, K=100.0, type="put", **MARKET)))
+
+    paths = simulate_gbm_paths(97.0, 0.05, 0.2, 1.0, 20, 4_000, seed=7, antithetic=True,
+                               layout="time_major")
+    assert out["price"] == pytest.approx(american_option_lsm(paths, 100.0, 0.05, 1.0, False),
+                                         abs=1e-9)
+
+
+def test_concurrent_requests_share_one_simulation():
+    server = PricingServer(**OPTS)
+    requests = [dict(id=i, S0=95.0 + i % 4, K=100.0, type="put", **MARKET) for i in range(12)]
+
+    async def run():
+        return await asyncio.gather(*(server.price(req) for req in requests))
+
+    out = asyncio.run(run())
+    assert [o["id"] for o in out] == list(range(12))
+    assert server.paths.stats()["entries"] == 1
+    assert server.coalesced >= 11 + 8  # 11 waits on the path set, 8 on duplicate prices
+    # exact repeats are served from the result cache
+    again = asyncio.run(server.price(requests[0]))
+    assert again["cached"] and again["price"] == out[0]["price"]
+
+
+def test_policy_prices_shifted_spots_out_of_sample():
+    server = PricingServer(**OPTS)
+    spots = (101.0, 101.5, 90.0, 70.0)  # 101.5 shares 101's spot bucket
+
+    async def run():
+        return [await server.price(dict(S0=S0, K=100.0, type="put", policy=True, **MARKET))
+                for S0 in spots]
+
+    out = asyncio.run(run())
+    assert (server.policy_hits, server.policy_misses) == (1, 3)
+    for S0, res in zip(spots, out):
+        paths = simulate_gbm_paths(S0, 0.05, 0.2, 1.0, 20, 4_000, seed=7, antithetic=True)
+        in_sample = american_option_lsm(paths, 100.0, 0.05, 1.0, False)
+        # a rule fitted near S0 on independent paths agrees with in-sample LSM
+        assert abs(res["price"] - in_sample) < 3 * res["se"]
+
+    # the SE is over the (i, i + n/2) antithetic pairs, not over single paths
+    policy = next(iter(server._policies.values()))  # fitted for S0 = 101
+    cf = policy_cashflows(policy, simulate_gbm_paths(101.0, 0.05, 0.2, 1.0, 20, 4_000, seed=7,
+                                                      antithetic=True))
+    pairs = 0.5 * (cf[:2_000] + cf[2_000:])
+    assert out[0]["se"] == pytest.approx(pairs.std(ddof=1) / np.sqrt(pairs.size), rel=1e-6)
+    assert out[0]["se"] < cf.std(ddof=1) / np.sqrt(cf.size)
+
+
+def test_socket_round_trip_and_errors(tmp_path):
+    path = str(tmp_path / "mcop.sock")
+    ready = threading.Event()
+    thread = threading.Thread(target=serve, kwargs=dict(path=path, ready=lambda _: ready.set(),
+                                                        **OPTS))
+    thread.start()
+    assert ready.wait(10)
+
+    with PricingClient(path) as client:
+        out = client.price(S0=100.0, K=105.0, type="call", **MARKET)
+        assert out["price"] > 0 and not out["cached"]
+        with pytest.raises(RuntimeError, match="type"):
+            client.price(S0=100.0, K=105.0, type="straddle", **MARKET)
+        stats = client.stats()
+        assert stats["requests"] == 2 and stats["errors"] == 1
+        client.shutdown()
+    thread.join(10)
+    assert not thread.is_alive()
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+
+import pytest
+
+import mcop
+from mcop import engines
+from mcop.engines import EngineSpec, EngineUnavailable, list_engines, load_engine, register_engine
+from mcop.cli import main
+
+# generous for slow CI machines; an eager matplotlib / scipy import alone costs more
+IMPORT_BUDGET_S = 0.5
+
+
+def _run(code: str) -> str:
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return out.stdout.strip()
+
+
+def test_import_is_fast_and_skips_matplotlib():
+    code = (
+        "import sys, time\n"
+        "t0 = time.perf_counter()\n"
+        "import mcop\n"
+        "dt = time.perf_counter() - t0\n"
+        "print(dt, 'matplotlib' in sys.modules, 'scipy' in sys.modules)\n"
+    )
+    dt, mpl, scipy = _run(code).split()
+    assert float(dt) < IMPORT_BUDGET_S
+    assert (mpl, scipy) == ("False", "False")
+
+
+def test_price_help_is_fast_and_skips_matplotlib():
+    code = (
+        "import sys, time\n"
+        "t0 = time.perf_counter()\n"
+        "from mcop.cli import main\n"
+        "try:\n"
+        "    main(['price', '--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "dt = time.perf_counter() - t0\n"
+        "print(dt, 'matplotlib' in sys.modules, 'mcop.american_lsm' in sys.modules,\n"
+        "      'mcop.bench' in sys.modules)\n"
+    )
+    dt, mpl, lsm, bench = _run(code).splitlines()[-1].split()
+    assert float(dt) < IMPORT_BUDGET_S
+    assert (mpl, lsm, bench) == ("False", "False", "False")
+
+
+def test_lazy_exports_resolve():
+    assert set(mcop.__all__) <= set(dir(mcop))
+    from mcop.american_lsm import american_option_lsm
+    assert mcop.american_option_lsm is american_option_lsm
+    with pytest.raises(AttributeError):
+        mcop.not_a_function
+
+
+def test_registry_reports_engines_and_failures(capsys, monkeypatch):
+    # the test engine must not outlive this test
+    for name in ("_ENGINES", "_loaded", "_errors"):
+        monkeypatch.setattr(engines, name, dict(getattr(engines, name)))
+
+    rows = {row["name"]: row for row in list_engines()}
+    assert {"python", "cpp", "cpp-fused"} <= set(rows)
+    assert rows["python"]["available"] and "cashflows" in rows["python"]["capabilities"]
+
+    register_engine(EngineSpec("broken-test", "mcop.no_such_module", "price", "test",
+                               frozenset({"paths"})), replace=True)
+    with pytest.raises(EngineUnavailable, match="No module named"):
+        load_engine("broken-test")
+    with pytest.raises(EngineUnavailable, match="unknown engine"):
+        load_engine("no-such-engine")
+
+    main(["engines"])
+    out = capsys.readouterr().out
+    assert "broken-test" in out and "unavailable" in out
+    with pytest.raises(SystemExit):
+        main(["price", "--engine", "broken-test"])
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from mcop.simulate_paths import simulate_gbm_paths, iter_gbm_path_blocks
+from mcop.payoffs import european_call
+from mcop.pricing import mc_price, mc_price_stream
+
+ARGS = dict(S0=100.0, r=0.05, sigma=0.2, T=1.0, n_steps=20)
+
+
+def test_blocks_match_full_simulation_without_antithetic():
+    full = simulate_gbm_paths(n_paths=1_001, seed=5, **ARGS)
+    blocks = list(iter_gbm_path_blocks(n_paths=1_001, block_size=128, seed=5, **ARGS))
+
+    assert max(b.shape[0] for b in blocks) == 128
+    assert np.array_equal(np.vstack(blocks), full)
+
+
+def test_antithetic_blocks_are_pairs_and_independent_of_block_size():
+    a = np.vstack(list(iter_gbm_path_blocks(n_paths=999, block_size=64, seed=1, antithetic=True, **ARGS)))
+    b = np.vstack(list(iter_gbm_path_blocks(n_paths=999, block_size=500, seed=1, antithetic=True, **ARGS)))
+
+    assert np.array_equal(a, b)
+    # each even/odd pair is mirrored in log space
+    log_a = np.log(a[:998, 1:] / ARGS["S0"])
+    drift = 2 * (ARGS["r"] - 0.5 * ARGS["sigma"] ** 2) * np.arange(1, 21) * (ARGS["T"] / 20)
+    assert np.allclose(log_a[0::2] + log_a[1::2], drift)
+
+    with pytest.raises(ValueError):
+        next(iter_gbm_path_blocks(n_paths=10, block_size=3, antithetic=True, **ARGS))
+
+
+def test_stream_price_is_bit_reproducible_and_matches_mc_price():
+    K, r, T = 100.0, ARGS["r"], ARGS["T"]
+
+    def run(block_size):
+        blocks = iter_gbm_path_blocks(n_paths=50_000, block_size=block_size, seed=3, antithetic=True, **ARGS)
+        return mc_price_stream((european_call(p, K) for p in blocks), r, T)
+
+    small, large = run(1_000), run(16_384)
+    assert small == large
+
+    paths = np.vstack(list(iter_gbm_path_blocks(n_paths=50_000, block_size=50_000, seed=3, antithetic=True, **ARGS)))
+    ref = mc_price(european_call(paths, K), r, T)
+    assert np.allclose(small, ref, rtol=1e-10, atol=1e-12)